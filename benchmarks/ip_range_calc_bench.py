@@ -0,0 +1,59 @@
+"""
+Benchmark for ip_range_calc.calculate_network_info across prefix lengths.
+
+Run from the repository root:
+
+    python -m benchmarks.ip_range_calc_bench
+"""
+
+import argparse
+import timeit
+
+from ip_range_calc.ip_range_calc import calculate_network_info
+
+
+def bench_prefix_lengths(prefixes, repeat=5, number=2000):
+    """
+    Times calculate_network_info for each prefix length.
+
+    Args:
+        prefixes (iterable): Prefix lengths to benchmark.
+        repeat (int): Number of timing rounds; the best one is reported.
+        number (int): Calls per timing round.
+
+    Returns:
+        list: (prefix length, microseconds per call) tuples.
+    """
+    results = []
+    for prefix in prefixes:
+        network_input = f"10.0.0.0/{prefix}"
+        timings = timeit.repeat(
+            lambda: calculate_network_info(network_input),
+            repeat=repeat,
+            number=number,
+        )
+        results.append((prefix, min(timings) / number * 1e6))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark calculate_network_info from /32 to /0."
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Timing rounds.")
+    parser.add_argument("--number", type=int, default=2000, help="Calls per round.")
+    args = parser.parse_args()
+
+    results = bench_prefix_lengths(range(32, -1, -1), args.repeat, args.number)
+
+    print(f"{'Prefix':>6}  {'us/call':>10}")
+    for prefix, micros in results:
+        print(f"{'/' + str(prefix):>6}  {micros:>10.2f}")
+
+    fastest = min(micros for _, micros in results)
+    slowest = max(micros for _, micros in results)
+    print(f"\nSlowest / fastest ratio: {slowest / fastest:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
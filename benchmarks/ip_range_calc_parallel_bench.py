@@ -0,0 +1,90 @@
+"""
+Throughput benchmark for ip_range_calc.calculate_network_records_parallel.
+
+Reports prefixes per second for an increasing number of worker processes.
+Run from the repository root:
+
+    python -m benchmarks.ip_range_calc_parallel_bench
+"""
+
+import argparse
+import os
+import random
+import time
+
+from ip_range_calc.ip_range_calc import calculate_network_records_parallel
+
+
+def random_prefixes(count, seed=0):
+    """
+    Generates reproducible random IPv4 prefixes in CIDR notation.
+
+    Args:
+        count (int): Number of prefixes to generate.
+        seed (int): Seed for the random number generator.
+
+    Returns:
+        list: Prefixes such as '203.0.113.0/24'.
+    """
+    rng = random.Random(seed)
+    return [
+        f"{rng.getrandbits(8)}.{rng.getrandbits(8)}.{rng.getrandbits(8)}.0"
+        f"/{rng.randint(8, 32)}"
+        for _ in range(count)
+    ]
+
+
+def bench_workers(prefixes, worker_counts, chunk_size):
+    """
+    Measures throughput for each worker count.
+
+    Args:
+        prefixes (list): Prefixes to process.
+        worker_counts (iterable): Worker counts to benchmark.
+        chunk_size (int): Number of prefixes per worker task.
+
+    Returns:
+        list: (workers, seconds, prefixes per second) tuples.
+    """
+    results = []
+    for workers in worker_counts:
+        start = time.perf_counter()
+        for _ in calculate_network_records_parallel(prefixes, workers, chunk_size):
+            pass
+        elapsed = time.perf_counter() - start
+        results.append((workers, elapsed, len(prefixes) / elapsed))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark parallel batch throughput against worker count."
+    )
+    parser.add_argument("--count", type=int, default=200_000, help="Prefixes.")
+    parser.add_argument("--chunk-size", type=int, default=2000, help="Chunk size.")
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Largest worker count to try (default: CPU count).",
+    )
+    args = parser.parse_args()
+
+    worker_counts = []
+    workers = 1
+    while workers < args.max_workers:
+        worker_counts.append(workers)
+        workers *= 2
+    worker_counts.append(args.max_workers)
+
+    prefixes = random_prefixes(args.count)
+    results = bench_workers(prefixes, worker_counts, args.chunk_size)
+
+    baseline = results[0][2]
+    print(f"{'Workers':>7}  {'Seconds':>8}  {'Prefixes/s':>11}  {'Speed-up':>8}")
+    for workers, elapsed, rate in results:
+        print(f"{workers:>7}  {elapsed:>8.2f}  {rate:>11.0f}  {rate / baseline:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+Benchmark for the lazy NetworkInfo record against the eager dictionary.
+
+Measures memory per record and per-call latency when only a couple of fields
+are read, with and without repeated prefixes hitting the cache. The eager
+baseline is a copy of the dictionary builder that calculate_network_info used
+before NetworkInfo, since calculate_network_info itself now goes through the
+lazy, cached record. Run from the repository root:
+
+    python -m benchmarks.network_info_record_bench
+"""
+
+import argparse
+import ipaddress
+import random
+import time
+import tracemalloc
+
+from ip_range_calc.ip_range_calc import (
+    NetworkInfo,
+    _cached_network_info,
+    calculate_network_info,
+    get_network_info,
+    usable_host_range,
+)
+
+
+def random_prefixes(count, seed=0):
+    rng = random.Random(seed)
+    return [
+        str(ipaddress.IPv4Network((rng.getrandbits(32), rng.randint(8, 30)), False))
+        for _ in range(count)
+    ]
+
+
+def eager_network_info(network_input):
+    """
+    The IPv4 dictionary builder of calculate_network_info before NetworkInfo,
+    which computes every field up front.
+    """
+    network = ipaddress.ip_network(network_input.strip(), strict=False)
+    network_address = network.network_address
+    broadcast_address = network.broadcast_address
+    first_usable_ip, last_usable_ip, total_ips = usable_host_range(network)
+    subnet_mask = network.netmask
+    wildcard_mask = network.hostmask
+    integer_id = int(network_address)
+    return {
+        "Network Address": network_address,
+        "Broadcast Address": broadcast_address,
+        "Gateway": first_usable_ip,
+        "Usable IP Range": f"{first_usable_ip} - {last_usable_ip}",
+        "Total IPs": total_ips,
+        "Subnet Mask": subnet_mask,
+        "Wildcard Mask": wildcard_mask,
+        "Binary Subnet Mask": f"{int(subnet_mask):032b}",
+        "Binary Wildcard Mask": f"{int(wildcard_mask):032b}",
+        "IP Type": "Private" if network.is_private else "Public",
+        "IP Class": network_address.exploded.split(".")[0],
+        "Binary ID": f"{integer_id:032b}",
+        "Integer ID": integer_id,
+        "Hex ID": hex(integer_id),
+        "in-addr.arpa": ".".join(reversed(network_address.exploded.split(".")))
+        + ".in-addr.arpa",
+    }
+
+
+def memory_per_item(build, prefixes):
+    """
+    Returns the average number of bytes retained per item built by build().
+    """
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    items = [build(prefix) for prefix in prefixes]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    retained = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del items
+    return retained / len(prefixes)
+
+
+def latency(read, prefixes):
+    """
+    Returns the average microseconds per call of read() over the prefixes.
+    """
+    start = time.perf_counter()
+    for prefix in prefixes:
+        read(prefix)
+    return (time.perf_counter() - start) / len(prefixes) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark lazy NetworkInfo records against eager dicts."
+    )
+    parser.add_argument("--count", type=int, default=50_000, help="Prefixes.")
+    args = parser.parse_args()
+
+    prefixes = random_prefixes(args.count)
+    networks = [ipaddress.ip_network(prefix) for prefix in prefixes]
+    repeated = random_prefixes(args.count // 100) * 100
+
+    memory = [
+        ("dict (eager, old builder)", eager_network_info),
+        ("calculate_network_info (dict)", calculate_network_info),
+        ("NetworkInfo, all fields", lambda p: _full(_record(p))),
+        ("NetworkInfo, two fields", lambda p: _partial(_record(p))),
+    ]
+    print("Bytes retained per record")
+    for label, build in memory:
+        _cached_network_info.cache_clear()
+        print(f"  {label:<32}: {memory_per_item(build, prefixes):8.0f}")
+
+    print("\nMicroseconds per call, reading 'Network Address' and 'Total IPs'")
+    timings = [
+        (
+            "dict (eager, old builder)",
+            lambda p: _two_from_dict(eager_network_info(p)),
+            prefixes,
+        ),
+        (
+            "calculate_network_info (dict)",
+            lambda p: _two_from_dict(calculate_network_info(p)),
+            prefixes,
+        ),
+        ("NetworkInfo (lazy, no cache)", lambda n: _two(NetworkInfo(n)), networks),
+        ("get_network_info (unique)", lambda p: _two(get_network_info(p)), prefixes),
+        ("get_network_info (1% unique)", lambda p: _two(get_network_info(p)), repeated),
+    ]
+    for label, read, inputs in timings:
+        _cached_network_info.cache_clear()
+        print(f"  {label:<32}: {latency(read, inputs):8.2f}")
+
+
+def _record(prefix):
+    return NetworkInfo(ipaddress.ip_network(prefix))
+
+
+def _two(record):
+    return record.network_address, record.total_ips
+
+
+def _two_from_dict(info):
+    return info["Network Address"], info["Total IPs"]
+
+
+def _partial(record):
+    _two(record)
+    return record
+
+
+def _full(record):
+    record.to_dict()
+    return record
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+"""
+Benchmarks for the projectile_motion hot paths.
+
+Times single calculate_projectile_motion calls, scalar and vectorized sweeps,
+trajectory sampling and the per-frame cost of the animation loop. Frames are
+measured headless: turtle is mocked and Scene.play runs against a virtual
+clock, so only the work done in each frame is timed. Run from the repository
+root:
+
+    python -m benchmarks.projectile_motion_bench --output before.json
+    python -m benchmarks.projectile_motion_bench --baseline before.json
+
+With --baseline the run exits with status 1 if any metric is slower than the
+baseline by more than --tolerance.
+"""
+
+import argparse
+import cProfile
+import json
+import platform
+import pstats
+import random
+import sys
+import time
+import timeit
+from statistics import median
+from types import SimpleNamespace
+from unittest import mock
+
+import numpy as np
+
+from projectile_motion import projectile_motion
+from projectile_motion.projectile_motion import (
+    Scene,
+    calculate_projectile_motion,
+    sample_trajectory,
+)
+from projectile_motion.trajectory_batch import solve_trajectories
+
+
+def random_launches(count, seed=0):
+    """
+    Generates reproducible random launch parameters.
+
+    Parameters:
+    count (int): Number of launches.
+    seed (int): Seed for the random number generator.
+
+    Returns:
+    list: (velocity, angle, height, gravity) tuples.
+    """
+    rng = random.Random(seed)
+    return [
+        (rng.uniform(1, 100), rng.uniform(0, 90), rng.uniform(0, 50), 9.81)
+        for _ in range(count)
+    ]
+
+
+def bench_single_call(repeat=5, number=20000):
+    """Returns microseconds per calculate_projectile_motion call."""
+    timings = timeit.repeat(
+        lambda: calculate_projectile_motion(20, 45, 10),
+        repeat=repeat,
+        number=number,
+    )
+    return min(timings) / number * 1e6
+
+
+def bench_scalar_sweep(launches, repeat=3):
+    """Returns microseconds per launch for a loop of scalar calls."""
+    timings = timeit.repeat(
+        lambda: [calculate_projectile_motion(*launch) for launch in launches],
+        repeat=repeat,
+        number=1,
+    )
+    return min(timings) / len(launches) * 1e6
+
+
+def bench_vectorized_sweep(launches, repeat=5):
+    """Returns microseconds per launch for one trajectory_batch call."""
+    columns = [np.array(column) for column in zip(*launches)]
+    timings = timeit.repeat(
+        lambda: solve_trajectories(*columns), repeat=repeat, number=1
+    )
+    return min(timings) / len(launches) * 1e6
+
+
+def bench_sampling(launches, repeat=3):
+    """Returns microseconds per sample_trajectory call."""
+    timings = timeit.repeat(
+        lambda: [sample_trajectory(*launch) for launch in launches],
+        repeat=repeat,
+        number=1,
+    )
+    return min(timings) / len(launches) * 1e6
+
+
+def bench_frames(launches, speed=1.0):
+    """
+    Plays launches in a headless Scene and times each frame.
+
+    time.sleep is replaced by a virtual clock that moves perf_counter forward
+    instead of waiting, so the animation advances exactly as on screen while
+    the wall time only covers the work of the loop body. A frame is the time
+    between consecutive screen updates.
+
+    Parameters:
+    launches (list): (velocity, angle, height, gravity) tuples.
+    speed (float): Simulated seconds per real second, as in Scene.play.
+
+    Returns:
+    dict: "frames", "median" and "p95" frame time in microseconds.
+    """
+    offset = 0.0
+
+    def perf_counter():
+        return time.perf_counter() + offset
+
+    def sleep(seconds):
+        nonlocal offset
+        offset += seconds
+
+    stamps = []
+    clock = SimpleNamespace(perf_counter=perf_counter, sleep=sleep)
+    with mock.patch.object(projectile_motion, "turtle"), mock.patch.object(
+        projectile_motion, "time", clock
+    ):
+        screen = mock.MagicMock()
+        screen.update.side_effect = lambda: stamps.append(time.perf_counter())
+        scene = Scene(screen)
+        for launch in launches:
+            scene.add(*launch)
+        stamps.append(time.perf_counter())
+        scene.play(speed)
+
+    # The last update shows the summary after the loop has finished.
+    frames = sorted((b - a) * 1e6 for a, b in zip(stamps[:-2], stamps[1:-1]))
+    return {
+        "frames": len(frames),
+        "median": median(frames),
+        "p95": frames[int(0.95 * (len(frames) - 1))],
+    }
+
+
+def run_benchmarks(count=10000, vector_count=1_000_000):
+    """
+    Runs every benchmark.
+
+    Parameters:
+    count (int): Launches in the scalar sweeps.
+    vector_count (int): Launches in the vectorized sweep.
+
+    Returns:
+    dict: Metric name to microseconds; lower is better for all of them.
+    """
+    launches = random_launches(count)
+    results = {
+        "single_call_us": bench_single_call(),
+        "scalar_sweep_us_per_launch": bench_scalar_sweep(launches),
+        "vectorized_sweep_us_per_launch": bench_vectorized_sweep(
+            random_launches(vector_count)
+        ),
+        "sample_trajectory_us": bench_sampling(launches[:1000]),
+    }
+    for label, scene_launches in (
+        ("frame_1_projectile", [(50, 60, 10, 9.81)]),
+        ("frame_8_projectiles", [(50, angle, 10, 9.81) for angle in range(20, 81, 8)]),
+    ):
+        frames = bench_frames(scene_launches)
+        results[f"{label}_median_us"] = frames["median"]
+        results[f"{label}_p95_us"] = frames["p95"]
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """
+    Compares results against a baseline.
+
+    Parameters:
+    results (dict): Metric name to value.
+    baseline (dict): Metric name to value from an earlier run.
+    tolerance (float): Allowed relative slow-down, e.g. 0.2 for 20%.
+
+    Returns:
+    list: (metric, baseline, current, ratio, regressed) tuples for the
+    metrics present in both.
+    """
+    rows = []
+    for name, value in results.items():
+        if name in baseline:
+            ratio = value / baseline[name]
+            rows.append((name, baseline[name], value, ratio, ratio > 1 + tolerance))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmark projectile_motion calculations and animation frames."
+    )
+    parser.add_argument("--count", type=int, default=10000, help="Scalar launches.")
+    parser.add_argument(
+        "--vector-count", type=int, default=1_000_000, help="Vectorized launches."
+    )
+    parser.add_argument("--output", help="Write the results to this JSON file.")
+    parser.add_argument("--baseline", help="JSON results of an earlier run.")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Allowed slow-down against the baseline (default: 0.2 for 20%%).",
+    )
+    parser.add_argument(
+        "--profile", action="store_true", help="Print the top cProfile entries."
+    )
+    args = parser.parse_args(argv)
+
+    profiler = cProfile.Profile() if args.profile else None
+    if profiler:
+        profiler.enable()
+    results = run_benchmarks(args.count, args.vector_count)
+    if profiler:
+        profiler.disable()
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(20)
+
+    print(f"{'Metric':<36}  {'us':>10}")
+    for name, value in results.items():
+        print(f"{name:<36}  {value:>10.3f}")
+
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(
+                {
+                    "python": platform.python_version(),
+                    "machine": platform.machine(),
+                    "numpy": np.__version__,
+                    "results": results,
+                },
+                output_file,
+                indent=2,
+            )
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)["results"]
+        rows = compare(results, baseline, args.tolerance)
+        print(f"\n{'Metric':<36}  {'Baseline':>10}  {'Current':>10}  {'Ratio':>6}")
+        for name, before, after, ratio, regressed in rows:
+            flag = "  REGRESSION" if regressed else ""
+            print(f"{name:<36}  {before:>10.3f}  {after:>10.3f}  {ratio:>5.2f}x{flag}")
+        regressions = [row[0] for row in rows if row[4]]
+        if regressions:
+            print(
+                f"\n{len(regressions)} metric(s) slower than the baseline by more "
+                f"than {args.tolerance:.0%}: {', '.join(regressions)}",
+                file=sys.stderr,
+            )
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+"""
+Start-up benchmark for unit_converter.
+
+Measures the wall time of whole converter processes, as scripts calling it in
+a loop see it, next to a bare interpreter, and the import time of the module
+from python -X importtime. Also lists which of the interactive and
+pretty-printing packages a plain import pulls in; there should be none. Run
+from the repository root:
+
+    python -m benchmarks.unit_converter_startup_bench
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from statistics import median
+
+SCRIPT = os.path.join("unit_converter", "unit_converter.py")
+CONVERSION = ["--category", "Length", "--value", "1", "--from-unit", "km"]
+CONVERSION += ["--to-unit", "m"]
+HEAVY_MODULES = ["questionary", "prompt_toolkit", "rich", "tabulate", "numpy"]
+
+COMMANDS = {
+    "python (baseline)": [sys.executable, "-c", "pass"],
+    "plain conversion": [sys.executable, SCRIPT, *CONVERSION, "--plain"],
+    "table conversion": [sys.executable, SCRIPT, *CONVERSION],
+}
+
+
+def process_time(command, repeat):
+    """
+    Runs a command repeatedly.
+
+    Parameters:
+    command (list): Command line to run.
+    repeat (int): Number of runs.
+
+    Returns:
+    float: Median wall time in milliseconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+        timings.append((time.perf_counter() - start) * 1000)
+    return median(timings)
+
+
+def import_time(module="unit_converter.unit_converter"):
+    """
+    Returns the cumulative import time of module in milliseconds.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    for line in result.stderr.splitlines():
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \|\s*(\S+)$", line)
+        if match and match.group(2) == module:
+            return int(match.group(1)) / 1000
+    raise RuntimeError(f"{module} not found in -X importtime output")
+
+
+def imported_heavy_modules(module="unit_converter.unit_converter"):
+    """
+    Returns the HEAVY_MODULES that importing module loads.
+    """
+    code = (
+        f"import sys, {module}; "
+        f"print(' '.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    )
+    return result.stdout.split()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark unit_converter start-up and import time."
+    )
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per command.")
+    parser.add_argument("--output", help="Write the results to this JSON file.")
+    args = parser.parse_args()
+
+    results = {
+        label: process_time(command, args.repeat) for label, command in COMMANDS.items()
+    }
+    results["import unit_converter"] = import_time()
+
+    print(f"{'Measurement':<24}  {'ms':>8}")
+    for label, millis in results.items():
+        print(f"{label:<24}  {millis:>8.1f}")
+    heavy = imported_heavy_modules()
+    print(f"\nHeavy modules loaded on import: {', '.join(heavy) or 'none'}")
+
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(
+                {"milliseconds": results, "heavy_modules": heavy}, output_file, indent=2
+            )
+
+
+if __name__ == "__main__":
+    main()
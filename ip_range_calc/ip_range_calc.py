@@ -1,7 +1,19 @@
 import ipaddress
 import argparse
+import asyncio
+import csv
+import functools
+import json
 import logging
 import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from datetime import datetime
+from http import HTTPStatus
+from logging.handlers import RotatingFileHandler
+from urllib.parse import parse_qs, urlsplit
 
 LOGO = r"""
   _____ _____    _____                           _____      _            _       _             
@@ -14,115 +26,916 @@ LOGO = r"""
                                    |___/                                                       
 """
 
-LOG_FILE = "network_info_log.txt"
+LOG_FILE = "network_info_log.jsonl"
+LOG_MAX_BYTES = 10 * 1024 * 1024
+LOG_BACKUP_COUNT = 5
+LOGGER_NAME = "ip_range_calc"
+SERVER_MAX_BODY_BYTES = 16 * 1024 * 1024
+SERVER_MAX_HEADERS = 100
 
+DISPLAY_LABELS = {
+    "Network Address": "Network Address",
+    "Broadcast Address": "Broadcast Address",
+    "Last Address": "Last Address",
+    "Gateway": "Gateway",
+    "Usable IP Range": "Usable IP Range",
+    "Total IPs": "Total IPs",
+    "Total Addresses": "Total Addresses",
+    "Prefix Length": "Prefix Length",
+    "Subnet Mask": "Subnet Mask",
+    "Wildcard Mask": "Wildcard Mask",
+    "Binary Subnet Mask": "Subnet Mask Bin",
+    "Binary Wildcard Mask": "Wildcard Bin",
+    "Compressed": "Compressed",
+    "Exploded": "Exploded",
+    "IP Type": "IP Type",
+    "IP Class": "IP Class",
+    "Binary ID": "Binary ID",
+    "Integer ID": "Integer ID",
+    "Hex ID": "Hex ID",
+    "in-addr.arpa": "in-addr.arpa",
+    "ip6.arpa": "ip6.arpa",
+}
 
-def setup_logger():
+BATCH_FIELDS = ["Network Info"] + list(DISPLAY_LABELS) + ["Error"]
+
+# Special-purpose ranges (IANA registries) reported as "Private". A network is
+# private when it lies entirely inside one of them and overlaps none of the
+# exceptions. This table is used instead of ipaddress's is_private, whose
+# rules changed between Python versions, so every version and the vectorized
+# path agree.
+PRIVATE_NETWORKS = {
+    4: [
+        "0.0.0.0/8",
+        "10.0.0.0/8",
+        "127.0.0.0/8",
+        "169.254.0.0/16",
+        "172.16.0.0/12",
+        "192.0.0.0/24",
+        "192.0.2.0/24",
+        "192.168.0.0/16",
+        "198.18.0.0/15",
+        "198.51.100.0/24",
+        "203.0.113.0/24",
+        "240.0.0.0/4",
+        "255.255.255.255/32",
+    ],
+    6: [
+        "::/128",
+        "::1/128",
+        "::ffff:0:0/96",
+        "64:ff9b:1::/48",
+        "100::/64",
+        "2001::/23",
+        "2001:db8::/32",
+        "fc00::/7",
+        "fe80::/10",
+    ],
+}
+PRIVATE_NETWORK_EXCEPTIONS = {
+    4: ["192.0.0.9/32", "192.0.0.10/32"],
+    6: [
+        "2001:1::1/128",
+        "2001:1::2/128",
+        "2001:3::/32",
+        "2001:4:112::/48",
+        "2001:20::/28",
+        "2001:30::/28",
+    ],
+}
+
+
+def _address_ranges(networks):
     """
-    Sets up the logger to log to the specified log file.
+    Converts CIDR strings per IP version to (first, last) integer pairs.
     """
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
+    ranges = {}
+    for version, cidrs in networks.items():
+        ranges[version] = []
+        for cidr in cidrs:
+            network = ipaddress.ip_network(cidr)
+            ranges[version].append(
+                (int(network.network_address), int(network.broadcast_address))
+            )
+    return ranges
+
+
+PRIVATE_RANGES = _address_ranges(PRIVATE_NETWORKS)
+PRIVATE_EXCEPTION_RANGES = _address_ranges(PRIVATE_NETWORK_EXCEPTIONS)
+
+
+def is_private_network(network):
+    """
+    Tells whether a network is private according to PRIVATE_NETWORKS.
+
+    Args:
+        network (IPv4Network or IPv6Network): The network to check.
+
+    Returns:
+        bool: True if the network lies inside one private range and overlaps
+        none of the exceptions.
+    """
+    first = int(network.network_address)
+    last = int(network.broadcast_address)
+    if not any(
+        start <= first and last <= end for start, end in PRIVATE_RANGES[network.version]
+    ):
+        return False
+    return not any(
+        first <= end and start <= last
+        for start, end in PRIVATE_EXCEPTION_RANGES[network.version]
     )
 
 
+class _LineHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that starts every entry on a new line. If an earlier
+    write was cut off before its newline, the fragment is terminated first so
+    the new entry is not glued to it.
+
+    The file is only inspected when it is opened; after that, the handler
+    remembers whether its own last write may have been cut off.
+    """
+
+    _line_open = False
+
+    def _open(self):
+        stream = super()._open()
+        try:
+            with open(self.baseFilename, "rb") as file:
+                if file.seek(0, os.SEEK_END):
+                    file.seek(-1, os.SEEK_END)
+                    self._line_open = file.read(1) != b"\n"
+                else:
+                    self._line_open = False
+        except OSError:
+            stream.close()
+            raise
+        return stream
+
+    def emit(self, record):
+        if self.stream is None:
+            try:
+                self.stream = self._open()
+            except OSError:
+                self.handleError(record)
+                return
+        if self._line_open:
+            try:
+                self.stream.write("\n")
+            except OSError:
+                self.handleError(record)
+                return
+            self._line_open = False
+        super().emit(record)
+
+    def handleError(self, record):
+        self._line_open = True
+        super().handleError(record)
+
+
+def setup_logger(
+    log_file=LOG_FILE, max_bytes=LOG_MAX_BYTES, backup_count=LOG_BACKUP_COUNT
+):
+    """
+    Sets up the logger to append to the specified log file, rotating it once it
+    grows past max_bytes. Calling it again replaces the previous configuration.
+
+    Args:
+        log_file (str): Path of the active log file.
+        max_bytes (int): Size at which the log file is rotated.
+        backup_count (int): Number of rotated files to keep.
+
+    Returns:
+        logging.Logger: The configured logger.
+    """
+    logger = logging.getLogger(LOGGER_NAME)
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+
+    handler = _LineHandler(
+        log_file,
+        maxBytes=max_bytes,
+        backupCount=backup_count,
+        encoding="utf-8",
+        delay=True,
+    )
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    return logger
+
+
 def log_network_info(network, network_info):
     """
-    Logs the network information to the log file, ensuring logs are in reverse chronological order.
+    Appends the network information to the log file as a single JSON line.
+
+    Entries are only ever appended. An interrupted write leaves a truncated
+    line behind, which read_log_entries skips; the next entry is started on a
+    new line, so it is not lost with the fragment.
 
     Args:
         network (str): The network input in CIDR notation.
         network_info (dict): A dictionary containing network-related information.
     """
-    log_message = (
-        f"Network Info: {network}\n"
-        f"Network Address: {network_info['Network Address']}\n"
-        f"Broadcast Address: {network_info['Broadcast Address']}\n"
-        f"Gateway: {network_info['Gateway']}\n"
-        f"Usable IP Range: {network_info['Usable IP Range']}\n"
-        f"Total IPs: {network_info['Total IPs']}\n"
-        f"Subnet Mask: {network_info['Subnet Mask']}\n"
-        f"Wildcard Mask: {network_info['Wildcard Mask']}\n"
-        f"Subnet Mask Bin: {network_info['Binary Subnet Mask']}\n"
-        f"Wildcard Bin: {network_info['Binary Wildcard Mask']}\n"
-        f"IP Type: {network_info['IP Type']}\n"
-        f"IP Class: {network_info['IP Class']}\n"
-        f"Binary ID: {network_info['Binary ID']}\n"
-        f"Integer ID: {network_info['Integer ID']}\n"
-        f"Hex ID: {network_info['Hex ID']}\n"
-        f"in-addr.arpa: {network_info['in-addr.arpa']}\n"
-        f"{'-'*40}\n"
-    )
-
-    # Read existing log content if the file exists
-    if os.path.exists(LOG_FILE):
-        with open(LOG_FILE, "r") as file:
-            existing_logs = file.read()
-    else:
-        existing_logs = ""
+    logger = logging.getLogger(LOGGER_NAME)
+    if not logger.handlers:
+        logger = setup_logger()
+
+    entry = {
+        "Timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "Network Info": network,
+    }
+    entry.update(serialize_network_info(network_info))
+    logger.info(json.dumps(entry))
+
+
+def _read_lines_reversed(path, block_size=64 * 1024):
+    """
+    Yields the lines of a file from last to first, reading it backwards in
+    fixed-size blocks so memory use does not depend on the file size.
+    """
+    with open(path, "rb") as file:
+        file.seek(0, os.SEEK_END)
+        position = file.tell()
+        remainder = b""
+        while position > 0:
+            read_size = min(block_size, position)
+            position -= read_size
+            file.seek(position)
+            lines = (file.read(read_size) + remainder).split(b"\n")
+            remainder = lines.pop(0)
+            for line in reversed(lines):
+                if line:
+                    yield line.decode("utf-8", errors="replace")
+        if remainder:
+            yield remainder.decode("utf-8", errors="replace")
+
+
+def read_log_entries(log_file=LOG_FILE, limit=None, backup_count=LOG_BACKUP_COUNT):
+    """
+    Reads log entries newest first, continuing into rotated log files.
+
+    Args:
+        log_file (str): Path of the active log file.
+        limit (int): Maximum number of entries to return, or None for all.
+        backup_count (int): Number of rotated files to look at.
+
+    Yields:
+        dict: Log entries, newest first. Malformed lines are skipped.
+    """
+    if limit is not None and limit <= 0:
+        return
+    paths = [log_file] + [f"{log_file}.{i}" for i in range(1, backup_count + 1)]
+    count = 0
+    for path in paths:
+        if not os.path.exists(path):
+            continue
+        for line in _read_lines_reversed(path):
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            yield entry
+            count += 1
+            if limit is not None and count >= limit:
+                return
+
+
+def usable_host_range(network):
+    """
+    Computes the usable host range of a network arithmetically, without
+    enumerating ``network.hosts()``.
+
+    A /31 (/127 for IPv6) is treated as a point-to-point link (RFC 3021) where
+    both addresses are usable, and a /32 (/128) is a single host. Otherwise the
+    IPv4 network and broadcast addresses are excluded, and for IPv6 only the
+    Subnet-Router anycast address (the network address) is. This matches what
+    ``ipaddress`` yields from ``hosts()``.
+
+    Args:
+        network (ipaddress.IPv4Network or ipaddress.IPv6Network): The network
+            to inspect.
+
+    Returns:
+        tuple: (first usable address, last usable address, usable host count).
+    """
+    network_int = int(network.network_address)
+    host_bits = network.max_prefixlen - network.prefixlen
+    size = 1 << host_bits
+    address_class = type(network.network_address)
+
+    if host_bits == 0:
+        return network.network_address, network.network_address, 1
+    if host_bits == 1:
+        return network.network_address, network.broadcast_address, 2
+
+    if network.version == 6:
+        return (
+            address_class(network_int + 1),
+            address_class(network_int + size - 1),
+            size - 1,
+        )
+    return (
+        address_class(network_int + 1),
+        address_class(network_int + size - 2),
+        size - 2,
+    )
+
+
+def ip6_arpa_zone(network):
+    """
+    Builds the ip6.arpa nibble reverse zone enclosing an IPv6 network.
+
+    Prefixes that do not end on a nibble boundary get the zone of the enclosing
+    nibble-aligned prefix, e.g. a /50 maps to its /48 zone.
 
-    # Write the new log at the beginning followed by existing logs
-    with open(LOG_FILE, "w") as file:
-        file.write(log_message + existing_logs)
+    Args:
+        network (ipaddress.IPv6Network): The network.
+
+    Returns:
+        str: The reverse zone, e.g. '8.b.d.0.1.0.0.2.ip6.arpa' for 2001:db8::/32.
+    """
+    nibbles = f"{int(network.network_address):032x}"[: network.prefixlen // 4]
+    return "".join(f"{nibble}." for nibble in reversed(nibbles)) + "ip6.arpa"
+
+
+class _LazyField:
+    """
+    Computes a NetworkInfo field on first access and caches it in the slot of
+    the same name prefixed with an underscore.
+    """
+
+    def __init__(self, compute, version=None):
+        self.compute = compute
+        self.version = version
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.slot = f"_{name}"
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        try:
+            return getattr(instance, self.slot)
+        except AttributeError:
+            pass
+        if self.version is not None and instance.network.version != self.version:
+            raise AttributeError(f"{self.name} is only defined for IPv{self.version}")
+        value = self.compute(instance)
+        setattr(instance, self.slot, value)
+        return value
+
+
+IPV4_FIELDS = [
+    ("Network Address", "network_address"),
+    ("Broadcast Address", "broadcast_address"),
+    ("Gateway", "gateway"),
+    ("Usable IP Range", "usable_ip_range"),
+    ("Total IPs", "total_ips"),
+    ("Subnet Mask", "subnet_mask"),
+    ("Wildcard Mask", "wildcard_mask"),
+    ("Binary Subnet Mask", "binary_subnet_mask"),
+    ("Binary Wildcard Mask", "binary_wildcard_mask"),
+    ("IP Type", "ip_type"),
+    ("IP Class", "ip_class"),
+    ("Binary ID", "binary_id"),
+    ("Integer ID", "integer_id"),
+    ("Hex ID", "hex_id"),
+    ("in-addr.arpa", "in_addr_arpa"),
+]
+
+IPV6_FIELDS = [
+    ("Network Address", "network_address"),
+    ("Last Address", "last_address"),
+    ("Gateway", "gateway"),
+    ("Usable IP Range", "usable_ip_range"),
+    ("Total IPs", "total_ips"),
+    ("Total Addresses", "total_addresses"),
+    ("Prefix Length", "prefix_length"),
+    ("Subnet Mask", "subnet_mask"),
+    ("Wildcard Mask", "wildcard_mask"),
+    ("Binary Subnet Mask", "binary_subnet_mask"),
+    ("Binary Wildcard Mask", "binary_wildcard_mask"),
+    ("Compressed", "compressed"),
+    ("Exploded", "exploded"),
+    ("IP Type", "ip_type"),
+    ("Binary ID", "binary_id"),
+    ("Integer ID", "integer_id"),
+    ("Hex ID", "hex_id"),
+    ("ip6.arpa", "ip6_arpa"),
+]
+
+_LAZY_FIELDS = sorted(
+    {attribute for _, attribute in IPV4_FIELDS + IPV6_FIELDS} | {"host_range"}
+)
+
+
+class NetworkInfo:
+    """
+    Network information for one IPv4 or IPv6 network.
+
+    Every field is computed on first access and then cached, so consumers that
+    only read a few fields never pay for the binary strings or reverse zones.
+    Use to_dict() for the dictionary returned by calculate_network_info.
+    """
+
+    __slots__ = ["network"] + [f"_{attribute}" for attribute in _LAZY_FIELDS]
+
+    def __init__(self, network):
+        self.network = network
+
+    def __repr__(self):
+        return f"NetworkInfo({str(self.network)!r})"
+
+    host_range = _LazyField(lambda self: usable_host_range(self.network))
+    network_address = _LazyField(lambda self: self.network.network_address)
+    broadcast_address = _LazyField(
+        lambda self: self.network.broadcast_address, version=4
+    )
+    last_address = _LazyField(lambda self: self.network.broadcast_address, version=6)
+    gateway = _LazyField(lambda self: self.host_range[0])
+    usable_ip_range = _LazyField(
+        lambda self: f"{self.host_range[0]} - {self.host_range[1]}"
+    )
+    total_ips = _LazyField(lambda self: self.host_range[2])
+    total_addresses = _LazyField(lambda self: self.network.num_addresses, version=6)
+    prefix_length = _LazyField(lambda self: self.network.prefixlen, version=6)
+    subnet_mask = _LazyField(lambda self: self.network.netmask)
+    wildcard_mask = _LazyField(lambda self: self.network.hostmask)
+    binary_subnet_mask = _LazyField(
+        lambda self: f"{int(self.subnet_mask):0{self.network.max_prefixlen}b}"
+    )
+    binary_wildcard_mask = _LazyField(
+        lambda self: f"{int(self.wildcard_mask):0{self.network.max_prefixlen}b}"
+    )
+    compressed = _LazyField(lambda self: self.network_address.compressed, version=6)
+    exploded = _LazyField(lambda self: self.network_address.exploded, version=6)
+    ip_type = _LazyField(
+        lambda self: "Private" if is_private_network(self.network) else "Public"
+    )
+    ip_class = _LazyField(
+        lambda self: self.network_address.exploded.split(".")[0], version=4
+    )
+    integer_id = _LazyField(lambda self: int(self.network_address))
+    binary_id = _LazyField(
+        lambda self: f"{self.integer_id:0{self.network.max_prefixlen}b}"
+    )
+    hex_id = _LazyField(lambda self: hex(self.integer_id))
+    in_addr_arpa = _LazyField(
+        lambda self: ".".join(reversed(self.network_address.exploded.split(".")))
+        + ".in-addr.arpa",
+        version=4,
+    )
+    ip6_arpa = _LazyField(lambda self: ip6_arpa_zone(self.network), version=6)
+
+    def to_dict(self):
+        """
+        Builds the dictionary returned by calculate_network_info.
+
+        Returns:
+            dict: A dictionary containing various network-related information.
+        """
+        fields = IPV6_FIELDS if self.network.version == 6 else IPV4_FIELDS
+        return {key: getattr(self, attribute) for key, attribute in fields}
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_network_info(network):
+    return NetworkInfo(network)
+
+
+def get_network_info(network_input):
+    """
+    Returns the lazily computed network information for a network.
+
+    Records are cached by the normalized network (so '10.0.0.1/8' and
+    '10.0.0.0/8' share one), and fields already computed for a repeated prefix
+    are not computed again.
+
+    Args:
+        network_input (str): Network address in CIDR notation (e.g., '192.168.1.0/24'
+            or '2001:db8::/32').
+
+    Returns:
+        NetworkInfo: The network information record.
+    """
+    try:
+        network = ipaddress.ip_network(network_input.strip(), strict=False)
+    except ValueError as e:
+        raise ValueError(f"Invalid network address: {e}")
+    return _cached_network_info(network)
 
 
 def calculate_network_info(network_input):
     """
     Calculates various network-related information based on the given network input.
 
+    Both IPv4 and IPv6 networks are supported. IPv6 results have no broadcast
+    address or class and instead report the last address, the total address
+    count, the compressed and exploded forms and the ip6.arpa reverse zone.
+
     Args:
-        network_input (str): Network address in CIDR notation (e.g., '192.168.1.0/24').
+        network_input (str): Network address in CIDR notation (e.g., '192.168.1.0/24'
+            or '2001:db8::/32').
 
     Returns:
         dict: A dictionary containing various network-related information.
     """
+    return get_network_info(network_input).to_dict()
+
+
+def serialize_network_info(network_info):
+    """
+    Converts a network info dictionary into JSON/CSV friendly values.
+
+    Args:
+        network_info (dict): A dictionary returned by calculate_network_info.
+
+    Returns:
+        dict: The same keys with address objects converted to strings.
+    """
+    return {
+        key: value if isinstance(value, (int, str)) else str(value)
+        for key, value in network_info.items()
+    }
+
+
+def network_record(network_input):
+    """
+    Calculates the batch record for a single network.
+
+    Args:
+        network_input (str): Network address in CIDR notation.
+
+    Returns:
+        dict: The serialized network info, or an error record if the input is
+        invalid.
+    """
     try:
-        network = ipaddress.IPv4Network(network_input.strip(), strict=False)
+        network_info = calculate_network_info(network_input)
     except ValueError as e:
-        raise ValueError(f"Invalid network address: {e}")
+        return {"Network Info": network_input, "Error": str(e)}
+    record = {"Network Info": network_input}
+    record.update(serialize_network_info(network_info))
+    return record
+
+
+def iter_network_inputs(lines):
+    """
+    Strips lines and skips blank lines and lines starting with '#'.
+
+    Args:
+        lines (iterable): Lines containing one network in CIDR notation each.
+
+    Yields:
+        str: The network inputs.
+    """
+    for line in lines:
+        network_input = line.strip()
+        if network_input and not network_input.startswith("#"):
+            yield network_input
+
+
+def iter_network_records(lines):
+    """
+    Lazily calculates network information for an iterable of CIDR lines.
+
+    Blank lines and lines starting with '#' are skipped. Invalid networks do not
+    stop the iteration; they yield an error record instead.
+
+    Args:
+        lines (iterable): Lines containing one network in CIDR notation each.
+
+    Yields:
+        dict: One record per network, keyed by BATCH_FIELDS.
+    """
+    for network_input in iter_network_inputs(lines):
+        yield network_record(network_input)
 
-    network_address = network.network_address
-    broadcast_address = network.broadcast_address
-    gateway = list(network.hosts())[0]
-    first_usable_ip = list(network.hosts())[0]
-    last_usable_ip = list(network.hosts())[-1]
-    total_ips = len(list(network.hosts()))
-    subnet_mask = network.netmask
-    wildcard_mask = network.hostmask
-    binary_subnet_mask = "".join([f"{int(octet):08b}" for octet in subnet_mask.packed])
-    binary_wildcard_mask = "".join(
-        [f"{int(octet):08b}" for octet in wildcard_mask.packed]
-    )
-    ip_type = "Private" if network.is_private else "Public"
-    ip_class = network.network_address.exploded.split(".")[0]
-    binary_id = "".join(
-        [f"{int(octet):08b}" for octet in network.network_address.packed]
-    )
-    integer_id = int(binary_id, 2)
-    hex_id = hex(integer_id)
-    in_addr_arpa = (
-        ".".join(reversed(network_address.exploded.split("."))) + ".in-addr.arpa"
+
+def _calculate_chunk(chunk):
+    return [network_record(network_input) for network_input in chunk]
+
+
+def _chunked(iterable, chunk_size):
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def calculate_network_records_parallel(networks, workers=None, chunk_size=1000):
+    """
+    Calculates batch records on a process pool, preserving input order.
+
+    The networks are split into chunks of chunk_size and at most two chunks per
+    worker are in flight at any time, so arbitrarily long iterables are
+    processed with bounded memory.
+
+    Args:
+        networks (iterable): Network inputs in CIDR notation.
+        workers (int): Number of worker processes (default: CPU count).
+        chunk_size (int): Number of networks sent to a worker at once.
+
+    Yields:
+        dict: One record per network, in the same order as the input.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for network_input in networks:
+            yield network_record(network_input)
+        return
+
+    max_pending = workers * 2
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk in _chunked(networks, chunk_size):
+            pending.append(executor.submit(_calculate_chunk, chunk))
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def write_records(records, output, output_format="jsonl"):
+    """
+    Streams records to an open text file as JSON Lines or CSV.
+
+    Args:
+        records (iterable): Records produced by iter_network_records.
+        output (file): A writable text file object.
+        output_format (str): Either 'jsonl' or 'csv'.
+
+    Returns:
+        int: The number of records written.
+    """
+    count = 0
+    if output_format == "csv":
+        writer = csv.DictWriter(output, fieldnames=BATCH_FIELDS, restval="")
+        writer.writeheader()
+        for record in records:
+            writer.writerow(record)
+            count += 1
+    elif output_format == "jsonl":
+        for record in records:
+            output.write(json.dumps(record) + "\n")
+            count += 1
+    else:
+        raise ValueError(f"Unsupported output format: {output_format}")
+    return count
+
+
+def run_batch(
+    input_path, output_path=None, output_format="jsonl", workers=1, chunk_size=1000
+):
+    """
+    Processes a file (or stdin when input_path is '-') of CIDRs, one per line,
+    and writes one record per network with constant memory.
+
+    Args:
+        input_path (str): Path to the input file, or '-' for stdin.
+        output_path (str): Path to the output file, or None for stdout.
+        output_format (str): Either 'jsonl' or 'csv'.
+        workers (int): Number of worker processes; 1 runs in-process.
+        chunk_size (int): Number of networks sent to a worker at once.
+
+    Returns:
+        int: The number of records written.
+    """
+    with ExitStack() as stack:
+        input_file = (
+            sys.stdin if input_path == "-" else stack.enter_context(open(input_path))
+        )
+        output_file = (
+            sys.stdout
+            if output_path is None
+            else stack.enter_context(open(output_path, "w", newline=""))
+        )
+        if workers == 1:
+            records = iter_network_records(input_file)
+        else:
+            records = calculate_network_records_parallel(
+                iter_network_inputs(input_file), workers, chunk_size
+            )
+        return write_records(records, output_file, output_format)
+
+
+@functools.lru_cache(maxsize=65536)
+def _record_json(network_input):
+    record = network_record(network_input)
+    return "Error" in record, json.dumps(record)
+
+
+def _json_response(status, payload):
+    return status, json.dumps(payload).encode("utf-8")
+
+
+def handle_http_request(method, target, body=b""):
+    """
+    Routes one HTTP request of the lookup service.
+
+    GET /network?cidr=<network> returns one record, POST /networks takes a JSON
+    list of networks (or {"networks": [...]}) and returns a list of records in
+    the same order, and GET /health reports that the service is up. Serialized
+    records are cached, so repeated networks cost a dictionary lookup.
+
+    Args:
+        method (str): The HTTP method.
+        target (str): The request target, including the query string.
+        body (bytes): The request body.
+
+    Returns:
+        tuple: (HTTP status code, JSON response body as bytes).
+    """
+    url = urlsplit(target)
+
+    if url.path == "/health":
+        if method != "GET":
+            return _json_response(405, {"Error": "Use GET"})
+        return _json_response(200, {"Status": "OK"})
+
+    if url.path == "/network":
+        if method != "GET":
+            return _json_response(405, {"Error": "Use GET"})
+        cidrs = parse_qs(url.query).get("cidr")
+        if not cidrs:
+            return _json_response(400, {"Error": "Missing 'cidr' query parameter"})
+        is_error, record = _record_json(cidrs[0])
+        return (400 if is_error else 200), record.encode("utf-8")
+
+    if url.path == "/networks":
+        if method != "POST":
+            return _json_response(405, {"Error": "Use POST"})
+        try:
+            networks = json.loads(body or b"null")
+        except ValueError:
+            return _json_response(400, {"Error": "Body must be JSON"})
+        if isinstance(networks, dict):
+            networks = networks.get("networks")
+        if not isinstance(networks, list) or not all(
+            isinstance(network, str) for network in networks
+        ):
+            return _json_response(
+                400, {"Error": "Body must be a JSON list of networks"}
+            )
+        records = ",".join(_record_json(network)[1] for network in networks)
+        return 200, f"[{records}]".encode("utf-8")
+
+    return _json_response(404, {"Error": f"Unknown path: {url.path}"})
+
+
+async def _send_response(writer, status, body, keep_alive):
+    reason = HTTPStatus(status).phrase
+    head = (
+        f"HTTP/1.1 {status} {reason}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+        "\r\n"
     )
+    writer.write(head.encode("latin-1") + body)
+    await writer.drain()
 
-    return {
-        "Network Address": network_address,
-        "Broadcast Address": broadcast_address,
-        "Gateway": gateway,
-        "Usable IP Range": f"{first_usable_ip} - {last_usable_ip}",
-        "Total IPs": total_ips,
-        "Subnet Mask": subnet_mask,
-        "Wildcard Mask": wildcard_mask,
-        "Binary Subnet Mask": binary_subnet_mask,
-        "Binary Wildcard Mask": binary_wildcard_mask,
-        "IP Type": ip_type,
-        "IP Class": ip_class,
-        "Binary ID": binary_id,
-        "Integer ID": integer_id,
-        "Hex ID": hex_id,
-        "in-addr.arpa": in_addr_arpa,
-    }
+
+async def _handle_connection(reader, writer):
+    try:
+        while True:
+            # readline raises ValueError once a line outgrows the stream
+            # buffer limit (64 KiB by default).
+            try:
+                request_line = await reader.readline()
+            except ValueError:
+                await _send_response(
+                    writer,
+                    *_json_response(414, {"Error": "Request line too long"}),
+                    False,
+                )
+                break
+            if not request_line:
+                break
+            try:
+                method, target, version = request_line.decode("latin-1").split()
+            except ValueError:
+                await _send_response(
+                    writer, *_json_response(400, {"Error": "Bad request line"}), False
+                )
+                break
+
+            headers = {}
+            try:
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    if len(headers) >= SERVER_MAX_HEADERS:
+                        raise ValueError("Too many header fields")
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+            except ValueError:
+                await _send_response(
+                    writer,
+                    *_json_response(431, {"Error": "Request headers too large"}),
+                    False,
+                )
+                break
+
+            connection = headers.get("connection", "").lower()
+            if version == "HTTP/1.0":
+                keep_alive = connection == "keep-alive"
+            else:
+                keep_alive = connection != "close"
+
+            # Bodies must come with a Content-Length; chunked bodies are not
+            # decoded, and 100-continue is the only expectation supported.
+            if "transfer-encoding" in headers:
+                await _send_response(
+                    writer,
+                    *_json_response(411, {"Error": "Send a Content-Length body"}),
+                    False,
+                )
+                break
+            expect = headers.get("expect", "").lower()
+            if expect not in ("", "100-continue"):
+                await _send_response(
+                    writer, *_json_response(417, {"Error": "Unsupported Expect"}), False
+                )
+                break
+
+            try:
+                content_length = int(headers.get("content-length", "0"))
+            except ValueError:
+                content_length = -1
+            if not 0 <= content_length <= SERVER_MAX_BODY_BYTES:
+                status = 413 if content_length > 0 else 400
+                await _send_response(
+                    writer, *_json_response(status, {"Error": "Bad body"}), False
+                )
+                break
+            if expect and content_length:
+                writer.write(b"HTTP/1.1 100 Continue\r\n\r\n")
+                await writer.drain()
+            body = await reader.readexactly(content_length)
+
+            if body:
+                # Batches of networks are CPU-bound; solving them in a thread
+                # keeps other connections served meanwhile.
+                status, response = await asyncio.get_running_loop().run_in_executor(
+                    None, handle_http_request, method, target, body
+                )
+            else:
+                status, response = handle_http_request(method, target, body)
+            await _send_response(writer, status, response, keep_alive)
+            if not keep_alive:
+                break
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def start_server(host="127.0.0.1", port=8080):
+    """
+    Starts the HTTP/JSON lookup service on the running event loop.
+
+    Args:
+        host (str): Address to listen on.
+        port (int): Port to listen on (0 picks a free port).
+
+    Returns:
+        asyncio.Server: The listening server.
+    """
+    return await asyncio.start_server(_handle_connection, host, port)
+
+
+def serve(host="127.0.0.1", port=8080):
+    """
+    Runs the HTTP/JSON lookup service until interrupted.
+
+    Args:
+        host (str): Address to listen on.
+        port (int): Port to listen on.
+    """
+
+    async def run():
+        server = await start_server(host, port)
+        print(f"Serving on http://{host}:{port}")
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
 
 
 def main():
@@ -141,11 +954,76 @@ def main():
         "network",
         type=str,
         nargs="?",
-        help="Network address in CIDR notation (e.g., 192.168.1.0/24).",
+        help="Network address in CIDR notation (e.g., 192.168.1.0/24 or 2001:db8::/32).",
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="FILE",
+        help="Read networks from FILE, one per line ('-' for stdin).",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["jsonl", "csv"],
+        default="jsonl",
+        help="Output format for batch mode (default: jsonl).",
+    )
+    parser.add_argument(
+        "--output",
+        metavar="FILE",
+        help="Write batch results to FILE instead of stdout.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes for batch mode (0 for all CPUs).",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=1000,
+        help="Number of networks per worker task in batch mode (default: 1000).",
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Serve lookups over HTTP/JSON instead of exiting after one.",
+    )
+    parser.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="Address for --serve to listen on (default: 127.0.0.1).",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=8080,
+        help="Port for --serve to listen on (default: 8080).",
+    )
+    parser.add_argument(
+        "--history",
+        metavar="N",
+        type=int,
+        help="Show the N most recent log entries and exit.",
     )
 
     args = parser.parse_args()
 
+    if args.batch:
+        run_batch(
+            args.batch, args.output, args.format, args.workers or None, args.chunk_size
+        )
+        return
+
+    if args.serve:
+        serve(args.host, args.port)
+        return
+
+    if args.history is not None:
+        for entry in read_log_entries(limit=args.history):
+            print(json.dumps(entry))
+        return
+
     if args.network is None:
         while True:
             try:
@@ -169,21 +1047,8 @@ def main():
     print("\n" + LOGO)
     print(f"Network Info     : {args.network or network_input}")
     print("\n")
-    print(f"Network Address  : {network_info['Network Address']}")
-    print(f"Broadcast Address: {network_info['Broadcast Address']}")
-    print(f"Gateway          : {network_info['Gateway']}")
-    print(f"Usable IP Range  : {network_info['Usable IP Range']}")
-    print(f"Total IPs        : {network_info['Total IPs']}")
-    print(f"Subnet Mask      : {network_info['Subnet Mask']}")
-    print(f"Wildcard Mask    : {network_info['Wildcard Mask']}")
-    print(f"Subnet Mask Bin  : {network_info['Binary Subnet Mask']}")
-    print(f"Wildcard Bin     : {network_info['Binary Wildcard Mask']}")
-    print(f"IP Type          : {network_info['IP Type']}")
-    print(f"IP Class         : {network_info['IP Class']}")
-    print(f"Binary ID        : {network_info['Binary ID']}")
-    print(f"Integer ID       : {network_info['Integer ID']}")
-    print(f"Hex ID           : {network_info['Hex ID']}")
-    print(f"in-addr.arpa     : {network_info['in-addr.arpa']}")
+    for key, value in network_info.items():
+        print(f"{DISPLAY_LABELS[key]:<17}: {value}")
     print("\n")
 
 
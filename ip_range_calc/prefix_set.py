@@ -0,0 +1,287 @@
+"""
+Set algebra and subnet planning over large collections of networks.
+
+Networks are turned into sorted integer intervals, so union, intersection and
+difference run in O(n log n) for the sort plus a linear sweep, and results are
+turned back into the minimal list of CIDR blocks.
+"""
+
+import heapq
+import ipaddress
+
+NETWORK_CLASSES = {4: ipaddress.IPv4Network, 6: ipaddress.IPv6Network}
+ADDRESS_BITS = {4: 32, 6: 128}
+
+
+def _parse_network(network_input):
+    if isinstance(network_input, (ipaddress.IPv4Network, ipaddress.IPv6Network)):
+        return network_input
+    try:
+        return ipaddress.ip_network(network_input.strip(), strict=False)
+    except ValueError as e:
+        raise ValueError(f"Invalid network address: {e}")
+
+
+def _to_intervals(networks):
+    """
+    Groups networks by IP version as sorted (first, last) integer intervals.
+    """
+    intervals = {4: [], 6: []}
+    for network_input in networks:
+        network = _parse_network(network_input)
+        first = int(network.network_address)
+        intervals[network.version].append((first, first + network.num_addresses - 1))
+    for version_intervals in intervals.values():
+        version_intervals.sort()
+    return intervals
+
+
+def _merge(intervals):
+    """
+    Merges sorted intervals that overlap or touch.
+    """
+    merged = []
+    for first, last in intervals:
+        if merged and first <= merged[-1][1] + 1:
+            if last > merged[-1][1]:
+                merged[-1] = (merged[-1][0], last)
+        else:
+            merged.append((first, last))
+    return merged
+
+
+def _interval_to_blocks(first, last, bits):
+    """
+    Splits an interval into the minimal list of aligned (start, prefix length)
+    blocks.
+    """
+    while first <= last:
+        # The largest block allowed by the alignment of first...
+        size = first & -first if first else 1 << bits
+        # ...that does not run past the end of the interval.
+        while size > last - first + 1:
+            size >>= 1
+        yield first, bits - size.bit_length() + 1
+        first += size
+
+
+def _interval_to_networks(first, last, version):
+    """
+    Splits an interval into the minimal list of aligned CIDR blocks.
+    """
+    network_class = NETWORK_CLASSES[version]
+    return [
+        network_class(block)
+        for block in _interval_to_blocks(first, last, ADDRESS_BITS[version])
+    ]
+
+
+def _to_networks(intervals_by_version):
+    networks = []
+    for version in (4, 6):
+        for first, last in intervals_by_version[version]:
+            networks.extend(_interval_to_networks(first, last, version))
+    return networks
+
+
+def _intersect(a, b):
+    result = []
+    i = j = 0
+    while i < len(a) and j < len(b):
+        first = max(a[i][0], b[j][0])
+        last = min(a[i][1], b[j][1])
+        if first <= last:
+            result.append((first, last))
+        if a[i][1] < b[j][1]:
+            i += 1
+        else:
+            j += 1
+    return result
+
+
+def _subtract(a, b):
+    result = []
+    j = 0
+    for first, last in a:
+        while j < len(b) and b[j][1] < first:
+            j += 1
+        k = j
+        while k < len(b) and b[k][0] <= last:
+            if b[k][0] > first:
+                result.append((first, b[k][0] - 1))
+            first = max(first, b[k][1] + 1)
+            k += 1
+        if first <= last:
+            result.append((first, last))
+    return result
+
+
+def collapse_networks(networks):
+    """
+    Computes the minimal list of networks covering exactly the given ones.
+
+    Args:
+        networks (iterable): Networks in CIDR notation or ipaddress networks.
+            IPv4 and IPv6 may be mixed.
+
+    Returns:
+        list: Sorted ipaddress networks, IPv4 before IPv6.
+    """
+    intervals = _to_intervals(networks)
+    return _to_networks({version: _merge(intervals[version]) for version in intervals})
+
+
+def intersect_networks(networks_a, networks_b):
+    """
+    Computes the address space covered by both collections.
+
+    Args:
+        networks_a (iterable): Networks in CIDR notation or ipaddress networks.
+        networks_b (iterable): Networks in CIDR notation or ipaddress networks.
+
+    Returns:
+        list: Minimal sorted list of ipaddress networks.
+    """
+    a = _to_intervals(networks_a)
+    b = _to_intervals(networks_b)
+    return _to_networks(
+        {version: _intersect(_merge(a[version]), _merge(b[version])) for version in a}
+    )
+
+
+def subtract_networks(networks_a, networks_b):
+    """
+    Computes the address space covered by networks_a but not by networks_b.
+
+    Args:
+        networks_a (iterable): Networks in CIDR notation or ipaddress networks.
+        networks_b (iterable): Networks in CIDR notation or ipaddress networks.
+
+    Returns:
+        list: Minimal sorted list of ipaddress networks.
+    """
+    a = _to_intervals(networks_a)
+    b = _to_intervals(networks_b)
+    return _to_networks(
+        {version: _subtract(_merge(a[version]), _merge(b[version])) for version in a}
+    )
+
+
+def find_overlaps(networks):
+    """
+    Reports every pair of networks that overlap.
+
+    Two CIDR blocks either nest or are disjoint, so each conflict is reported as
+    (outer, inner). Duplicates are reported as a pair of equal networks.
+
+    Args:
+        networks (iterable): Networks in CIDR notation or ipaddress networks.
+
+    Returns:
+        list: (outer network, inner network) tuples, sorted by inner network.
+    """
+    parsed = sorted(
+        (_parse_network(network_input) for network_input in networks),
+        key=lambda network: (
+            network.version,
+            int(network.network_address),
+            network.prefixlen,
+        ),
+    )
+    conflicts = []
+    open_networks = []
+    for network in parsed:
+        first = int(network.network_address)
+        while open_networks and (
+            open_networks[-1].version != network.version
+            or int(open_networks[-1].broadcast_address) < first
+        ):
+            open_networks.pop()
+        # Everything still open starts at or before this network and ends at or
+        # after it, so it contains it.
+        for outer in open_networks:
+            conflicts.append((outer, network))
+        open_networks.append(network)
+    return conflicts
+
+
+def _block_prefix_length(host_count, version):
+    """
+    Finds the longest prefix whose usable host count is at least host_count,
+    using the same /31 and /32 (/127 and /128) rules as usable_host_range.
+    """
+    bits = ADDRESS_BITS[version]
+    if host_count <= 1:
+        return bits
+    if host_count == 2:
+        return bits - 1
+    reserved = 2 if version == 4 else 1
+    host_bits = (host_count + reserved - 1).bit_length()
+    return bits - host_bits
+
+
+def plan_subnets(parent, host_counts, used=()):
+    """
+    Carves subnets for the requested host counts out of a parent network.
+
+    Requests are placed largest first into the free space of the parent
+    (the parent minus the used networks). The free space is kept as aligned
+    blocks in one heap per prefix length, and each request takes the smallest
+    block that fits, at the lowest address among blocks of that size; the rest
+    of that block is split back into free blocks. This keeps large blocks
+    whole for as long as possible and costs O(log n) per request.
+
+    Args:
+        parent (str): The parent network in CIDR notation.
+        host_counts (iterable): Number of usable hosts needed per subnet.
+        used (iterable): Networks inside the parent that are already allocated.
+
+    Returns:
+        list: One ipaddress network per request, in the order of host_counts.
+
+    Raises:
+        ValueError: If a request does not fit into the remaining free space.
+    """
+    parent = _parse_network(parent)
+    version = parent.version
+    bits = ADDRESS_BITS[version]
+    network_class = NETWORK_CLASSES[version]
+    free = [[] for _ in range(bits + 1)]
+    for first, last in _subtract(
+        [(int(parent.network_address), int(parent.broadcast_address))],
+        _merge(_to_intervals(used)[version]),
+    ):
+        for start, prefix_length in _interval_to_blocks(first, last, bits):
+            free[prefix_length].append(start)
+    for heap in free:
+        heapq.heapify(heap)
+
+    host_counts = list(host_counts)
+    order = sorted(
+        range(len(host_counts)), key=lambda index: host_counts[index], reverse=True
+    )
+    allocations = [None] * len(host_counts)
+    for index in order:
+        if host_counts[index] < 1:
+            raise ValueError(f"Host count must be positive: {host_counts[index]}")
+        prefix_length = _block_prefix_length(host_counts[index], version)
+        if prefix_length < parent.prefixlen:
+            raise ValueError(f"{host_counts[index]} hosts do not fit into {parent}")
+        fitting = next(
+            (
+                length
+                for length in range(prefix_length, parent.prefixlen - 1, -1)
+                if free[length]
+            ),
+            None,
+        )
+        if fitting is None:
+            raise ValueError(
+                f"Not enough free space in {parent} for {host_counts[index]} hosts"
+            )
+        start = heapq.heappop(free[fitting])
+        # Halve the block down to the requested size; the upper halves stay free.
+        for length in range(fitting + 1, prefix_length + 1):
+            heapq.heappush(free[length], start + (1 << (bits - length)))
+        allocations[index] = network_class((start, prefix_length))
+    return allocations
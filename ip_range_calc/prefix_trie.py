@@ -0,0 +1,411 @@
+"""
+Longest-prefix-match index over IPv4 or IPv6 networks.
+
+The index is a binary trie stored in flat integer arrays, so a lookup walks at
+most one node per address bit and the whole structure can be written to a
+compact file and memory-mapped back without parsing.
+
+Run from the repository root:
+
+    python -m ip_range_calc.prefix_trie build prefixes.csv prefixes.lpm
+    python -m ip_range_calc.prefix_trie lookup prefixes.lpm < addresses.txt
+"""
+
+import argparse
+import ipaddress
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from contextlib import ExitStack
+
+import numpy as np
+
+MAGIC = b"LPMT"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sBBxxIII")
+HEADER_SIZE = 32
+
+
+class PrefixTrie:
+    """
+    Binary trie mapping networks of one IP version to metadata.
+
+    Node 0 is the root. children[2 * node + bit] holds the child node for the
+    next address bit (0 when absent, since the root is never a child) and
+    node_values[node] holds the index of the value stored at that node, or -1.
+    """
+
+    def __init__(self, version=4):
+        if version not in (4, 6):
+            raise ValueError("version must be 4 or 6")
+        self.version = version
+        self.bits = 32 if version == 4 else 128
+        self.children = array("i", [0, 0])
+        self.node_values = array("i", [-1])
+        self._values = []
+        self._value_offsets = None
+        self._value_blob = None
+        self._decoded = {}
+        self._view = None
+        self._mmap = None
+
+    @classmethod
+    def from_networks(cls, networks, version=4):
+        """
+        Builds a trie from CIDR strings or (CIDR, metadata) pairs.
+
+        Args:
+            networks (iterable): Networks, optionally paired with metadata.
+            version (int): IP version of the networks (4 or 6).
+
+        Returns:
+            PrefixTrie: The populated trie.
+        """
+        trie = cls(version)
+        for item in networks:
+            if isinstance(item, str):
+                trie.insert(item)
+            else:
+                trie.insert(*item)
+        return trie
+
+    def __len__(self):
+        if self._value_offsets is not None:
+            return len(self._value_offsets) - 1
+        return len(self._values)
+
+    def _parse_network(self, network_input):
+        try:
+            network = ipaddress.ip_network(network_input.strip(), strict=False)
+        except ValueError as e:
+            raise ValueError(f"Invalid network address: {e}")
+        if network.version != self.version:
+            raise ValueError(f"Expected an IPv{self.version} network: {network}")
+        return network
+
+    def _parse_address(self, address):
+        if isinstance(address, int):
+            return address
+        address = ipaddress.ip_address(address)
+        if address.version != self.version:
+            raise ValueError(f"Expected an IPv{self.version} address: {address}")
+        return int(address)
+
+    def insert(self, network_input, metadata=None):
+        """
+        Adds a network, replacing the metadata if it is already present.
+
+        Args:
+            network_input (str): Network address in CIDR notation.
+            metadata: Any JSON-serializable value to attach to the network.
+        """
+        if self._mmap is not None:
+            raise ValueError("Cannot insert into a memory-mapped trie")
+        network = self._parse_network(network_input)
+        network_int = int(network.network_address)
+        children = self.children
+        node = 0
+        for shift in range(self.bits - 1, self.bits - 1 - network.prefixlen, -1):
+            slot = 2 * node + ((network_int >> shift) & 1)
+            child = children[slot]
+            if not child:
+                child = len(self.node_values)
+                children[slot] = child
+                children.extend((0, 0))
+                self.node_values.append(-1)
+            node = child
+
+        record = (network, metadata)
+        if self.node_values[node] >= 0:
+            self._values[self.node_values[node]] = record
+        else:
+            self.node_values[node] = len(self._values)
+            self._values.append(record)
+
+    def value(self, index):
+        """
+        Returns the (network, metadata) pair stored under a value index.
+
+        Args:
+            index (int): Index as returned by longest_match_many.
+
+        Returns:
+            tuple: (ipaddress network, metadata).
+        """
+        if self._value_offsets is None:
+            return self._values[index]
+        if index not in self._decoded:
+            start = self._value_offsets[index]
+            end = self._value_offsets[index + 1]
+            network, metadata = json.loads(bytes(self._value_blob[start:end]))
+            self._decoded[index] = (ipaddress.ip_network(network), metadata)
+        return self._decoded[index]
+
+    def _walk(self, address_int):
+        children = self.children
+        node_values = self.node_values
+        node = 0
+        if node_values[0] >= 0:
+            yield node_values[0]
+        for shift in range(self.bits - 1, -1, -1):
+            node = children[2 * node + ((address_int >> shift) & 1)]
+            if not node:
+                return
+            if node_values[node] >= 0:
+                yield node_values[node]
+
+    def longest_match(self, address):
+        """
+        Finds the most specific network containing an address.
+
+        Args:
+            address (str or int): The address to look up.
+
+        Returns:
+            tuple: (ipaddress network, metadata), or None when nothing matches.
+        """
+        best = -1
+        for index in self._walk(self._parse_address(address)):
+            best = index
+        return self.value(best) if best >= 0 else None
+
+    def all_matches(self, address):
+        """
+        Finds every network containing an address.
+
+        Args:
+            address (str or int): The address to look up.
+
+        Returns:
+            list: (ipaddress network, metadata) pairs, least specific first.
+        """
+        return [self.value(index) for index in self._walk(self._parse_address(address))]
+
+    def longest_match_many(self, addresses):
+        """
+        Finds the most specific network for many addresses at once.
+
+        IPv4 lookups walk all addresses through the trie in lock-step with NumPy,
+        one bit level at a time. IPv6 addresses do not fit in a NumPy integer and
+        are looked up one by one.
+
+        Args:
+            addresses (array-like): IPv4 addresses as integers (or strings), or
+                IPv6 addresses as strings or Python integers.
+
+        Returns:
+            numpy.ndarray: int32 value indices for use with value(), -1 where
+            nothing matches.
+        """
+        if self.version == 6:
+            result = np.full(len(addresses), -1, dtype=np.int32)
+            for position, address in enumerate(addresses):
+                for index in self._walk(self._parse_address(address)):
+                    result[position] = index
+            return result
+
+        if not isinstance(addresses, np.ndarray) or addresses.dtype.kind not in "iu":
+            addresses = [self._parse_address(address) for address in addresses]
+        addresses = np.asarray(addresses, dtype=np.uint32)
+
+        children = np.frombuffer(self.children, dtype=np.int32)
+        node_values = np.frombuffer(self.node_values, dtype=np.int32)
+        nodes = np.zeros(addresses.shape, dtype=np.int64)
+        result = np.full(addresses.shape, node_values[0], dtype=np.int32)
+        active = np.ones(addresses.shape, dtype=bool)
+
+        for shift in range(self.bits - 1, -1, -1):
+            bits = (addresses >> np.uint32(shift)) & np.uint32(1)
+            nodes = np.where(active, children[2 * nodes + bits], 0)
+            active &= nodes != 0
+            if not active.any():
+                break
+            values = node_values[nodes]
+            np.copyto(result, values, where=active & (values >= 0))
+        return result
+
+    def save(self, path):
+        """
+        Writes the trie to a compact binary file that load() can memory-map.
+
+        Layout (little-endian): a 32-byte header, the children and node value
+        arrays as int32, the value offsets as uint32 and finally the values as
+        concatenated JSON-encoded [network, metadata] pairs.
+
+        Args:
+            path (str): Destination file path.
+        """
+        blob = bytearray()
+        offsets = array("I", [0])
+        for index in range(len(self)):
+            network, metadata = self.value(index)
+            blob += json.dumps([str(network), metadata]).encode("utf-8")
+            if len(blob) > 0xFFFFFFFF:
+                raise ValueError("Metadata is too large to be saved")
+            offsets.append(len(blob))
+
+        arrays = [array("i", self.children), array("i", self.node_values), offsets]
+        if sys.byteorder != "little":
+            for values in arrays:
+                values.byteswap()
+
+        with open(path, "wb") as file:
+            header = HEADER.pack(
+                MAGIC,
+                FORMAT_VERSION,
+                self.version,
+                len(self.node_values),
+                len(self),
+                len(blob),
+            )
+            file.write(header.ljust(HEADER_SIZE, b"\0"))
+            for values in arrays:
+                values.tofile(file)
+            file.write(blob)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Memory-maps a trie written by save(). Nothing is parsed up front, and
+        metadata is only decoded when a matching value is returned.
+
+        Args:
+            path (str): Path of the saved trie.
+
+        Returns:
+            PrefixTrie: A read-only trie backed by the file.
+        """
+        if sys.byteorder != "little":
+            raise ValueError("Memory-mapped tries require a little-endian machine")
+        with open(path, "rb") as file:
+            if os.fstat(file.fileno()).st_size < HEADER_SIZE:
+                raise ValueError(f"Not a prefix trie file: {path}")
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, format_version, version, node_count, value_count, blob_size = (
+            HEADER.unpack_from(mapped)
+        )
+        if magic != MAGIC or format_version != FORMAT_VERSION:
+            mapped.close()
+            raise ValueError(f"Not a prefix trie file: {path}")
+        expected_size = HEADER_SIZE + 4 * (3 * node_count + value_count + 1) + blob_size
+        if version not in (4, 6) or node_count < 1 or len(mapped) != expected_size:
+            mapped.close()
+            raise ValueError(f"Truncated or corrupt prefix trie file: {path}")
+
+        view = memoryview(mapped)
+        position = HEADER_SIZE
+        sections = []
+        for item_format, count in (
+            ("i", 2 * node_count),
+            ("i", node_count),
+            ("I", value_count + 1),
+        ):
+            size = 4 * count
+            sections.append(view[position : position + size].cast(item_format))
+            position += size
+
+        offsets = sections[2]
+        if offsets[0] != 0 or offsets[-1] != blob_size:
+            for section in sections:
+                section.release()
+            view.release()
+            mapped.close()
+            raise ValueError(f"Truncated or corrupt prefix trie file: {path}")
+
+        trie = cls(version)
+        trie.children, trie.node_values, trie._value_offsets = sections
+        trie._value_blob = view[position : position + blob_size]
+        trie._values = None
+        trie._view = view
+        trie._mmap = mapped
+        return trie
+
+    def close(self):
+        """Releases the memory map of a loaded trie."""
+        if self._mmap is not None:
+            self.children.release()
+            self.node_values.release()
+            self._value_offsets.release()
+            self._value_blob.release()
+            self._view.release()
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Longest-prefix-match index.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build = subparsers.add_parser(
+        "build", help="Build an index from a file of 'network[,metadata]' lines."
+    )
+    build.add_argument("input", help="Input file ('-' for stdin).")
+    build.add_argument("output", help="Index file to write.")
+    build.add_argument("--ipv6", action="store_true", help="Index IPv6 networks.")
+
+    lookup = subparsers.add_parser(
+        "lookup", help="Print the longest match for each address read from stdin."
+    )
+    lookup.add_argument("index", help="Index file written by 'build'.")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        with ExitStack() as stack:
+            input_file = (
+                sys.stdin
+                if args.input == "-"
+                else stack.enter_context(open(args.input, "r"))
+            )
+            trie = PrefixTrie(6 if args.ipv6 else 4)
+            for line_number, line in enumerate(input_file, 1):
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                network, _, metadata = line.partition(",")
+                try:
+                    trie.insert(network, metadata or None)
+                except ValueError as e:
+                    parser.error(f"{args.input}, line {line_number}: {e}")
+        trie.save(args.output)
+        print(f"Indexed {len(trie)} networks into {args.output}")
+        return
+
+    try:
+        trie = PrefixTrie.load(args.index)
+    except ValueError as e:
+        parser.error(str(e))
+    with trie:
+        for line in sys.stdin:
+            address = line.strip()
+            if not address:
+                continue
+            try:
+                match = trie.longest_match(address)
+            except ValueError as e:
+                print(json.dumps({"Address": address, "Error": str(e)}))
+                continue
+            network, metadata = match if match else (None, None)
+            print(
+                json.dumps(
+                    {
+                        "Address": address,
+                        "Network": str(network) if network else None,
+                        "Metadata": metadata,
+                    }
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
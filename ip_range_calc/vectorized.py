@@ -0,0 +1,209 @@
+"""
+NumPy-vectorized counterpart of ip_range_calc.calculate_network_info.
+
+Works on arrays of IPv4 network integers and prefix lengths at once, without
+building an ipaddress object per row.
+"""
+
+import ipaddress
+
+import numpy as np
+
+from ip_range_calc.ip_range_calc import PRIVATE_EXCEPTION_RANGES, PRIVATE_RANGES
+
+IPV4_BITS = 32
+
+
+class NetworkInfoColumns:
+    """
+    Columnar network information for many IPv4 networks.
+
+    Every attribute is a NumPy array with one element per network. Addresses
+    and masks are uint32, total_ips is uint64 (a /0 has 2**32 - 2 hosts).
+    """
+
+    def __init__(
+        self,
+        network_address,
+        broadcast_address,
+        prefix_length,
+        subnet_mask,
+        wildcard_mask,
+        first_usable_ip,
+        last_usable_ip,
+        total_ips,
+        is_private,
+    ):
+        self.network_address = network_address
+        self.broadcast_address = broadcast_address
+        self.prefix_length = prefix_length
+        self.subnet_mask = subnet_mask
+        self.wildcard_mask = wildcard_mask
+        self.first_usable_ip = first_usable_ip
+        self.last_usable_ip = last_usable_ip
+        self.total_ips = total_ips
+        self.is_private = is_private
+
+    def __len__(self):
+        return len(self.network_address)
+
+    @property
+    def ip_class(self):
+        """The first octet of each network address."""
+        return (self.network_address >> np.uint32(24)).astype(np.uint8)
+
+    def to_dict(self, index):
+        """
+        Converts one row to the dictionary shape of calculate_network_info.
+
+        Args:
+            index (int): Row to convert.
+
+        Returns:
+            dict: A dictionary containing various network-related information.
+        """
+        network_address = ipaddress.IPv4Address(int(self.network_address[index]))
+        subnet_mask = ipaddress.IPv4Address(int(self.subnet_mask[index]))
+        wildcard_mask = ipaddress.IPv4Address(int(self.wildcard_mask[index]))
+        first_usable_ip = ipaddress.IPv4Address(int(self.first_usable_ip[index]))
+        last_usable_ip = ipaddress.IPv4Address(int(self.last_usable_ip[index]))
+        integer_id = int(network_address)
+
+        return {
+            "Network Address": network_address,
+            "Broadcast Address": ipaddress.IPv4Address(
+                int(self.broadcast_address[index])
+            ),
+            "Gateway": first_usable_ip,
+            "Usable IP Range": f"{first_usable_ip} - {last_usable_ip}",
+            "Total IPs": int(self.total_ips[index]),
+            "Subnet Mask": subnet_mask,
+            "Wildcard Mask": wildcard_mask,
+            "Binary Subnet Mask": f"{int(subnet_mask):032b}",
+            "Binary Wildcard Mask": f"{int(wildcard_mask):032b}",
+            "IP Type": "Private" if self.is_private[index] else "Public",
+            "IP Class": str(integer_id >> 24),
+            "Binary ID": f"{integer_id:032b}",
+            "Integer ID": integer_id,
+            "Hex ID": hex(integer_id),
+            "in-addr.arpa": ".".join(reversed(str(network_address).split(".")))
+            + ".in-addr.arpa",
+        }
+
+    def to_dicts(self):
+        """
+        Lazily converts every row to the dictionary shape of
+        calculate_network_info.
+
+        Yields:
+            dict: One dictionary per network.
+        """
+        for index in range(len(self)):
+            yield self.to_dict(index)
+
+
+def _private(network_address, broadcast_address):
+    """
+    Applies the rule of is_private_network to arrays of IPv4 networks.
+    """
+    inside = np.zeros(network_address.shape, dtype=bool)
+    for start, end in PRIVATE_RANGES[4]:
+        inside |= (network_address >= np.uint32(start)) & (
+            broadcast_address <= np.uint32(end)
+        )
+    for start, end in PRIVATE_EXCEPTION_RANGES[4]:
+        inside &= ~(
+            (network_address <= np.uint32(end))
+            & (broadcast_address >= np.uint32(start))
+        )
+    return inside
+
+
+def parse_cidrs(cidrs):
+    """
+    Parses CIDR strings into network integer and prefix length arrays.
+
+    Args:
+        cidrs (iterable): Networks in CIDR notation (e.g., '192.168.1.0/24').
+
+    Returns:
+        tuple: (uint32 address array, uint8 prefix length array).
+
+    Raises:
+        ValueError: If any of the networks is invalid.
+    """
+    addresses = []
+    prefix_lengths = []
+    for cidr in cidrs:
+        try:
+            network = ipaddress.IPv4Network(cidr.strip(), strict=False)
+        except ValueError as e:
+            raise ValueError(f"Invalid network address: {e}")
+        addresses.append(int(network.network_address))
+        prefix_lengths.append(network.prefixlen)
+    return (
+        np.array(addresses, dtype=np.uint32),
+        np.array(prefix_lengths, dtype=np.uint8),
+    )
+
+
+def calculate_network_info_array(addresses, prefix_lengths):
+    """
+    Calculates network information for arrays of IPv4 networks.
+
+    Host bits in the addresses are ignored, like strict=False in ipaddress.
+
+    Args:
+        addresses (array-like): IPv4 addresses as integers.
+        prefix_lengths (array-like): Prefix lengths between 0 and 32.
+
+    Returns:
+        NetworkInfoColumns: The results as columns of NumPy arrays.
+
+    Raises:
+        ValueError: If the arrays differ in shape or contain out-of-range values.
+    """
+    addresses = np.asarray(addresses)
+    prefix_lengths = np.asarray(prefix_lengths)
+    if addresses.shape != prefix_lengths.shape:
+        raise ValueError("addresses and prefix_lengths must have the same shape")
+    if addresses.size and (addresses.min() < 0 or addresses.max() > 0xFFFFFFFF):
+        raise ValueError("addresses must be between 0 and 2**32 - 1")
+    if prefix_lengths.size and (
+        prefix_lengths.min() < 0 or prefix_lengths.max() > IPV4_BITS
+    ):
+        raise ValueError(f"prefix_lengths must be between 0 and {IPV4_BITS}")
+
+    addresses = addresses.astype(np.uint32)
+    prefix_lengths = prefix_lengths.astype(np.uint8)
+
+    # Shift in 64 bits so that a /0 (shift by 32) is well defined.
+    host_bits = (IPV4_BITS - prefix_lengths).astype(np.uint64)
+    size = np.uint64(1) << host_bits
+    wildcard_mask = (size - np.uint64(1)).astype(np.uint32)
+    subnet_mask = ~wildcard_mask
+
+    network_address = addresses & subnet_mask
+    broadcast_address = network_address | wildcard_mask
+
+    # /32 is a single host and /31 a point-to-point link (RFC 3021).
+    small = host_bits <= 1
+    first_usable_ip = np.where(small, network_address, network_address + np.uint32(1))
+    last_usable_ip = np.where(
+        small, broadcast_address, broadcast_address - np.uint32(1)
+    )
+    total_ips = np.where(small, size, size - np.uint64(2))
+
+    is_private = _private(network_address, broadcast_address)
+
+    return NetworkInfoColumns(
+        network_address=network_address,
+        broadcast_address=broadcast_address,
+        prefix_length=prefix_lengths,
+        subnet_mask=subnet_mask,
+        wildcard_mask=wildcard_mask,
+        first_usable_ip=first_usable_ip,
+        last_usable_ip=last_usable_ip,
+        total_ips=total_ips,
+        is_private=is_private,
+    )
@@ -0,0 +1,202 @@
+"""
+Memoized calculate_projectile_motion for callers that repeat themselves, such
+as sliders in an interactive dashboard.
+
+Inputs can be quantized to a tolerance so nearly identical calls share one
+entry, the in-memory cache is bounded with LRU eviction, and results can also
+be kept in a SQLite file that survives restarts. New results are written to
+the file in batches, one transaction each, rather than one per miss.
+"""
+
+import json
+import sqlite3
+import threading
+from collections import OrderedDict, namedtuple
+
+from projectile_motion.projectile_motion import calculate_projectile_motion
+
+PARAMETERS = ("velocity", "angle", "height", "gravity")
+
+CacheInfo = namedtuple(
+    "CacheInfo", ["hits", "misses", "disk_hits", "maxsize", "currsize"]
+)
+
+
+def _snap(value, step):
+    return value if step is None else round(value / step) * step
+
+
+class ProjectileCache:
+    """
+    LRU cache around calculate_projectile_motion with the same call signature.
+
+    cache_info() and cache_clear() work like those of functools.lru_cache.
+    Cached results are returned with a fresh summary dict, so callers may
+    modify it.
+
+    Parameters:
+    maxsize (int): Number of results kept in memory.
+    tolerance (float or dict): Step that inputs are rounded to before lookup,
+    either for all parameters or per parameter name. None disables rounding.
+    path (str): SQLite file for a persistent cache, or None.
+    write_batch (int): Number of new results collected before they are written
+    to the SQLite file. Pending results are also written by flush() and close().
+    """
+
+    def __init__(self, maxsize=1024, tolerance=None, path=None, write_batch=256):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        if write_batch < 1:
+            raise ValueError("write_batch must be at least 1")
+        if not isinstance(tolerance, dict):
+            tolerance = dict.fromkeys(PARAMETERS, tolerance)
+        unknown = set(tolerance) - set(PARAMETERS)
+        if unknown:
+            raise ValueError(f"Unknown parameters: {', '.join(sorted(unknown))}")
+        if any(step is not None and step <= 0 for step in tolerance.values()):
+            raise ValueError("Tolerances must be positive")
+
+        self.maxsize = maxsize
+        self.tolerances = [tolerance.get(name) for name in PARAMETERS]
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._disk_hits = 0
+        self.write_batch = write_batch
+        self._pending = {}
+        self._db = None
+        if path is not None:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            with self._db:
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS results (velocity REAL, angle REAL, "
+                    "height REAL, gravity REAL, result TEXT NOT NULL, "
+                    "PRIMARY KEY (velocity, angle, height, gravity))"
+                )
+
+    def quantize(self, velocity, angle, height=0, gravity=9.81):
+        """
+        Rounds the inputs to the configured tolerances.
+
+        Parameters:
+        velocity (float): Initial velocity (m/s).
+        angle (float): Launch angle (degrees).
+        height (float): Initial height (m).
+        gravity (float): Acceleration due to gravity (m/s^2).
+
+        Returns:
+        tuple: The parameters that are actually calculated and cached.
+
+        Raises:
+        ValueError: If gravity is not positive after rounding.
+        """
+        velocity_step, angle_step, height_step, gravity_step = self.tolerances
+        gravity = _snap(gravity, gravity_step)
+        if gravity <= 0:
+            raise ValueError("Gravity must be positive")
+        return (
+            _snap(velocity, velocity_step),
+            _snap(angle, angle_step),
+            _snap(height, height_step),
+            gravity,
+        )
+
+    def __call__(self, velocity, angle, height=0, gravity=9.81):
+        key = self.quantize(velocity, angle, height, gravity)
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+        if result is None:
+            result = self._load(key)
+            if result is None:
+                result = calculate_projectile_motion(*key)
+                self._store(key, result)
+            self._remember(key, result)
+        velocity_x, velocity_y, flight_time, trajectory_data = result
+        return velocity_x, velocity_y, flight_time, dict(trajectory_data)
+
+    def _remember(self, key, result):
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def _load(self, key):
+        if self._db is not None:
+            with self._lock:
+                if key in self._pending:
+                    row = (self._pending[key],)
+                else:
+                    row = self._db.execute(
+                        "SELECT result FROM results WHERE velocity = ? AND angle = ? "
+                        "AND height = ? AND gravity = ?",
+                        key,
+                    ).fetchone()
+            if row is not None:
+                with self._lock:
+                    self._disk_hits += 1
+                return tuple(json.loads(row[0]))
+        with self._lock:
+            self._misses += 1
+        return None
+
+    def _store(self, key, result):
+        if self._db is not None:
+            with self._lock:
+                self._pending[key] = json.dumps(result)
+                if len(self._pending) >= self.write_batch:
+                    self._write_pending()
+
+    def _write_pending(self):
+        # Called with the lock held; one transaction for the whole batch.
+        if self._pending:
+            with self._db:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+                    [key + (result,) for key, result in self._pending.items()],
+                )
+            self._pending.clear()
+
+    def flush(self):
+        """Writes pending results to the persistent cache, if any."""
+        if self._db is not None:
+            with self._lock:
+                self._write_pending()
+
+    def cache_info(self):
+        """
+        Reports hit and miss statistics.
+
+        Returns:
+        CacheInfo: Memory hits, misses (calculated), disk hits, maxsize and the
+        number of results in memory.
+        """
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._disk_hits,
+                self.maxsize,
+                len(self._entries),
+            )
+
+    def cache_clear(self):
+        """Empties the in-memory cache and resets the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._disk_hits = 0
+
+    def close(self):
+        """Writes pending results and closes the persistent cache, if any."""
+        if self._db is not None:
+            self.flush()
+            self._db.close()
+            self._db = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
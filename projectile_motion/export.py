@@ -0,0 +1,348 @@
+"""
+Headless export of sampled trajectories, with no turtle or Tk display needed.
+
+Trajectories are dicts of "time", "x", "y" and "velocity" sequences as returned
+by projectile_motion.sample_trajectory. They are written as one row per sample
+to CSV, NPZ or Parquet while they are generated, and drawn as static SVG or PNG
+plots.
+"""
+
+import csv
+import os
+import struct
+import tempfile
+import zipfile
+import zlib
+
+import numpy as np
+
+from projectile_motion.projectile_motion import sample_trajectory
+
+COLUMNS = ["trajectory", "time", "x", "y", "velocity"]
+SAMPLE_COLUMNS = COLUMNS[1:]
+
+
+def iter_trajectories(velocity, angle, height=0.0, gravity=9.81, **sampling):
+    """
+    Samples one trajectory per combination of launch parameters, lazily.
+
+    The arguments are broadcast against each other, so any of them may be a
+    scalar.
+
+    Parameters:
+    velocity (array-like): Initial velocities (m/s).
+    angle (array-like): Launch angles (degrees).
+    height (array-like): Initial heights (m).
+    gravity (array-like): Accelerations due to gravity (m/s^2).
+    sampling: Extra keyword arguments for sample_trajectory.
+
+    Yields:
+    dict: Samples of one trajectory, in flattened order.
+    """
+    for v, a, h, g in np.broadcast(velocity, angle, height, gravity):
+        yield sample_trajectory(float(v), float(a), float(h), float(g), **sampling)
+
+
+def _as_iterable(trajectories):
+    # A single trajectory is exported like a batch of one.
+    if isinstance(trajectories, dict):
+        return [trajectories]
+    return trajectories
+
+
+def write_csv(trajectories, output):
+    """
+    Writes trajectories as CSV, one row per sample.
+
+    Parameters:
+    trajectories (iterable): Trajectory sample dicts, or a single one.
+    output (file): Text file object to write to.
+
+    Returns:
+    int: Number of trajectories written.
+    """
+    writer = csv.writer(output)
+    writer.writerow(COLUMNS)
+    count = 0
+    for index, samples in enumerate(_as_iterable(trajectories)):
+        columns = [samples[key] for key in SAMPLE_COLUMNS]
+        writer.writerows([index, *row] for row in zip(*columns))
+        count += 1
+    return count
+
+
+def write_npz(trajectories, path):
+    """
+    Writes trajectories as an NPZ archive with one array per column.
+
+    Samples are spooled to temporary files while the trajectories are
+    generated, so the whole batch never has to fit in memory.
+
+    Parameters:
+    trajectories (iterable): Trajectory sample dicts, or a single one.
+    path (str): Destination file path.
+
+    Returns:
+    int: Number of trajectories written.
+    """
+    dtypes = {key: np.float64 for key in SAMPLE_COLUMNS}
+    dtypes["trajectory"] = np.int64
+    with tempfile.TemporaryDirectory() as directory:
+        spools = {key: open(os.path.join(directory, key), "w+b") for key in COLUMNS}
+        rows = 0
+        count = 0
+        try:
+            for index, samples in enumerate(_as_iterable(trajectories)):
+                length = len(samples["time"])
+                np.full(length, index, dtype=np.int64).tofile(spools["trajectory"])
+                for key in SAMPLE_COLUMNS:
+                    np.asarray(samples[key], dtype=np.float64).tofile(spools[key])
+                rows += length
+                count += 1
+
+            with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+                for key in COLUMNS:
+                    spool = spools[key]
+                    spool.seek(0)
+                    header = {
+                        "descr": np.lib.format.dtype_to_descr(np.dtype(dtypes[key])),
+                        "fortran_order": False,
+                        "shape": (rows,),
+                    }
+                    with archive.open(f"{key}.npy", "w", force_zip64=True) as member:
+                        np.lib.format.write_array_header_1_0(member, header)
+                        while chunk := spool.read(1 << 20):
+                            member.write(chunk)
+        finally:
+            for spool in spools.values():
+                spool.close()
+    return count
+
+
+def write_parquet(trajectories, path, row_group_size=65536):
+    """
+    Writes trajectories as a Parquet file, one row group at a time.
+
+    Requires the optional pyarrow package.
+
+    Parameters:
+    trajectories (iterable): Trajectory sample dicts, or a single one.
+    path (str): Destination file path.
+    row_group_size (int): Number of samples buffered per row group.
+
+    Returns:
+    int: Number of trajectories written.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Parquet export requires pyarrow (pip install pyarrow)")
+
+    schema = pa.schema(
+        [("trajectory", pa.int64())] + [(key, pa.float64()) for key in SAMPLE_COLUMNS]
+    )
+    buffers = {key: [] for key in COLUMNS}
+    buffered = 0
+    count = 0
+
+    def flush(writer):
+        arrays = [np.concatenate(buffers[key]) for key in COLUMNS]
+        writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+        for key in COLUMNS:
+            buffers[key].clear()
+
+    with pq.ParquetWriter(path, schema) as writer:
+        for index, samples in enumerate(_as_iterable(trajectories)):
+            length = len(samples["time"])
+            buffers["trajectory"].append(np.full(length, index, dtype=np.int64))
+            for key in SAMPLE_COLUMNS:
+                buffers[key].append(np.asarray(samples[key], dtype=np.float64))
+            buffered += length
+            count += 1
+            if buffered >= row_group_size:
+                flush(writer)
+                buffered = 0
+        if buffered:
+            flush(writer)
+    return count
+
+
+WRITERS = {".csv": "csv", ".npz": "npz", ".parquet": "parquet"}
+
+
+def export_trajectories(trajectories, path, output_format=None):
+    """
+    Writes trajectories to a file, picking the format from its extension.
+
+    Parameters:
+    trajectories (iterable): Trajectory sample dicts, or a single one.
+    path (str): Destination file path.
+    output_format (str): "csv", "npz" or "parquet", to override the extension.
+
+    Returns:
+    int: Number of trajectories written.
+    """
+    output_format = output_format or WRITERS.get(os.path.splitext(path)[1].lower())
+    if output_format == "csv":
+        with open(path, "w", newline="") as output:
+            return write_csv(trajectories, output)
+    if output_format == "npz":
+        return write_npz(trajectories, path)
+    if output_format == "parquet":
+        return write_parquet(trajectories, path)
+    raise ValueError(f"Unknown export format for {path}: {output_format}")
+
+
+class _Canvas:
+    """
+    Maps trajectory coordinates to image pixels, with y pointing down.
+    """
+
+    def __init__(self, trajectories, width, height, margin):
+        x_min = min(
+            (min(samples["x"], default=0) for samples in trajectories), default=0
+        )
+        x_min = min(x_min, 0.0)
+        x_max = max(
+            (max(samples["x"], default=0) for samples in trajectories), default=0
+        )
+        y_max = max(
+            (max(samples["y"], default=0) for samples in trajectories), default=0
+        )
+        self.width = width
+        self.height = height
+        self.margin = margin
+        self.x_min = x_min
+        self.x_max = x_max
+        self.y_max = y_max
+        # Equal scales on both axes keep the shape of the paths.
+        self.scale = min(
+            (width - 2 * margin) / ((x_max - x_min) or 1),
+            (height - 2 * margin) / (y_max or 1),
+        )
+
+    def to_pixels(self, x, y):
+        px = self.margin + (np.asarray(x, dtype=np.float64) - self.x_min) * self.scale
+        py = self.height - self.margin - np.asarray(y, dtype=np.float64) * self.scale
+        return px, py
+
+
+def render_svg(trajectories, path, width=800, height=500, margin=40, opacity=None):
+    """
+    Draws trajectories as an SVG plot.
+
+    Parameters:
+    trajectories (iterable): Trajectory sample dicts, or a single one.
+    path (str): Destination file path.
+    width (int): Image width (px).
+    height (int): Image height (px).
+    margin (int): Space around the plot (px).
+    opacity (float): Stroke opacity of each path, lower for larger batches by
+    default so overlapping paths show up darker.
+    """
+    trajectories = list(_as_iterable(trajectories))
+    canvas = _Canvas(trajectories, width, height, margin)
+    if opacity is None:
+        opacity = max(0.05, min(1.0, 10 / max(len(trajectories), 1)))
+    _, ground = canvas.to_pixels(0, 0)
+
+    with open(path, "w") as output:
+        output.write(
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" '
+            f'height="{height}" viewBox="0 0 {width} {height}">\n'
+            f'<rect width="{width}" height="{height}" fill="white"/>\n'
+            f'<line x1="{margin}" y1="{ground:.2f}" x2="{width - margin}" '
+            f'y2="{ground:.2f}" stroke="black"/>\n'
+            f'<text x="{width - margin}" y="{ground + 20:.2f}" font-size="12" '
+            f'text-anchor="end">{canvas.x_max:.2f} m</text>\n'
+            f'<text x="{margin}" y="{margin - 10}" font-size="12">'
+            f"max height {canvas.y_max:.2f} m</text>\n"
+            f'<g fill="none" stroke="red" stroke-opacity="{opacity:.3f}">\n'
+        )
+        for samples in trajectories:
+            px, py = canvas.to_pixels(samples["x"], samples["y"])
+            points = " ".join(f"{x:.2f},{y:.2f}" for x, y in zip(px, py))
+            output.write(f'<polyline points="{points}"/>\n')
+        output.write("</g>\n</svg>\n")
+
+
+def _png_chunk(kind, data):
+    chunk = kind + data
+    return struct.pack(">I", len(data)) + chunk + struct.pack(">I", zlib.crc32(chunk))
+
+
+def write_png(pixels, path):
+    """
+    Writes an RGB image to a PNG file with no imaging library.
+
+    Parameters:
+    pixels (numpy.ndarray): (height, width, 3) uint8 array.
+    path (str): Destination file path.
+    """
+    height, width, _ = pixels.shape
+    # Every row starts with a filter type byte; 0 means no filter.
+    rows = np.zeros((height, width * 3 + 1), dtype=np.uint8)
+    rows[:, 1:] = pixels.reshape(height, width * 3)
+    with open(path, "wb") as output:
+        output.write(b"\x89PNG\r\n\x1a\n")
+        output.write(
+            _png_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+        )
+        output.write(_png_chunk(b"IDAT", zlib.compress(rows.tobytes(), 6)))
+        output.write(_png_chunk(b"IEND", b""))
+
+
+def _line_pixels(px, py):
+    """
+    Returns the pixels covered by a polyline, one point per pixel of length.
+    """
+    dx = np.diff(px)
+    dy = np.diff(py)
+    steps = np.maximum(np.ceil(np.maximum(np.abs(dx), np.abs(dy))), 1).astype(np.int64)
+    segment = np.repeat(np.arange(len(steps)), steps)
+    offset = np.arange(len(segment)) - np.repeat(np.cumsum(steps) - steps, steps)
+    fraction = offset / steps[segment]
+    xs = np.append(px[:-1][segment] + fraction * dx[segment], px[-1])
+    ys = np.append(py[:-1][segment] + fraction * dy[segment], py[-1])
+    return np.rint(xs).astype(np.int64), np.rint(ys).astype(np.int64)
+
+
+def render_png(trajectories, path, width=800, height=500, margin=40, opacity=None):
+    """
+    Draws trajectories as a PNG plot with a NumPy rasterizer.
+
+    Parameters:
+    trajectories (iterable): Trajectory sample dicts, or a single one.
+    path (str): Destination file path.
+    width (int): Image width (px).
+    height (int): Image height (px).
+    margin (int): Space around the plot (px).
+    opacity (float): Opacity of each path, lower for larger batches by default
+    so overlapping paths show up darker.
+    """
+    trajectories = list(_as_iterable(trajectories))
+    canvas = _Canvas(trajectories, width, height, margin)
+    if opacity is None:
+        opacity = max(0.05, min(1.0, 10 / max(len(trajectories), 1)))
+
+    # Number of paths crossing each pixel.
+    coverage = np.zeros(width * height, dtype=np.int64)
+    for samples in trajectories:
+        if len(samples["x"]) < 2:
+            continue
+        xs, ys = _line_pixels(*canvas.to_pixels(samples["x"], samples["y"]))
+        inside = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+        # Count every path at most once per pixel.
+        coverage[np.unique(ys[inside] * width + xs[inside])] += 1
+
+    alpha = 1 - (1 - opacity) ** coverage.reshape(height, width)
+    red = np.array([220, 30, 30], dtype=np.float64)
+    pixels = 255 * (1 - alpha[..., None]) + red * alpha[..., None]
+    pixels = pixels.astype(np.uint8)
+
+    _, ground = canvas.to_pixels(0, 0)
+    ground = int(round(float(ground)))
+    if 0 <= ground < height:
+        pixels[ground, margin : width - margin] = 0
+    write_png(pixels, path)
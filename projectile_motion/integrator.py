@@ -0,0 +1,558 @@
+"""
+Numerical integration engine for projectiles with air drag and wind.
+
+The closed-form equations in projectile_motion only hold in a vacuum. This
+module integrates the equations of motion instead, for many projectiles at once
+in lock-step: the state of N projectiles is a (4, N) array of x, y, vx and vy,
+and every step works on whole arrays with preallocated buffers.
+"""
+
+import numpy as np
+
+AIR_DENSITY = 1.225  # kg/m^3 at sea level
+ATMOSPHERE_SCALE_HEIGHT = 8500.0  # m
+
+# Adaptive steps are not shrunk below this (s); a projectile whose step would
+# have to be smaller is given up on, like one that outlasts max_time.
+MIN_STEP = 1e-12
+
+RESULT_KEYS = [
+    "flight_time",
+    "max_height",
+    "horizontal_range",
+    "impact_velocity",
+    "impact_angle",
+    "apex_time",
+]
+
+# Dormand-Prince 5(4) coefficients.
+_DP_C = [0.0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1.0, 1.0]
+_DP_A = [
+    [],
+    [1 / 5],
+    [3 / 40, 9 / 40],
+    [44 / 45, -56 / 15, 32 / 9],
+    [19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729],
+    [9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656],
+    [35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84],
+]
+_DP_E = [
+    71 / 57600,
+    0.0,
+    -71 / 16695,
+    71 / 1920,
+    -17253 / 339200,
+    22 / 525,
+    -1 / 40,
+]
+
+
+class ProjectileModel:
+    """
+    Forces acting on a projectile: gravity, optional linear and quadratic drag
+    relative to a constant wind, and optionally an air density that falls off
+    exponentially with altitude.
+
+    Subclass and override derivatives() to plug in other forces.
+
+    Parameters:
+    gravity (float): Acceleration due to gravity (m/s^2).
+    linear_drag (float): Linear drag per unit mass, b in a = -b * v (1/s).
+    quadratic_drag (float): Quadratic drag per unit mass at sea level, k in
+        a = -k * |v| * v (1/m). See from_body().
+    wind (tuple): Horizontal and vertical wind velocity (m/s).
+    scale_height (float): Scale height of the atmosphere (m), or None for a
+        constant air density.
+    """
+
+    def __init__(
+        self,
+        gravity=9.81,
+        linear_drag=0.0,
+        quadratic_drag=0.0,
+        wind=(0.0, 0.0),
+        scale_height=None,
+    ):
+        self.gravity = gravity
+        self.linear_drag = linear_drag
+        self.quadratic_drag = quadratic_drag
+        self.wind = wind
+        self.scale_height = scale_height
+        self._buffers = None
+
+    @classmethod
+    def from_body(
+        cls,
+        mass,
+        drag_coefficient,
+        area,
+        air_density=AIR_DENSITY,
+        gravity=9.81,
+        wind=(0.0, 0.0),
+        scale_height=None,
+    ):
+        """
+        Builds a quadratic drag model from the physical properties of a body.
+
+        Parameters:
+        mass (float): Mass of the projectile (kg).
+        drag_coefficient (float): Drag coefficient (0.47 for a sphere).
+        area (float): Cross-sectional area (m^2).
+        air_density (float): Air density at launch height (kg/m^3).
+        gravity (float): Acceleration due to gravity (m/s^2).
+        wind (tuple): Horizontal and vertical wind velocity (m/s).
+        scale_height (float): Scale height of the atmosphere (m), or None.
+
+        Returns:
+        ProjectileModel: The model.
+        """
+        quadratic_drag = 0.5 * air_density * drag_coefficient * area / mass
+        return cls(
+            gravity=gravity,
+            quadratic_drag=quadratic_drag,
+            wind=wind,
+            scale_height=scale_height,
+        )
+
+    def _scratch(self, shape):
+        if self._buffers is None or self._buffers.shape[1:] != shape:
+            self._buffers = np.empty((3,) + shape)
+        return self._buffers
+
+    def derivatives(self, state, out):
+        """
+        Writes the time derivative of state into out without allocating.
+
+        Parameters:
+        state (numpy.ndarray): (4, N) array of x, y, vx and vy.
+        out (numpy.ndarray): (4, N) array receiving vx, vy, ax and ay.
+        """
+        y, vx, vy = state[1], state[2], state[3]
+        ax, ay = out[2], out[3]
+        np.copyto(out[0], vx)
+        np.copyto(out[1], vy)
+        ax.fill(0.0)
+        ay.fill(-self.gravity)
+        if not (self.linear_drag or self.quadratic_drag):
+            return
+
+        relative_vx, relative_vy, scratch = self._scratch(vx.shape)
+        np.subtract(vx, self.wind[0], out=relative_vx)
+        np.subtract(vy, self.wind[1], out=relative_vy)
+
+        if self.linear_drag:
+            np.multiply(relative_vx, self.linear_drag, out=scratch)
+            ax -= scratch
+            np.multiply(relative_vy, self.linear_drag, out=scratch)
+            ay -= scratch
+
+        if self.quadratic_drag:
+            speed_factor = scratch
+            np.hypot(relative_vx, relative_vy, out=speed_factor)
+            speed_factor *= self.quadratic_drag
+            if self.scale_height:
+                # Reuse out[0] as a temporary and restore it afterwards.
+                density = out[0]
+                np.divide(y, -self.scale_height, out=density)
+                np.exp(density, out=density)
+                speed_factor *= density
+                np.copyto(out[0], vx)
+            relative_vx *= speed_factor
+            relative_vy *= speed_factor
+            ax -= relative_vx
+            ay -= relative_vy
+
+
+def initial_state(velocity, angle, height=0.0):
+    """
+    Builds the (4, N) state array for a set of launches.
+
+    Parameters:
+    velocity (array-like): Initial velocities (m/s).
+    angle (array-like): Launch angles (degrees).
+    height (array-like): Initial heights (m).
+
+    Returns:
+    numpy.ndarray: x, y, vx and vy stacked along the first axis.
+    """
+    velocity, angle, height = np.broadcast_arrays(
+        *(
+            np.atleast_1d(np.asarray(v, dtype=np.float64))
+            for v in (velocity, angle, height)
+        )
+    )
+    angle_rad = np.radians(angle.ravel())
+    velocity = velocity.ravel()
+    return np.stack(
+        [
+            np.zeros_like(velocity),
+            height.ravel(),
+            velocity * np.cos(angle_rad),
+            velocity * np.sin(angle_rad),
+        ]
+    )
+
+
+def _hermite(p0, d0, p1, d1, h, theta):
+    """
+    Evaluates the cubic Hermite interpolant between two steps at fraction theta.
+    """
+    theta2 = theta * theta
+    theta3 = theta2 * theta
+    return (
+        (2 * theta3 - 3 * theta2 + 1) * p0
+        + (theta3 - 2 * theta2 + theta) * h * d0
+        + (-2 * theta3 + 3 * theta2) * p1
+        + (theta3 - theta2) * h * d1
+    )
+
+
+def _locate_crossing(p0, d0, p1, d1, h, iterations=50):
+    """
+    Bisects for the fraction of a step where a quantity falls from p0 > 0 to
+    p1 <= 0, using the Hermite interpolant of the step.
+    """
+    low = np.zeros_like(p0)
+    high = np.ones_like(p0)
+    for _ in range(iterations):
+        middle = 0.5 * (low + high)
+        above = _hermite(p0, d0, p1, d1, h, middle) > 0
+        low = np.where(above, middle, low)
+        high = np.where(above, high, middle)
+    return high
+
+
+class _EventTracker:
+    """
+    Records apex and ground impact events for every projectile.
+
+    The solvers only integrate projectiles that are still flying; ids maps the
+    columns of their working arrays back to positions in the results.
+    """
+
+    def __init__(self, state, ground):
+        n = state.shape[1]
+        self.ground = ground
+        self.active = np.ones(n, dtype=bool)
+        self.results = {key: np.full(n, np.nan) for key in RESULT_KEYS}
+
+        # Projectiles launched level or downwards have their apex at launch.
+        no_climb = state[3] <= 0
+        self.apex_found = no_climb.copy()
+        self.results["apex_time"][no_climb] = 0.0
+        self.results["max_height"][no_climb] = state[1][no_climb]
+
+        # Projectiles on the ground that are not climbing land immediately.
+        grounded = np.flatnonzero(no_climb & (state[1] <= ground))
+        self._record_impact(grounded, 0.0, state[:, grounded])
+
+    def _record_impact(self, ids, time, state):
+        x, vx, vy = state[0], state[2], state[3]
+        self.results["flight_time"][ids] = time
+        self.results["horizontal_range"][ids] = x
+        self.results["impact_velocity"][ids] = np.hypot(vx, vy)
+        self.results["impact_angle"][ids] = np.degrees(np.arctan2(vy, vx))
+        self.active[ids] = False
+
+    def update(
+        self, ids, time, h, state, derivative, new_state, new_derivative, stepped
+    ):
+        """
+        Detects events in the step from state to new_state for the columns in
+        stepped, and snaps landed projectiles to their impact state.
+
+        Returns the time at the end of the step for every column, which is the
+        impact time for projectiles that landed during it.
+        """
+        time = np.broadcast_to(time, ids.shape)
+        h = np.broadcast_to(h, ids.shape)
+        end_time = time + h
+
+        apex = stepped & ~self.apex_found[ids] & (new_state[3] <= 0)
+        if apex.any():
+            index = np.flatnonzero(apex)
+            p0, d0 = state[:, index], derivative[:, index]
+            p1, d1 = new_state[:, index], new_derivative[:, index]
+            step = h[index]
+            theta = _locate_crossing(p0[3], d0[3], p1[3], d1[3], step)
+            self.results["apex_time"][ids[index]] = time[index] + theta * step
+            self.results["max_height"][ids[index]] = _hermite(
+                p0[1], d0[1], p1[1], d1[1], step, theta
+            )
+            self.apex_found[ids[index]] = True
+
+        # A projectile lands when it falls through the ground, or when it starts
+        # falling without ever having risen above it.
+        ground = self.ground[ids]
+        impact = (
+            stepped
+            & (new_state[1] <= ground)
+            & ((state[1] > ground) | (new_state[3] < 0))
+        )
+        if impact.any():
+            index = np.flatnonzero(impact)
+            p0, d0 = state[:, index], derivative[:, index]
+            p1, d1 = new_state[:, index], new_derivative[:, index]
+            step = h[index]
+            ground = ground[index]
+            crossed = p0[1] > ground
+            theta = np.where(
+                crossed,
+                _locate_crossing(p0[1] - ground, d0[1], p1[1] - ground, d1[1], step),
+                _locate_crossing(p0[3], d0[3], p1[3], d1[3], step),
+            )
+            impact_state = _hermite(p0, d0, p1, d1, step, theta)
+            impact_state[1] = np.where(crossed, ground, impact_state[1])
+            new_state[:, index] = impact_state
+            end_time[index] = time[index] + theta * step
+            self._record_impact(ids[index], end_time[index], impact_state)
+        return end_time
+
+
+class _Recorder:
+    """
+    Keeps a copy of every step for all projectiles, including landed ones.
+    """
+
+    def __init__(self, state, time):
+        self.state = state.copy()
+        self.time = np.broadcast_to(time, state.shape[1:]).copy()
+        self.times = [self.time.copy()]
+        self.states = [self.state.copy()]
+
+    def append(self, ids, time, state):
+        self.state[:, ids] = state
+        self.time[ids] = time
+        self.times.append(self.time.copy())
+        self.states.append(self.state.copy())
+
+
+def _compact(ids, live, *arrays):
+    """
+    Drops the columns of projectiles that are no longer integrated.
+    """
+    keep = np.flatnonzero(live)
+    return (ids[keep],) + tuple(array[..., keep].copy() for array in arrays)
+
+
+def _solve_rk4(model, state, ground, dt, max_time, recorder):
+    events = _EventTracker(state, ground)
+    ids = np.flatnonzero(events.active)
+    state = state[:, ids]
+    derivative = np.empty_like(state)
+    model.derivatives(state, derivative)
+    time = 0.0
+
+    while ids.size and time < max_time:
+        new_state = np.empty_like(state)
+        new_derivative = np.empty_like(state)
+        k2, k3, k4 = np.empty((3,) + state.shape)
+        increment = np.empty_like(state)
+
+        while time < max_time:
+            np.multiply(derivative, dt / 2, out=increment)
+            increment += state
+            model.derivatives(increment, k2)
+            np.multiply(k2, dt / 2, out=increment)
+            increment += state
+            model.derivatives(increment, k3)
+            np.multiply(k3, dt, out=increment)
+            increment += state
+            model.derivatives(increment, k4)
+
+            np.add(k2, k3, out=increment)
+            increment *= 2
+            increment += derivative
+            increment += k4
+            increment *= dt / 6
+            np.add(state, increment, out=new_state)
+            model.derivatives(new_state, new_derivative)
+
+            stepped = events.active[ids]
+            end_time = events.update(
+                ids, time, dt, state, derivative, new_state, new_derivative, stepped
+            )
+            state, new_state = new_state, state
+            derivative, new_derivative = new_derivative, derivative
+            time += dt
+            if recorder:
+                recorder.append(ids[stepped], end_time[stepped], state[:, stepped])
+
+            live = events.active[ids]
+            if live.sum() * 2 <= live.size:
+                ids, state, derivative = _compact(ids, live, state, derivative)
+                break
+
+    return events.results
+
+
+def _solve_rk45(model, state, ground, dt, max_time, rtol, atol, recorder):
+    events = _EventTracker(state, ground)
+    ids = np.flatnonzero(events.active)
+    state = state[:, ids]
+    time = np.zeros(ids.size)
+    h = np.full(ids.size, float(dt))
+    first_derivative = np.empty_like(state)
+    model.derivatives(state, first_derivative)
+
+    while ids.size:
+        stages = np.empty((7,) + state.shape)
+        stages[0] = first_derivative
+        trial = np.empty_like(state)
+        error = np.empty_like(state)
+        scratch = np.empty_like(state)
+        stage_step = np.empty(ids.size)
+        error_norm = np.empty(ids.size)
+
+        while True:
+            running = events.active[ids] & (time < max_time)
+            if not running.any():
+                return events.results
+            step = np.where(running, np.minimum(h, max_time - time), 0.0)
+
+            for stage in range(1, 7):
+                np.copyto(trial, state)
+                for j, coefficient in enumerate(_DP_A[stage]):
+                    if coefficient:
+                        np.multiply(step, coefficient, out=stage_step)
+                        np.multiply(stages[j], stage_step, out=scratch)
+                        trial += scratch
+                model.derivatives(trial, stages[stage])
+            # The last stage is evaluated at the 5th-order solution (FSAL).
+            new_state = trial
+
+            error.fill(0.0)
+            for j, coefficient in enumerate(_DP_E):
+                if coefficient:
+                    np.multiply(stages[j], coefficient, out=scratch)
+                    error += scratch
+            error *= step
+            # |error| / (atol + rtol * max(|state|, |new_state|)), in place;
+            # stages[1] is no longer needed and holds |new_state|.
+            np.abs(state, out=scratch)
+            np.maximum(scratch, np.abs(new_state, out=stages[1]), out=scratch)
+            scratch *= rtol
+            scratch += atol
+            np.abs(error, out=error)
+            error /= scratch
+            np.max(error, axis=0, out=error_norm)
+
+            # Steps that blow up to inf or NaN, or would have to shrink below
+            # MIN_STEP, never succeed; stop integrating those projectiles.
+            failed = running & (
+                ~np.isfinite(error_norm)
+                | ~np.isfinite(step)
+                | ((error_norm > 1.0) & (step <= MIN_STEP))
+            )
+            if failed.any():
+                events.active[ids[failed]] = False
+                running &= ~failed
+
+            accepted = running & (error_norm <= 1.0)
+            end_time = events.update(
+                ids, time, step, state, stages[0], new_state, stages[6], accepted
+            )
+            np.copyto(state, new_state, where=accepted)
+            np.copyto(stages[0], stages[6], where=accepted)
+            time = np.where(accepted, end_time, time)
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                factor = np.clip(0.9 * error_norm**-0.2, 0.2, 5.0)
+            h = np.where(running, np.maximum(step * factor, MIN_STEP), h)
+
+            if recorder:
+                recorder.append(ids, time, state)
+
+            live = events.active[ids] & (time < max_time)
+            if live.sum() * 2 <= live.size:
+                ids, state, time, h, first_derivative = _compact(
+                    ids, live, state, time, h, stages[0]
+                )
+                break
+
+    return events.results
+
+
+def simulate(
+    velocity,
+    angle,
+    height=0.0,
+    model=None,
+    method="rk45",
+    ground=0.0,
+    dt=0.01,
+    max_time=1e4,
+    rtol=1e-8,
+    atol=1e-8,
+    record=False,
+):
+    """
+    Integrates many projectiles in lock-step until they hit the ground.
+
+    The arguments velocity, angle, height and ground are broadcast against each
+    other and the results are flattened.
+
+    Parameters:
+    velocity (array-like): Initial velocities (m/s).
+    angle (array-like): Launch angles (degrees).
+    height (array-like): Initial heights (m).
+    model (ProjectileModel): Forces to integrate, vacuum by default.
+    method (str): "rk4" for fixed steps of dt, or "rk45" for adaptive
+        Dormand-Prince steps starting at dt.
+    ground (array-like): Height at which projectiles land (m). A projectile
+        launched below it lands as soon as it starts falling.
+    dt (float): Step size for rk4, initial step size for rk45 (s).
+    max_time (float): Projectiles still flying after this time get NaN results,
+        as do rk45 projectiles whose step would fall below MIN_STEP.
+    rtol (float): Relative tolerance for rk45.
+    atol (float): Absolute tolerance for rk45.
+    record (bool): Whether to keep every step of the trajectories.
+
+    Returns:
+    dict: Float arrays for every key in RESULT_KEYS. With record=True it also
+    holds "times" (steps, N) and "states" (steps, 4, N). Apex and impact are
+    located inside a step by interpolation, and landed projectiles stay at
+    their impact state.
+
+    Raises:
+    ValueError: If a launch or model parameter is not finite, or the method is
+    unknown.
+    """
+    model = model or ProjectileModel()
+    velocity, angle, height, ground = np.broadcast_arrays(
+        *(
+            np.atleast_1d(np.asarray(v, dtype=np.float64))
+            for v in (velocity, angle, height, ground)
+        )
+    )
+    parameters = {
+        "velocity": velocity,
+        "angle": angle,
+        "height": height,
+        "ground": ground,
+        "gravity": model.gravity,
+        "linear_drag": model.linear_drag,
+        "quadratic_drag": model.quadratic_drag,
+        "wind": model.wind,
+        "scale_height": 0.0 if model.scale_height is None else model.scale_height,
+        "dt": dt,
+    }
+    for name, values in parameters.items():
+        if not np.all(np.isfinite(values)):
+            raise ValueError(f"{name} must be finite")
+    state = initial_state(velocity, angle, height)
+    ground = ground.ravel()
+
+    recorder = _Recorder(state, 0.0) if record else None
+
+    if method == "rk4":
+        results = _solve_rk4(model, state, ground, dt, max_time, recorder)
+    elif method == "rk45":
+        results = _solve_rk45(model, state, ground, dt, max_time, rtol, atol, recorder)
+    else:
+        raise ValueError(f"Unknown integration method: {method}")
+
+    if record:
+        results["times"] = np.array(recorder.times)
+        results["states"] = np.array(recorder.states)
+    return results
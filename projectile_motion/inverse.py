@@ -0,0 +1,294 @@
+"""
+Inverse projectile problems: which launch angle or velocity hits a target.
+
+In a vacuum the answers are closed-form. With drag they are found by root
+finding on projectile_motion.integrator, where every iteration integrates one
+trajectory per target, so a whole batch of targets is solved in lock-step.
+"""
+
+import math
+
+import numpy as np
+
+from projectile_motion.integrator import ProjectileModel, simulate
+
+GOLDEN_RATIO = (math.sqrt(5) - 1) / 2
+
+
+def _broadcast(*values):
+    arrays = np.broadcast_arrays(
+        *(np.asarray(value, dtype=np.float64) for value in values)
+    )
+    if np.any(arrays[0] <= 0):
+        raise ValueError("Target distance must be positive")
+    return arrays
+
+
+def launch_angles(distance, velocity, height=0.0, gravity=9.81, target_height=0.0):
+    """
+    Calculates the launch angles that hit a target in a vacuum.
+
+    The arguments are broadcast against each other, so any of them may be a
+    scalar.
+
+    Parameters:
+    distance (array-like): Horizontal distance to the target (m).
+    velocity (array-like): Initial velocities (m/s).
+    height (array-like): Initial heights (m).
+    gravity (array-like): Accelerations due to gravity (m/s^2).
+    target_height (array-like): Heights of the targets (m).
+
+    Returns:
+    tuple: Low and high launch angles (degrees) as float64 arrays, NaN where
+    the target is out of reach.
+    """
+    distance, velocity, height, gravity, target_height = _broadcast(
+        distance, velocity, height, gravity, target_height
+    )
+    rise = target_height - height
+    velocity_squared = velocity**2
+    discriminant = velocity_squared**2 - gravity * (
+        gravity * distance**2 + 2 * rise * velocity_squared
+    )
+    # Treat rounding errors at exactly the minimum velocity as a grazing hit.
+    grazing = discriminant > -1e-12 * velocity_squared**2
+    discriminant = np.where(grazing, np.maximum(discriminant, 0.0), discriminant)
+    with np.errstate(invalid="ignore"):
+        root = np.sqrt(discriminant)
+    low = np.degrees(np.arctan((velocity_squared - root) / (gravity * distance)))
+    high = np.degrees(np.arctan((velocity_squared + root) / (gravity * distance)))
+    return low, high
+
+
+def minimum_velocity(distance, height=0.0, gravity=9.81, target_height=0.0):
+    """
+    Calculates the smallest launch velocity that reaches a target in a vacuum.
+
+    Parameters:
+    distance (array-like): Horizontal distance to the target (m).
+    height (array-like): Initial heights (m).
+    gravity (array-like): Accelerations due to gravity (m/s^2).
+    target_height (array-like): Heights of the targets (m).
+
+    Returns:
+    tuple: Minimum velocities (m/s) and the launch angles (degrees) they need,
+    as float64 arrays.
+    """
+    distance, height, gravity, target_height = _broadcast(
+        distance, height, gravity, target_height
+    )
+    rise = target_height - height
+    slant = rise + np.hypot(distance, rise)
+    velocity = np.sqrt(gravity * slant)
+    angle = np.degrees(np.arctan(slant / distance))
+    return velocity, angle
+
+
+def _reach(velocity, angle, height, target_height, model, simulate_options):
+    """
+    Horizontal distance at which each projectile falls through its target
+    height. Projectiles that never get that high score how far they stay below
+    it instead, as a negative number, so the score still rises with the angle.
+    """
+    results = simulate(
+        velocity, angle, height, model, ground=target_height, **simulate_options
+    )
+    climb = results["max_height"] - target_height.ravel()
+    reach = np.where(climb >= 0, results["horizontal_range"], np.minimum(climb, 0))
+    return np.where(np.isnan(reach), -np.inf, reach)
+
+
+def _maximum_reach(velocity, height, target_height, model, tolerance, options):
+    """
+    Golden-section search for the angle with the longest reach per target.
+    """
+    low = np.full(velocity.shape, -90.0)
+    high = np.full(velocity.shape, 90.0)
+    left = high - GOLDEN_RATIO * (high - low)
+    right = low + GOLDEN_RATIO * (high - low)
+    left_reach = _reach(velocity, left, height, target_height, model, options)
+    right_reach = _reach(velocity, right, height, target_height, model, options)
+
+    iterations = math.ceil(math.log(tolerance / 180) / math.log(GOLDEN_RATIO))
+    for _ in range(iterations):
+        move_right = left_reach < right_reach
+        low = np.where(move_right, left, low)
+        high = np.where(move_right, high, right)
+        # The surviving inner point becomes the other inner point, so only one
+        # new angle per target is integrated.
+        next_left = np.where(move_right, right, high - GOLDEN_RATIO * (high - low))
+        next_right = np.where(move_right, low + GOLDEN_RATIO * (high - low), left)
+        probe = np.where(move_right, next_right, next_left)
+        probe_reach = _reach(velocity, probe, height, target_height, model, options)
+        left_reach, right_reach = (
+            np.where(move_right, right_reach, probe_reach),
+            np.where(move_right, probe_reach, left_reach),
+        )
+        left, right = next_left, next_right
+
+    best = left_reach >= right_reach
+    return np.where(best, left, right), np.where(best, left_reach, right_reach)
+
+
+def _bisect_angle(
+    short, long, distance, velocity, height, target_height, model, tolerance, options
+):
+    """
+    Bisects for the angle between short and long whose reach is the distance,
+    where the reach at short falls short of it and the reach at long does not.
+    """
+    iterations = math.ceil(math.log2(180 / tolerance))
+    for _ in range(iterations):
+        middle = 0.5 * (short + long)
+        reach = _reach(velocity, middle, height, target_height, model, options)
+        falls_short = reach < distance
+        short = np.where(falls_short, middle, short)
+        long = np.where(falls_short, long, middle)
+    return 0.5 * (short + long)
+
+
+def launch_angles_with_drag(
+    distance,
+    velocity,
+    model=None,
+    height=0.0,
+    target_height=0.0,
+    tolerance=1e-6,
+    **simulate_options,
+):
+    """
+    Finds the launch angles that hit a target with drag and wind.
+
+    Assumes the reach rises with the angle up to a single maximum and then
+    falls, which holds for the forces in ProjectileModel. The arguments are
+    broadcast against each other and the results are flattened.
+
+    Parameters:
+    distance (array-like): Horizontal distance to the target (m).
+    velocity (array-like): Initial velocities (m/s).
+    model (ProjectileModel): Forces to integrate, vacuum by default.
+    height (array-like): Initial heights (m).
+    target_height (array-like): Heights of the targets (m).
+    tolerance (float): Accuracy of the angles (degrees).
+    simulate_options: Extra keyword arguments for integrator.simulate.
+
+    Returns:
+    tuple: Low and high launch angles (degrees) as float64 arrays, NaN where
+    the target is out of reach.
+    """
+    model = model or ProjectileModel()
+    distance, velocity, height, target_height = (
+        array.ravel() for array in _broadcast(distance, velocity, height, target_height)
+    )
+    args = (velocity, height, target_height, model)
+
+    best_angle, best_reach = _maximum_reach(*args, tolerance, simulate_options)
+    reachable = best_reach >= distance
+
+    low = _bisect_angle(
+        np.full(distance.shape, -90.0),
+        best_angle,
+        distance,
+        *args,
+        tolerance,
+        simulate_options,
+    )
+    high = _bisect_angle(
+        np.full(distance.shape, 90.0),
+        best_angle,
+        distance,
+        *args,
+        tolerance,
+        simulate_options,
+    )
+    return np.where(reachable, low, np.nan), np.where(reachable, high, np.nan)
+
+
+def minimum_velocity_with_drag(
+    distance,
+    model=None,
+    height=0.0,
+    target_height=0.0,
+    tolerance=1e-6,
+    max_velocity=1e4,
+    **simulate_options,
+):
+    """
+    Finds the smallest launch velocity that reaches a target with drag and wind.
+
+    Runs an Illinois (modified regula falsi) search on the velocity, searching
+    at every step for the angle with the longest reach. The arguments are
+    broadcast against each other and the results are flattened.
+
+    Parameters:
+    distance (array-like): Horizontal distance to the target (m).
+    model (ProjectileModel): Forces to integrate, vacuum by default.
+    height (array-like): Initial heights (m).
+    target_height (array-like): Heights of the targets (m).
+    tolerance (float): Relative accuracy of the velocities.
+    max_velocity (float): Targets needing more than this get NaN (m/s).
+    simulate_options: Extra keyword arguments for integrator.simulate.
+
+    Returns:
+    tuple: Minimum velocities (m/s) and the launch angles (degrees) they need,
+    as float64 arrays, NaN where the target is out of reach.
+    """
+    model = model or ProjectileModel()
+    distance, height, target_height = (
+        array.ravel() for array in _broadcast(distance, height, target_height)
+    )
+    # The reach is flat around its maximum, so a coarse angle is enough to
+    # compare it with the distance.
+    angle_tolerance = 1e-3
+
+    def shortfall(velocity):
+        angle, reach = _maximum_reach(
+            velocity, height, target_height, model, angle_tolerance, simulate_options
+        )
+        return angle, np.maximum(reach, 0.0) - distance
+
+    low = np.zeros(distance.shape)
+    low_shortfall = -distance
+    high = np.minimum(
+        minimum_velocity(distance, height, model.gravity, target_height)[0],
+        max_velocity,
+    )
+    angle, high_shortfall = shortfall(high)
+    # Drag slows projectiles down, so the vacuum minimum is usually too small;
+    # keep doubling it until the target is in reach.
+    reachable = high_shortfall >= 0
+    while not reachable.all() and (high[~reachable] < max_velocity).any():
+        low = np.where(reachable, low, high)
+        low_shortfall = np.where(reachable, low_shortfall, high_shortfall)
+        high = np.where(reachable, high, np.minimum(2 * high, max_velocity))
+        angle, high_shortfall = shortfall(high)
+        reachable = high_shortfall >= 0
+
+    velocity = high
+    last_side = np.zeros(distance.shape, dtype=bool)
+    for _ in range(100):
+        converged = (high - low <= tolerance * high) | ~reachable
+        if converged.all():
+            break
+        guess = (low * high_shortfall - high * low_shortfall) / (
+            high_shortfall - low_shortfall
+        )
+        guess = np.where(converged, velocity, guess)
+        guess_angle, guess_shortfall = shortfall(guess)
+        short = guess_shortfall < 0
+        exact = guess_shortfall == 0
+        # Halving the value kept at the stale end stops regula falsi from
+        # creeping up on the root from one side only.
+        high_shortfall = np.where(short & last_side, high_shortfall / 2, high_shortfall)
+        low_shortfall = np.where(~short & ~last_side, low_shortfall / 2, low_shortfall)
+        update = ~converged
+        low = np.where(update & short, guess, low)
+        low_shortfall = np.where(update & short, guess_shortfall, low_shortfall)
+        high = np.where(update & ~short, guess, high)
+        high_shortfall = np.where(update & ~short, guess_shortfall, high_shortfall)
+        angle = np.where(update & ~short, guess_angle, angle)
+        low = np.where(update & exact, guess, low)
+        velocity = high
+        last_side = short
+
+    return np.where(reachable, high, np.nan), np.where(reachable, angle, np.nan)
@@ -0,0 +1,276 @@
+"""
+Monte Carlo uncertainty propagation for projectile launches.
+
+Velocity, angle, height and gravity are drawn from user-supplied distributions
+and solved in chunks with trajectory_batch, the vectorized counterpart of
+calculate_projectile_motion. Each chunk is reduced to streaming statistics and
+fine-grained histograms before the next one is drawn, so memory stays bounded
+however many samples are requested, and chunks can run on a process pool.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from projectile_motion.trajectory_batch import RESULT_KEYS, solve_trajectories
+
+PARAMETERS = ("velocity", "angle", "height", "gravity")
+FINE_BINS = 10000
+
+
+def _draw(spec, rng, size):
+    """
+    Draws size values from a distribution spec.
+
+    A spec is a constant, a (method, *args) tuple naming a method of
+    numpy.random.Generator such as ("normal", 20, 0.5) or ("uniform", 40, 50),
+    or a callable taking (rng, size).
+    """
+    if callable(spec):
+        values = np.asarray(spec(rng, size), dtype=np.float64)
+        return np.broadcast_to(values, (size,))
+    if isinstance(spec, (tuple, list)):
+        name, *args = spec
+        method = getattr(rng, name, None) if isinstance(name, str) else None
+        if method is None or name.startswith("_"):
+            raise ValueError(f"Unknown distribution: {name}")
+        return method(*args, size=size)
+    return np.full(size, float(spec))
+
+
+def _simulate_chunk(specs, seed, size):
+    rng = np.random.default_rng(seed)
+    draws = {name: _draw(spec, rng, size) for name, spec in zip(PARAMETERS, specs)}
+    results = solve_trajectories(**draws)
+    # Same domain as the batch scenarios: positive gravity, no negative height.
+    valid = (draws["gravity"] > 0) & (draws["height"] >= 0)
+    for key in RESULT_KEYS:
+        valid &= np.isfinite(results[key])
+    return {key: results[key][valid] for key in RESULT_KEYS}, int(size - valid.sum())
+
+
+class _Summary:
+    """
+    Mergeable running statistics and a fixed-bin histogram of one quantity.
+
+    The histogram has an underflow and an overflow bin, so values outside the
+    bin range are still counted; percentiles that fall into them are clamped
+    to the exact minimum and maximum.
+    """
+
+    def __init__(self, low, high, bins=FINE_BINS):
+        self.edges = np.linspace(low, high, bins + 1)
+        self.counts = np.zeros(bins + 2, dtype=np.int64)
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = np.inf
+        self.maximum = -np.inf
+
+    def add(self, values):
+        if not len(values):
+            return
+        other = _Summary.__new__(_Summary)
+        other.edges = self.edges
+        other.counts = np.zeros_like(self.counts)
+        inside, _ = np.histogram(values, self.edges)
+        other.counts[1:-1] = inside
+        other.counts[0] = np.count_nonzero(values < self.edges[0])
+        other.counts[-1] = np.count_nonzero(values > self.edges[-1])
+        other.count = len(values)
+        other.mean = float(values.mean())
+        other.m2 = float(((values - other.mean) ** 2).sum())
+        other.minimum = float(values.min())
+        other.maximum = float(values.max())
+        self.merge(other)
+
+    def merge(self, other):
+        # Chan et al. pairwise update of the mean and sum of squared deviations.
+        count = self.count + other.count
+        if not other.count:
+            return
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta**2 * self.count * other.count / count
+        self.count = count
+        self.counts += other.counts
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+
+    def cdf(self, value):
+        """Approximate fraction of values at or below value."""
+        if value < self.minimum:
+            return 0.0
+        if value >= self.maximum:
+            return 1.0
+        position = np.interp(value, self.edges, np.arange(len(self.edges)))
+        whole = int(position)
+        below = self.counts[: whole + 1].sum()
+        if whole < len(self.edges) - 1:
+            below += (position - whole) * self.counts[whole + 1]
+        return float(below) / self.count
+
+    def quantile(self, fraction):
+        """Approximate value below which the given fraction of values lie."""
+        target = fraction * self.count
+        cumulative = np.cumsum(self.counts)
+        index = int(np.searchsorted(cumulative, target))
+        if index == 0:
+            return self.minimum
+        if index == len(self.counts) - 1:
+            return self.maximum
+        before = cumulative[index - 1]
+        within = (target - before) / self.counts[index] if self.counts[index] else 0
+        low, high = self.edges[index - 1], self.edges[index]
+        return float(min(max(low + within * (high - low), self.minimum), self.maximum))
+
+    def histogram(self, bins):
+        """Regroups the fine bins that hold values into about bins bins."""
+        inside = self.counts[1:-1]
+        occupied = np.flatnonzero(inside)
+        if not len(occupied):
+            return {"counts": [], "edges": []}
+        first, last = occupied[0], occupied[-1] + 1
+        starts = np.unique(np.linspace(first, last, bins + 1).astype(np.int64))
+        counts = np.add.reduceat(inside[first:last], starts[:-1] - first)
+        counts[0] += self.counts[0]
+        counts[-1] += self.counts[-1]
+        return {"counts": counts.tolist(), "edges": self.edges[starts].tolist()}
+
+    def report(self, percentiles, bins):
+        return {
+            "mean": self.mean,
+            "std": (self.m2 / self.count) ** 0.5 if self.count else float("nan"),
+            "min": self.minimum,
+            "max": self.maximum,
+            "percentiles": {p: self.quantile(p / 100) for p in percentiles},
+            "histogram": self.histogram(bins),
+        }
+
+
+def _dispersion_radius(summary, fraction):
+    """
+    Radius around the mean impact point that holds the given fraction of
+    impacts, the one-dimensional analogue of a circular error probable.
+    """
+    low = 0.0
+    high = max(summary.maximum - summary.mean, summary.mean - summary.minimum)
+    for _ in range(60):
+        radius = 0.5 * (low + high)
+        inside = summary.cdf(summary.mean + radius) - summary.cdf(summary.mean - radius)
+        if inside < fraction:
+            low = radius
+        else:
+            high = radius
+    return high
+
+
+def _bin_range(values):
+    low, high = float(values.min()), float(values.max())
+    span = high - low or max(abs(low), 1.0) * 0.01
+    return low - span / 2, high + span / 2
+
+
+def _summarize_chunk(specs, seed, size, ranges):
+    results, invalid = _simulate_chunk(specs, seed, size)
+    summaries = {}
+    for key in RESULT_KEYS:
+        summaries[key] = _Summary(*ranges[key])
+        summaries[key].add(results[key])
+    return summaries, invalid
+
+
+def run_monte_carlo(
+    velocity,
+    angle,
+    height=0.0,
+    gravity=9.81,
+    samples=1_000_000,
+    chunk_size=250_000,
+    workers=1,
+    seed=None,
+    percentiles=(5, 25, 50, 75, 95),
+    bins=50,
+):
+    """
+    Propagates uncertain launch parameters to the trajectory results.
+
+    Each parameter is a constant, a (method, *args) tuple naming a
+    numpy.random.Generator method such as ("normal", 20, 0.5), or a callable
+    taking (rng, size); callables must be module-level functions when workers
+    is more than 1. Results are reproducible for a given seed and chunk_size,
+    whatever the number of workers.
+
+    Parameters:
+    velocity: Distribution of the initial velocity (m/s).
+    angle: Distribution of the launch angle (degrees).
+    height: Distribution of the initial height (m).
+    gravity: Distribution of the acceleration due to gravity (m/s^2).
+    samples (int): Number of draws.
+    chunk_size (int): Number of draws solved at once.
+    workers (int): Number of worker processes (None for the CPU count).
+    seed (int): Seed for numpy.random.SeedSequence.
+    percentiles (iterable): Percentiles to report, between 0 and 100.
+    bins (int): Number of histogram bins to report.
+
+    Returns:
+    dict: "samples" (valid draws), "invalid" (draws with no valid trajectory,
+    such as a negative height), "cep" and "r90" (radii around the mean impact
+    point holding 50% and 90% of the impacts), and one report per key in
+    RESULT_KEYS with "mean", "std", "min", "max", "percentiles" and
+    "histogram". Percentiles and radii are read from a histogram with
+    FINE_BINS bins and are accurate to about one bin width.
+    """
+    if samples < 1 or chunk_size < 1:
+        raise ValueError("samples and chunk_size must be at least 1")
+    specs = (velocity, angle, height, gravity)
+    sizes = [chunk_size] * (samples // chunk_size)
+    if samples % chunk_size:
+        sizes.append(samples % chunk_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+    # The first chunk fixes the histogram ranges for all the others.
+    results, invalid = _simulate_chunk(specs, seeds[0], sizes[0])
+    if not len(results["horizontal_range"]):
+        raise ValueError("No valid trajectories in the first chunk of draws")
+    ranges = {key: _bin_range(results[key]) for key in RESULT_KEYS}
+    summaries = {key: _Summary(*ranges[key]) for key in RESULT_KEYS}
+    for key in RESULT_KEYS:
+        summaries[key].add(results[key])
+    del results
+
+    def collect(chunk):
+        nonlocal invalid
+        chunk_summaries, chunk_invalid = chunk
+        for key in RESULT_KEYS:
+            summaries[key].merge(chunk_summaries[key])
+        invalid += chunk_invalid
+
+    jobs = zip(seeds[1:], sizes[1:])
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for chunk_seed, size in jobs:
+            collect(_summarize_chunk(specs, chunk_seed, size, ranges))
+    else:
+        pending = deque()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for chunk_seed, size in jobs:
+                pending.append(
+                    executor.submit(_summarize_chunk, specs, chunk_seed, size, ranges)
+                )
+                if len(pending) >= workers * 2:
+                    collect(pending.popleft().result())
+            while pending:
+                collect(pending.popleft().result())
+
+    report = {
+        "samples": summaries["horizontal_range"].count,
+        "invalid": invalid,
+        "cep": _dispersion_radius(summaries["horizontal_range"], 0.5),
+        "r90": _dispersion_radius(summaries["horizontal_range"], 0.9),
+    }
+    for key in RESULT_KEYS:
+        report[key] = summaries[key].report(percentiles, bins)
+    return report
@@ -1,6 +1,14 @@
+import argparse
+import csv
+import json
 import math
-import turtle
+import os
+import sys
 import time
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
 
 LOGO = r"""
                      ________           ________________                           __________              
@@ -11,6 +19,35 @@ _  .___//_/    \____/___  /  \___/\___/ \__/ /_/  /_/  \___/______/_/ /_/ /_/\__
 /_/                  /___/                                 _/_____/                                        
 """
 
+# turtle needs tkinter, which headless machines often lack, so it is only
+# imported once something is animated.
+turtle = None
+
+
+def _load_turtle():
+    global turtle
+    if turtle is None:
+        import turtle as turtle_module
+
+        turtle = turtle_module
+    return turtle
+
+
+FRAME_INTERVAL = 1 / 30  # seconds between animation frames
+INFO_INTERVAL = 0.1  # seconds between info text redraws
+MAX_PLAYBACK_DURATION = 10  # longer flights are played back faster
+PROGRESS_INTERVAL = 1.0  # seconds between batch progress reports
+
+SCENARIO_FIELDS = ["velocity", "angle", "height", "gravity"]
+RESULT_FIELDS = SCENARIO_FIELDS + [
+    "flight_time",
+    "max_height",
+    "horizontal_range",
+    "impact_velocity",
+    "impact_angle",
+    "error",
+]
+
 
 def calculate_projectile_motion(velocity, angle, height=0, gravity=9.81):
     g = gravity  # acceleration due to gravity (m/s^2)
@@ -51,6 +88,73 @@ def calculate_projectile_motion(velocity, angle, height=0, gravity=9.81):
     )
 
 
+def sample_trajectory(
+    velocity, angle, height=0, gravity=9.81, max_turn=2.0, max_segment=None
+):
+    """
+    Precompute the whole path of a projectile, with more samples where the
+    path curves most.
+
+    Consecutive samples are placed so the direction of flight turns by at most
+    max_turn degrees and the projectile moves at most max_segment metres
+    between them. The apex and the impact point are always sampled.
+
+    Parameters:
+    velocity (float): Initial velocity (m/s).
+    angle (float): Launch angle (degrees).
+    height (float): Initial height (m).
+    gravity (float): Acceleration due to gravity (m/s^2).
+    max_turn (float): Largest change of direction between samples (degrees).
+    max_segment (float): Longest distance between samples (m). Defaults to a
+    hundredth of the extent of the path.
+
+    Returns:
+    dict: Lists "time", "x", "y" and "velocity" with one entry per sample.
+    """
+    velocity_x, velocity_y, flight_time, _ = calculate_projectile_motion(
+        velocity, angle, height, gravity
+    )
+    g = gravity
+    flight_time = max(flight_time, 0)
+    apex_time = velocity_y / g
+
+    if max_segment is None:
+        max_height = height + max(velocity_y, 0) ** 2 / (2 * g)
+        extent = abs(velocity_x) * flight_time + 2 * max_height - height
+        max_segment = max(extent, 1e-9) / 100
+    max_turn_rad = math.radians(max_turn)
+    # Bounds the step where the path is straight and the projectile is at rest.
+    max_step = flight_time / 20
+    min_step = flight_time / 10000
+
+    times = [0.0]
+    t = 0.0
+    while t < flight_time:
+        current_velocity_y = velocity_y - g * t
+        speed = math.hypot(velocity_x, current_velocity_y)
+        step = max_step
+        if speed:
+            step = min(step, max_segment / speed)
+        # Step to where the direction of flight has turned by max_turn.
+        heading = math.atan2(current_velocity_y, abs(velocity_x)) - max_turn_rad
+        if heading > -math.pi / 2:
+            turn_time = (current_velocity_y - abs(velocity_x) * math.tan(heading)) / g
+            step = min(step, turn_time)
+        step = max(step, min_step)
+        if t < apex_time < t + step:
+            step = apex_time - t
+        t = min(t + step, flight_time)
+        times.append(t)
+
+    samples = {"time": times, "x": [], "y": [], "velocity": []}
+    for t in times:
+        current_velocity_y = velocity_y - g * t
+        samples["x"].append(velocity_x * t)
+        samples["y"].append(max(height + velocity_y * t - 0.5 * g * t**2, 0))
+        samples["velocity"].append(math.hypot(velocity_x, current_velocity_y))
+    return samples
+
+
 def print_trajectory(trajectory_data):
     """
     Print the projectile motion summary in a formatted way.
@@ -66,126 +170,529 @@ def print_trajectory(trajectory_data):
     print(f"Impact angle: {trajectory_data['impact_angle']} degrees")
 
 
+class _Track:
+    """
+    One projectile in a Scene: its precomputed path and its turtles.
+    """
+
+    def __init__(self, velocity, angle, height, gravity, color):
+        self.velocity = velocity
+        self.angle = angle
+        self.height = height
+        self.gravity = gravity
+        velocity_x, velocity_y, flight_time, self.trajectory_data = (
+            calculate_projectile_motion(velocity, angle, height, gravity)
+        )
+        self.flight_time = max(flight_time, 0)
+        self.apex_time = velocity_y / gravity
+        self.samples = sample_trajectory(velocity, angle, height, gravity)
+        self.color = color
+        self.drawn = 1
+        self.max_height_reached = self.apex_time <= 0
+
+    def start(self):
+        turtle = _load_turtle()
+        self.projectile = turtle.Turtle()
+        self.projectile.shape("circle")
+        self.projectile.color(self.color)
+        self.projectile.penup()
+        self.projectile.goto(-300, self.height - 250)
+        self.projectile.pendown()
+
+        self.max_height_marker = turtle.Turtle()
+        self.max_height_marker.hideturtle()
+        self.max_height_marker.shape("triangle")
+        self.max_height_marker.color("green")
+
+    @property
+    def done(self):
+        return self.drawn >= len(self.samples["time"])
+
+    @property
+    def current(self):
+        """Index of the last sample drawn."""
+        return self.drawn - 1
+
+    def advance(self, t):
+        """
+        Draw the path up to time t and move the projectile there.
+        """
+        samples = self.samples
+        times = samples["time"]
+        due = bisect_right(times, t)
+        for i in range(self.drawn, due):
+            x, y = samples["x"][i], samples["y"][i]
+            self.projectile.goto(-300 + x, y - 250)
+
+            # Mark the maximum height point
+            if not self.max_height_reached and times[i] >= self.apex_time:
+                self.max_height_marker.penup()
+                self.max_height_marker.goto(-300 + x, y - 250)
+                self.max_height_marker.showturtle()
+                self.max_height_reached = True
+        self.drawn = max(self.drawn, due)
+
+        if not self.done:
+            # The path is straight between samples, so interpolate to t.
+            i, j = self.current, self.drawn
+            fraction = (t - times[i]) / (times[j] - times[i])
+            x = samples["x"][i] + fraction * (samples["x"][j] - samples["x"][i])
+            y = samples["y"][i] + fraction * (samples["y"][j] - samples["y"][i])
+            self.projectile.goto(-300 + x, y - 250)
+
+
+class Scene:
+    """
+    A turtle window that animates any number of projectiles on one timeline.
+
+    The screen, ground and height lines are set up once, every frame moves all
+    projectiles before a single screen.update(), and the info text is only
+    redrawn when it changes.
+
+    Parameters:
+    screen (turtle.Screen): Screen to draw on, a new one by default.
+    """
+
+    COLORS = ["red", "blue", "orange", "purple", "brown", "magenta", "teal", "olive"]
+
+    def __init__(self, screen=None):
+        turtle = _load_turtle()
+        self.screen = screen or turtle.Screen()
+        self.screen.setup(width=1200, height=800)
+        self.screen.title("Projectile Motion Animation")
+        self.screen.setworldcoordinates(-400, -400, 1000, 500)
+        self.screen.tracer(0)
+        self.tracks = []
+        self._heights = set()
+        self._info_text = None
+
+        ground = turtle.Turtle()
+        ground.hideturtle()
+        ground.penup()
+        ground.goto(-400, -250)
+        ground.pendown()
+        ground.forward(1400)
+
+        self.info = turtle.Turtle()
+        self.info.hideturtle()
+        self.info.penup()
+        self.info.goto(-400, -310)
+        self.info.color("blue")
+
+    def add(self, velocity, angle, height=0, gravity=9.81, color=None):
+        """
+        Add a projectile to the scene.
+
+        Parameters:
+        velocity (float): Initial velocity (m/s).
+        angle (float): Launch angle (degrees).
+        height (float): Initial height (m).
+        gravity (float): Acceleration due to gravity (m/s^2).
+        color (str): Turtle color, picked from COLORS by default.
+
+        Returns:
+        dict: The projectile motion summary.
+        """
+        turtle = _load_turtle()
+        color = color or self.COLORS[len(self.tracks) % len(self.COLORS)]
+        track = _Track(velocity, angle, height, gravity, color)
+        self.tracks.append(track)
+
+        if height > 0 and height not in self._heights:
+            self._heights.add(height)
+            height_line = turtle.Turtle()
+            height_line.hideturtle()
+            height_line.penup()
+            height_line.goto(-300, -250)
+            height_line.pendown()
+            height_line.left(90)
+            height_line.forward(height)
+        return track.trajectory_data
+
+    def _write_info(self, text):
+        if text != self._info_text:
+            self.info.clear()
+            self.info.write(text, font=("Arial", 15, "normal"))
+            self._info_text = text
+
+    def _launch_text(self):
+        if len(self.tracks) == 1:
+            track = self.tracks[0]
+            return (
+                f"Initial velocity: {track.velocity} m/s    Angle: {track.angle} degrees    "
+                f"Height: {track.height} m    Gravity: {track.gravity} m/s^2"
+            )
+        return f"{len(self.tracks)} projectiles"
+
+    def _progress_text(self, t):
+        if len(self.tracks) == 1:
+            track = self.tracks[0]
+            i = track.current
+            samples = track.samples
+            return (
+                f"Time: {samples['time'][i]:.2f} s    Height: {samples['y'][i]:.2f} m    "
+                f"Velocity: {samples['velocity'][i]:.2f} m/s\n{self._launch_text()}"
+            )
+        flying = sum(not track.done for track in self.tracks)
+        return f"Time: {t:.2f} s    In flight: {flying} of {len(self.tracks)}"
+
+    def _summary_text(self):
+        if len(self.tracks) == 1:
+            data = self.tracks[0].trajectory_data
+            return (
+                f"Flight time: {data['flight_time']} s    "
+                f"Max height: {data['max_height']} m    "
+                f"Range: {data['horizontal_range']} m    "
+                f"Impact velocity: {data['impact_velocity']} m/s    "
+                f"Impact angle: {data['impact_angle']} degrees"
+            )
+        longest = max(
+            self.tracks, key=lambda track: track.trajectory_data["horizontal_range"]
+        )
+        return (
+            f"Longest range: {longest.trajectory_data['horizontal_range']} m "
+            f"at {longest.angle} degrees and {longest.velocity} m/s"
+        )
+
+    def play(self, speed=None):
+        """
+        Animate all projectiles until the last one lands.
+
+        Frames are timed against the clock, so slow frames are caught up on
+        rather than stretching the playback.
+
+        Parameters:
+        speed (float): Simulated seconds per real second. By default flights
+        longer than MAX_PLAYBACK_DURATION are sped up to fit into it.
+        """
+        end = max((track.flight_time for track in self.tracks), default=0)
+        if speed is None:
+            speed = max(1, end / MAX_PLAYBACK_DURATION)
+        for track in self.tracks:
+            track.start()
+        self._write_info(self._launch_text())
+
+        start = time.perf_counter()
+        next_info = start
+        while not all(track.done for track in self.tracks):
+            now = time.perf_counter()
+            t = min((now - start) * speed, end)
+            for track in self.tracks:
+                if not track.done:
+                    track.advance(t)
+
+            if now >= next_info:
+                self._write_info(self._progress_text(t))
+                next_info = now + INFO_INTERVAL
+
+            self.screen.update()
+            time.sleep(max(0, now + FRAME_INTERVAL - time.perf_counter()))
+
+        # Display summary after animation
+        self._write_info(self._summary_text())
+        self.screen.update()
+
+    def run(self, key="s"):
+        """
+        Wait for a key press, play the animation and keep the window open.
+
+        Parameters:
+        key (str): Key that starts the animation.
+        """
+        turtle = _load_turtle()
+        start_button = turtle.Turtle()
+        start_button.hideturtle()
+        start_button.penup()
+        start_button.goto(0, 200)
+        start_button.write(
+            f"Press '{key}' to Start Animation",
+            align="center",
+            font=("Arial", 20, "bold"),
+        )
+        self.screen.update()
+
+        def start_animation():
+            start_button.clear()
+            self.play()
+
+        self.screen.listen()
+        self.screen.onkey(start_animation, key)
+        self.screen.mainloop()
+
+
+def animate_projectiles(launches):
+    """
+    Animate several projectiles side by side in one window.
+
+    Parameters:
+    launches (iterable): (velocity, angle, height, gravity) tuples; height and
+    gravity may be left out.
+    """
+    scene = Scene()
+    for launch in launches:
+        scene.add(*launch)
+    scene.run()
+
+
 def animate_projectile_motion(velocity, angle, height=0, gravity=9.81):
-    velocity_x, velocity_y, flight_time, trajectory_data = calculate_projectile_motion(
-        velocity, angle, height, gravity
-    )
-    g = gravity
+    scene = Scene()
+    trajectory_data = scene.add(velocity, angle, height, gravity)
 
     # Print trajectory summary before animation
     print_trajectory(trajectory_data)
 
-    # Setup turtle
-    screen = turtle.Screen()
-    screen.setup(width=1200, height=800)
-    screen.title("Projectile Motion Animation")
-    screen.setworldcoordinates(-400, -400, 1000, 500)
-    screen.tracer(0)
-    start_button = turtle.Turtle()
-    start_button.hideturtle()
-    start_button.penup()
-    start_button.goto(0, 200)
-    start_button.write(
-        "Press 's' to Start Animation", align="center", font=("Arial", 20, "bold")
-    )
-
-    def run_animation():
-        t = 0
-        max_height_reached = False
-        projectile = turtle.Turtle()
-        projectile.shape("circle")
-        projectile.color("red")
-        projectile.penup()
-        projectile.goto(-300, height - 250)
-        projectile.pendown()
-
-        info = turtle.Turtle()
-        info.hideturtle()
-        info.penup()
-        info.goto(-400, -310)
-        info.color("blue")
-        info.write(
-            f"Initial velocity: {velocity} m/s    Angle: {angle} degrees    Height: {height} m    Gravity: {gravity} m/s^2",
-            font=("Arial", 15, "normal"),
-        )
+    scene.run()
 
-        max_height_marker = turtle.Turtle()
-        max_height_marker.hideturtle()
-        max_height_marker.shape("triangle")
-        max_height_marker.color("green")
 
-        while t <= flight_time:
-            # Update position
-            x = velocity_x * t
-            y = height + velocity_y * t - 0.5 * g * t**2
+def read_scenarios(input_file, input_format="jsonl"):
+    """
+    Read launch scenarios from a CSV file with a header row or from JSON Lines.
 
-            if y < 0:
-                break
+    JSON lines are passed on unparsed so they are decoded by the batch workers.
+    Blank lines and lines starting with '#' are skipped.
 
-            # Update projectile position
-            projectile.goto(-300 + x, y - 250)
+    Parameters:
+    input_file (file): Text file object to read from.
+    input_format (str): Either 'jsonl' or 'csv'.
 
-            # Mark the maximum height point
-            if not max_height_reached and y >= trajectory_data["max_height"]:
-                max_height_marker.penup()
-                max_height_marker.goto(-300 + x, y - 250)
-                max_height_marker.showturtle()
-                max_height_reached = True
-
-            # Update info text
-            current_velocity_y = velocity_y - g * t
-            current_velocity = math.sqrt(velocity_x**2 + current_velocity_y**2)
-            info.clear()
-            info.write(
-                f"Time: {t:.2f} s    Height: {y:.2f} m    Velocity: {current_velocity:.2f} m/s\n"
-                f"Initial velocity: {velocity} m/s    Angle: {angle} degrees    Height: {height} m    Gravity: {gravity} m/s^2",
-                font=("Arial", 15, "normal"),
-            )
+    Returns:
+    iterator: Scenario dicts (CSV) or JSON strings (JSON Lines).
+    """
+    if input_format == "csv":
+        return csv.DictReader(input_file)
+    if input_format == "jsonl":
+        return (
+            line.strip()
+            for line in input_file
+            if line.strip() and not line.lstrip().startswith("#")
+        )
+    raise ValueError(f"Unsupported input format: {input_format}")
+
+
+def _parse_scenario(scenario):
+    try:
+        velocity = float(scenario["velocity"])
+        angle = float(scenario["angle"])
+        # Empty CSV cells and JSON nulls fall back to the defaults, but an
+        # explicit 0 is kept so that a gravity of 0 is rejected below.
+        height = scenario.get("height")
+        height = 0.0 if height in (None, "") else float(height)
+        gravity = scenario.get("gravity")
+        gravity = 9.81 if gravity in (None, "") else float(gravity)
+    except KeyError as e:
+        raise ValueError(f"Missing field: {e.args[0]}")
+    except TypeError as e:
+        raise ValueError(str(e))
+    if not all(map(math.isfinite, (velocity, angle, height, gravity))):
+        raise ValueError("Scenario values must be finite")
+    if gravity <= 0:
+        raise ValueError("Gravity must be positive")
+    if height < 0:
+        raise ValueError("Height must not be negative")
+    return velocity, angle, height, gravity
+
+
+def scenario_result(scenario):
+    """
+    Solve one scenario, turning bad input into an error record.
 
-            screen.update()
-            time.sleep(0.05)
-            t += 0.05
+    Parameters:
+    scenario (dict or str): Scenario with "velocity", "angle" and optional
+    "height" and "gravity" keys, or the same as a JSON object.
 
-        # Display summary after animation
-        info.clear()
-        info.write(
-            f"Flight time: {trajectory_data['flight_time']} s    "
-            f"Max height: {trajectory_data['max_height']} m    "
-            f"Range: {trajectory_data['horizontal_range']} m    "
-            f"Impact velocity: {trajectory_data['impact_velocity']} m/s    "
-            f"Impact angle: {trajectory_data['impact_angle']} degrees",
-            font=("Arial", 15, "normal"),
+    Returns:
+    dict: The scenario values and the rounded summary, keyed by RESULT_FIELDS.
+    For bad input, the scenario values as given and an "error" message.
+    """
+    if isinstance(scenario, str):
+        try:
+            scenario = json.loads(scenario)
+        except ValueError as e:
+            return {"error": f"Invalid JSON: {e}"}
+    if not isinstance(scenario, dict):
+        return {"error": "Scenario must be a JSON object"}
+
+    try:
+        velocity, angle, height, gravity = _parse_scenario(scenario)
+        _, _, _, trajectory_data = calculate_projectile_motion(
+            velocity, angle, height, gravity
         )
+    except (ValueError, OverflowError) as e:
+        # Extreme values such as a velocity of 1e200 overflow a float.
+        record = {key: scenario[key] for key in SCENARIO_FIELDS if key in scenario}
+        record["error"] = str(e) if isinstance(e, ValueError) else "Result out of range"
+        return record
+    if not all(map(math.isfinite, trajectory_data.values())):
+        record = {key: scenario[key] for key in SCENARIO_FIELDS if key in scenario}
+        record["error"] = "Result out of range"
+        return record
 
-    def start_animation():
-        start_button.clear()
-        run_animation()
+    record = dict(zip(SCENARIO_FIELDS, (velocity, angle, height, gravity)))
+    record.update(trajectory_data)
+    return record
 
-    screen.listen()
-    screen.onkey(start_animation, "s")
 
-    ground = turtle.Turtle()
-    ground.hideturtle()
-    ground.penup()
-    ground.goto(-400, -250)
-    ground.pendown()
-    ground.forward(1400)
+def _solve_chunk(chunk):
+    return [scenario_result(scenario) for scenario in chunk]
 
-    if height > 0:
-        height_line = turtle.Turtle()
-        height_line.hideturtle()
-        height_line.penup()
-        height_line.goto(-300, -250)
-        height_line.pendown()
-        height_line.left(90)
-        height_line.forward(height)
 
-    screen.mainloop()
+def _chunked(iterable, chunk_size):
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
 
 
-if __name__ == "__main__":
+def solve_scenarios_parallel(scenarios, workers=None, chunk_size=1000):
+    """
+    Solve scenarios on a process pool, preserving input order.
+
+    At most two chunks per worker are in flight at any time, so arbitrarily
+    long inputs are processed with bounded memory.
+
+    Parameters:
+    scenarios (iterable): Scenarios as accepted by scenario_result.
+    workers (int): Number of worker processes (default: CPU count).
+    chunk_size (int): Number of scenarios sent to a worker at once.
+
+    Returns:
+    iterator: One result record per scenario, in input order.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        yield from map(scenario_result, scenarios)
+        return
+
+    max_pending = workers * 2
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk in _chunked(scenarios, chunk_size):
+            pending.append(executor.submit(_solve_chunk, chunk))
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def _finite_values(record):
+    if all(
+        not isinstance(value, float) or math.isfinite(value)
+        for value in record.values()
+    ):
+        return record
+    return {
+        key: None if isinstance(value, float) and not math.isfinite(value) else value
+        for key, value in record.items()
+    }
+
+
+def write_results(results, output, output_format="jsonl", progress=None):
+    """
+    Stream result records to an open text file as JSON Lines or CSV.
+    NaN and infinite values, which JSON cannot represent, are written as
+    null (an empty cell in CSV).
+
+    Parameters:
+    results (iterable): Records produced by scenario_result.
+    output (file): A writable text file object.
+    output_format (str): Either 'jsonl' or 'csv'.
+    progress (file): Where to report progress and throughput, or None.
+
+    Returns:
+    int: The number of records written.
+    """
+    if output_format == "csv":
+        writer = csv.DictWriter(output, fieldnames=RESULT_FIELDS, extrasaction="ignore")
+        writer.writeheader()
+
+        def write(record):
+            writer.writerow(_finite_values(record))
+
+    elif output_format == "jsonl":
+
+        def write(record):
+            output.write(json.dumps(_finite_values(record), allow_nan=False) + "\n")
+
+    else:
+        raise ValueError(f"Unsupported output format: {output_format}")
+
+    start = time.perf_counter()
+    next_report = start + PROGRESS_INTERVAL
+    count = 0
+    for record in results:
+        write(record)
+        count += 1
+        if progress and count % 1000 == 0 and time.perf_counter() >= next_report:
+            elapsed = time.perf_counter() - start
+            progress.write(f"\rProcessed {count} scenarios ({count / elapsed:.0f}/s)")
+            progress.flush()
+            next_report += PROGRESS_INTERVAL
+    if progress:
+        elapsed = time.perf_counter() - start
+        progress.write(
+            f"\rProcessed {count} scenarios in {elapsed:.2f} s "
+            f"({count / elapsed if elapsed else 0:.0f}/s)\n"
+        )
+    return count
+
+
+def run_batch(
+    input_path,
+    output_path=None,
+    input_format=None,
+    output_format="jsonl",
+    workers=1,
+    chunk_size=1000,
+    progress=True,
+):
+    """
+    Solve a CSV or JSON Lines file of scenarios with constant memory.
+
+    Parameters:
+    input_path (str): Path to the input file, or '-' for stdin.
+    output_path (str): Path to the output file, or None for stdout.
+    input_format (str): 'jsonl' or 'csv'; guessed from the file extension
+    when None.
+    output_format (str): Either 'jsonl' or 'csv'.
+    workers (int): Number of worker processes; 1 runs in-process.
+    chunk_size (int): Number of scenarios sent to a worker at once.
+    progress (bool): Whether to report progress and throughput on stderr.
+
+    Returns:
+    int: The number of records written.
+    """
+    if input_format is None:
+        input_format = "csv" if input_path.lower().endswith(".csv") else "jsonl"
+    with ExitStack() as stack:
+        input_file = (
+            sys.stdin
+            if input_path == "-"
+            else stack.enter_context(open(input_path, "r", newline=""))
+        )
+        output_file = (
+            sys.stdout
+            if output_path is None
+            else stack.enter_context(open(output_path, "w", newline=""))
+        )
+        results = solve_scenarios_parallel(
+            read_scenarios(input_file, input_format), workers, chunk_size
+        )
+        return write_results(
+            results, output_file, output_format, sys.stderr if progress else None
+        )
+
+
+def interactive():
+    """
+    Prompt for the launch parameters and show the results.
+    """
     print(LOGO)
-    # Example usage
     initial_velocity = float(input("Enter the initial velocity (m/s): "))
     launch_angle = float(input("Enter the launch angle (degrees): "))
     initial_height = float(
@@ -208,3 +715,115 @@ if __name__ == "__main__":
             initial_velocity, launch_angle, initial_height, gravity
         )
         print_trajectory(trajectory_data)
+
+
+def main(argv=None):
+    """
+    Parse the command line. Without a subcommand the script prompts for input.
+    """
+    parser = argparse.ArgumentParser(
+        description="Calculate and simulate projectile motion.",
+        epilog="Example usage: python projectile_motion.py run --velocity 20 --angle 45",
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    run = subparsers.add_parser("run", help="Calculate a single launch.")
+    run.add_argument("--velocity", type=float, required=True, help="Velocity (m/s).")
+    run.add_argument(
+        "--angle",
+        type=float,
+        nargs="+",
+        required=True,
+        help="Angle (degrees). Several angles are compared side by side.",
+    )
+    run.add_argument("--height", type=float, default=0, help="Height (m).")
+    run.add_argument(
+        "--gravity", type=float, default=9.81, help="Gravity (m/s^2, default: 9.81)."
+    )
+    output = run.add_mutually_exclusive_group()
+    output.add_argument(
+        "--animate", action="store_true", help="Show the turtle animation."
+    )
+    output.add_argument(
+        "--json", action="store_true", help="Print the summary as JSON."
+    )
+
+    batch = subparsers.add_parser(
+        "batch", help="Calculate every scenario in a CSV or JSON Lines file."
+    )
+    batch.add_argument("input", help="Scenario file ('-' for stdin).")
+    batch.add_argument(
+        "--input-format",
+        choices=["jsonl", "csv"],
+        help="Format of the scenario file (default: from the extension).",
+    )
+    batch.add_argument(
+        "--format",
+        choices=["jsonl", "csv"],
+        default="jsonl",
+        help="Output format (default: jsonl).",
+    )
+    batch.add_argument(
+        "--output", metavar="FILE", help="Write results to FILE instead of stdout."
+    )
+    batch.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes (0 for all CPUs).",
+    )
+    batch.add_argument(
+        "--chunk-size",
+        type=int,
+        default=1000,
+        help="Number of scenarios per worker task (default: 1000).",
+    )
+    batch.add_argument(
+        "--quiet", action="store_true", help="Do not report progress on stderr."
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        try:
+            _parse_scenario(dict(vars(args), angle=args.angle[0]))
+        except ValueError as e:
+            parser.error(str(e))
+        if args.animate and len(args.angle) == 1:
+            animate_projectile_motion(
+                args.velocity, args.angle[0], args.height, args.gravity
+            )
+            return
+        if args.animate:
+            animate_projectiles(
+                (args.velocity, angle, args.height, args.gravity)
+                for angle in args.angle
+            )
+            return
+        for angle in args.angle:
+            try:
+                _, _, _, trajectory_data = calculate_projectile_motion(
+                    args.velocity, angle, args.height, args.gravity
+                )
+            except OverflowError:
+                parser.error("Result out of range")
+            if args.json:
+                print(json.dumps(trajectory_data))
+            else:
+                print_trajectory(trajectory_data)
+    elif args.command == "batch":
+        run_batch(
+            args.input,
+            args.output,
+            args.input_format,
+            args.format,
+            args.workers or None,
+            args.chunk_size,
+            not args.quiet,
+        )
+    else:
+        interactive()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+NumPy-backed batch counterpart of projectile_motion.calculate_projectile_motion.
+
+Solves many (velocity, angle, height, gravity) combinations at once and keeps
+the results unrounded; rounding only happens in to_summaries for display.
+"""
+
+import numpy as np
+
+RESULT_KEYS = [
+    "flight_time",
+    "max_height",
+    "horizontal_range",
+    "impact_velocity",
+    "impact_angle",
+]
+
+
+def solve_trajectories(velocity, angle, height=0.0, gravity=9.81):
+    """
+    Calculates vacuum projectile motion for arrays of launch parameters.
+
+    The arguments are broadcast against each other, so any of them may be a
+    scalar. Unlike the scalar function, a launch from the ground with a
+    negative angle has a flight time of 0 rather than a negative one.
+
+    Parameters:
+    velocity (array-like): Initial velocities (m/s).
+    angle (array-like): Launch angles (degrees).
+    height (array-like): Initial heights (m).
+    gravity (array-like): Accelerations due to gravity (m/s^2).
+
+    Returns:
+    dict: Float64 arrays for "velocity_x", "velocity_y" and every key in
+    RESULT_KEYS, all with the broadcast shape of the inputs.
+    """
+    velocity, angle, height, gravity = np.broadcast_arrays(
+        *(
+            np.asarray(value, dtype=np.float64)
+            for value in (velocity, angle, height, gravity)
+        )
+    )
+    angle_rad = np.radians(angle)
+
+    velocity_x = velocity * np.cos(angle_rad)
+    velocity_y = velocity * np.sin(angle_rad)
+
+    flight_time = (velocity_y + np.sqrt(velocity_y**2 + 2 * gravity * height)) / gravity
+    max_height = height + velocity_y**2 / (2 * gravity)
+    horizontal_range = velocity_x * flight_time
+
+    impact_velocity_y = velocity_y - gravity * flight_time
+    impact_velocity = np.hypot(velocity_x, impact_velocity_y)
+    impact_angle = np.degrees(np.arctan2(impact_velocity_y, velocity_x))
+
+    return {
+        "velocity_x": velocity_x,
+        "velocity_y": velocity_y,
+        "flight_time": flight_time,
+        "max_height": max_height,
+        "horizontal_range": horizontal_range,
+        "impact_velocity": impact_velocity,
+        "impact_angle": impact_angle,
+    }
+
+
+def parameter_grid(velocities, angles, heights=(0.0,), gravities=(9.81,)):
+    """
+    Builds the Cartesian product of launch parameters as flat arrays.
+
+    Parameters:
+    velocities (array-like): Initial velocities (m/s).
+    angles (array-like): Launch angles (degrees).
+    heights (array-like): Initial heights (m).
+    gravities (array-like): Accelerations due to gravity (m/s^2).
+
+    Returns:
+    dict: Flat arrays "velocity", "angle", "height" and "gravity" with one
+    element per combination, velocity varying slowest.
+    """
+    grids = np.meshgrid(
+        np.asarray(velocities, dtype=np.float64),
+        np.asarray(angles, dtype=np.float64),
+        np.asarray(heights, dtype=np.float64),
+        np.asarray(gravities, dtype=np.float64),
+        indexing="ij",
+    )
+    return dict(
+        zip(("velocity", "angle", "height", "gravity"), (g.ravel() for g in grids))
+    )
+
+
+def solve_grid(velocities, angles, heights=(0.0,), gravities=(9.81,)):
+    """
+    Solves every combination of the given launch parameters.
+
+    Parameters:
+    velocities (array-like): Initial velocities (m/s).
+    angles (array-like): Launch angles (degrees).
+    heights (array-like): Initial heights (m).
+    gravities (array-like): Accelerations due to gravity (m/s^2).
+
+    Returns:
+    dict: The flat parameter arrays from parameter_grid merged with the result
+    arrays from solve_trajectories.
+    """
+    params = parameter_grid(velocities, angles, heights, gravities)
+    results = solve_trajectories(**params)
+    return {**params, **results}
+
+
+def to_summaries(results, decimals=2):
+    """
+    Rounds batch results into the summary dicts of calculate_projectile_motion.
+
+    Parameters:
+    results (dict): Arrays returned by solve_trajectories or solve_grid.
+    decimals (int): Number of decimals to round to.
+
+    Yields:
+    dict: One summary per element, in flattened order.
+    """
+    columns = [
+        np.round(np.ravel(results[key]), decimals).tolist() for key in RESULT_KEYS
+    ]
+    for values in zip(*columns):
+        yield dict(zip(RESULT_KEYS, values))
@@ -0,0 +1,85 @@
+import unittest
+
+from unit_converter.dimensions import (
+    conversion_factor,
+    convert,
+    dimensions_of,
+    is_compatible,
+    parse_unit,
+)
+
+
+class TestDimensions(unittest.TestCase):
+
+    def test_compound_conversions(self):
+        self.assertAlmostEqual(convert(1, "kg*m/s^2", "N"), 1)
+        self.assertAlmostEqual(convert(15, "kWh/100km", "J/m"), 540)
+        self.assertAlmostEqual(convert(1, "lbf/in^2", "kPa"), 6.894757, places=6)
+        self.assertAlmostEqual(convert(1, "psi", "lbf/in²"), 1)
+        self.assertAlmostEqual(convert(60, "mph", "km/h"), 96.56064)
+        self.assertAlmostEqual(convert(1, "J/mol K", "J/(mol*K)"), 1)
+        self.assertAlmostEqual(convert(2, "m^-1", "1/km"), 2000)
+
+    def test_prefixes(self):
+        self.assertEqual(convert(1, "µs", "ns"), 1000)
+        self.assertEqual(convert(1, "km^2", "m**2"), 1e6)
+        self.assertEqual(convert(1, "hPa", "mbar"), 1)
+        self.assertEqual(convert(1, "dam", "m"), 10)
+        # Exact unit names win over prefixed readings.
+        self.assertEqual(convert(1, "min", "s"), 60)
+        self.assertEqual(dimensions_of("cd"), "luminosity")
+        self.assertEqual(dimensions_of("ft"), "length")
+
+    def test_dimensions(self):
+        self.assertEqual(parse_unit("kWh").dimensions, (2, 1, -2, 0, 0, 0, 0))
+        self.assertEqual(dimensions_of("N"), "length*mass/time^2")
+        self.assertEqual(dimensions_of("m/km"), "dimensionless")
+        self.assertTrue(is_compatible("kWh/100km", "N"))
+        self.assertFalse(is_compatible("L/100km", "mi/gal"))
+        with self.assertRaisesRegex(ValueError, "Incompatible units"):
+            convert(1, "m", "s")
+
+    def test_temperature_offsets(self):
+        self.assertEqual(convert(1, "degC", "degF"), 33.8)
+        self.assertEqual(convert(0, "°C", "K"), 273.15)
+        self.assertEqual(convert(1, "K", "mK"), 1000)
+        with self.assertRaisesRegex(ValueError, "offset"):
+            convert(1, "degC/s", "K/s")
+
+    def test_syntax_errors(self):
+        for text in ["", "m/", "(m", "kg**", "m^1.5", "foo", "m$"]:
+            with self.assertRaises(ValueError, msg=text):
+                parse_unit(text)
+
+    def test_zero_and_large_factors(self):
+        for text in [
+            "0 m",
+            "0^-1",
+            "m/0",
+            "0",
+            "km^99999999",
+            "((km^64)^64)^64",
+            "1e999999999 m",
+            "1e-999999999 m",
+            "1" * 2000 + " m",
+        ]:
+            with self.assertRaises(ValueError, msg=text):
+                parse_unit(text)
+        with self.assertRaises(ValueError):
+            convert(1, "m", "0 m")
+        self.assertEqual(convert(1, "km^3", "m^3"), 1e9)
+
+    def test_factor_out_of_float_range(self):
+        with self.assertRaisesRegex(ValueError, "out of float range"):
+            conversion_factor("1e400 m", "m")
+        self.assertEqual(convert(1, "1e400 m", "1e399 m"), 10)
+
+    def test_cache(self):
+        conversion_factor.cache_clear()
+        for _ in range(3):
+            convert(1.0, "GWh/yd^3", "J/m^3")
+        self.assertEqual(conversion_factor.cache_info().hits, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+import csv
+import importlib.util
+import io
+import os
+import struct
+import subprocess
+import sys
+import tempfile
+import unittest
+import zlib
+
+import numpy as np
+
+from projectile_motion.export import (
+    COLUMNS,
+    export_trajectories,
+    iter_trajectories,
+    render_png,
+    render_svg,
+    write_csv,
+)
+from projectile_motion.projectile_motion import sample_trajectory
+
+
+class TestExport(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.trajectories = list(iter_trajectories([10, 20, 30], 45, [0, 5, 10]))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def test_iter_trajectories(self):
+        self.assertEqual(len(self.trajectories), 3)
+        self.assertEqual(self.trajectories[1], sample_trajectory(20, 45, 5))
+
+    def test_csv(self):
+        output = io.StringIO()
+        self.assertEqual(write_csv(iter(self.trajectories), output), 3)
+        rows = list(csv.reader(io.StringIO(output.getvalue())))
+        self.assertEqual(rows[0], COLUMNS)
+        self.assertEqual(len(rows) - 1, sum(len(t["time"]) for t in self.trajectories))
+        last = self.trajectories[-1]
+        self.assertEqual(rows[-1], ["2"] + [repr(last[key][-1]) for key in COLUMNS[1:]])
+
+    def test_single_trajectory(self):
+        output = io.StringIO()
+        self.assertEqual(write_csv(self.trajectories[0], output), 1)
+
+    def test_npz(self):
+        path = self.path("trajectories.npz")
+        self.assertEqual(export_trajectories(iter(self.trajectories), path), 3)
+        with np.load(path) as data:
+            self.assertEqual(sorted(data.files), sorted(COLUMNS))
+            for index, trajectory in enumerate(self.trajectories):
+                rows = data["trajectory"] == index
+                for key in COLUMNS[1:]:
+                    np.testing.assert_array_equal(data[key][rows], trajectory[key])
+
+    @unittest.skipUnless(importlib.util.find_spec("pyarrow"), "requires pyarrow")
+    def test_parquet(self):
+        import pyarrow.parquet as pq
+
+        path = self.path("trajectories.parquet")
+        export_trajectories(self.trajectories, path)
+        table = pq.read_table(path)
+        self.assertEqual(table.column_names, COLUMNS)
+        self.assertEqual(table.num_rows, sum(len(t["time"]) for t in self.trajectories))
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            export_trajectories(self.trajectories, self.path("trajectories.txt"))
+
+    def test_svg(self):
+        path = self.path("plot.svg")
+        render_svg(self.trajectories, path)
+        with open(path) as svg:
+            content = svg.read()
+        self.assertTrue(content.startswith("<svg"))
+        self.assertEqual(content.count("<polyline"), 3)
+
+    def test_png(self):
+        path = self.path("plot.png")
+        render_png(self.trajectories, path, width=200, height=100)
+        with open(path, "rb") as png:
+            data = png.read()
+        self.assertEqual(data[:8], b"\x89PNG\r\n\x1a\n")
+        width, height = struct.unpack(">II", data[16:24])
+        self.assertEqual((width, height), (200, 100))
+        length = struct.unpack(">I", data[33:37])[0]
+        self.assertEqual(data[37:41], b"IDAT")
+        pixels = np.frombuffer(zlib.decompress(data[41 : 41 + length]), np.uint8)
+        pixels = pixels.reshape(100, 200 * 3 + 1)[:, 1:].reshape(100, 200, 3)
+        # Some pixels are drawn red, the rest stay white.
+        red = (pixels[..., 0] > pixels[..., 1]).sum()
+        self.assertGreater(red, 100)
+        self.assertTrue((pixels[0] == 255).all())
+
+
+class TestHeadless(unittest.TestCase):
+
+    def test_export_without_turtle(self):
+        # A None entry in sys.modules makes "import turtle" fail like it does
+        # on machines without tkinter.
+        code = (
+            "import sys\n"
+            "sys.modules['turtle'] = None\n"
+            "sys.modules['tkinter'] = None\n"
+            "import io\n"
+            "from projectile_motion.cache import ProjectileCache\n"
+            "from projectile_motion.export import iter_trajectories, write_csv\n"
+            "from projectile_motion.projectile_motion import main\n"
+            "write_csv(iter_trajectories(20, 45), io.StringIO())\n"
+            "ProjectileCache()(20, 45)\n"
+            "main(['run', '--velocity', '20', '--angle', '45', '--json'])\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn("horizontal_range", result.stdout)
+
+
+if __name__ == "__main__":
+    unittest.main()
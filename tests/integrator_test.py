@@ -0,0 +1,128 @@
+import math
+import unittest
+
+import numpy as np
+
+from projectile_motion.integrator import (
+    RESULT_KEYS,
+    ProjectileModel,
+    initial_state,
+    simulate,
+)
+from projectile_motion.trajectory_batch import solve_trajectories
+
+
+class TestIntegrator(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(2)
+        self.velocity = rng.uniform(5, 80, 50)
+        self.angle = rng.uniform(1, 89, 50)
+        self.height = rng.uniform(0, 30, 50)
+
+    def test_vacuum_matches_closed_form(self):
+        expected = solve_trajectories(self.velocity, self.angle, self.height)
+        for method in ("rk4", "rk45"):
+            results = simulate(self.velocity, self.angle, self.height, method=method)
+            for key in RESULT_KEYS[:-1]:
+                np.testing.assert_allclose(
+                    results[key], expected[key], rtol=1e-9, atol=1e-9
+                )
+
+    def test_linear_drag_apex_time(self):
+        # With linear drag vy(t) = (vy0 + g/b) * exp(-b * t) - g/b.
+        b, g = 0.3, 9.81
+        velocity_y = 20 * math.sin(math.radians(45))
+        expected = math.log(1 + b * velocity_y / g) / b
+        model = ProjectileModel(gravity=g, linear_drag=b)
+        for method in ("rk4", "rk45"):
+            results = simulate(20, 45, model=model, method=method)
+            self.assertAlmostEqual(results["apex_time"][0], expected, places=8)
+
+    def test_methods_agree_with_quadratic_drag(self):
+        model = ProjectileModel.from_body(
+            0.145, 0.47, 0.0042, wind=(3.0, 0.0), scale_height=8500
+        )
+        rk4 = simulate(self.velocity, self.angle, self.height, model, "rk4", dt=0.001)
+        rk45 = simulate(self.velocity, self.angle, self.height, model, "rk45")
+        for key in RESULT_KEYS:
+            np.testing.assert_allclose(rk4[key], rk45[key], rtol=1e-6, atol=1e-6)
+
+    def test_drag_and_wind_change_range(self):
+        vacuum = simulate(30, 45)["horizontal_range"][0]
+        drag = simulate(30, 45, model=ProjectileModel(quadratic_drag=0.01))
+        tailwind = simulate(
+            30, 45, model=ProjectileModel(quadratic_drag=0.01, wind=(10.0, 0.0))
+        )
+        self.assertLess(drag["horizontal_range"][0], vacuum)
+        self.assertGreater(tailwind["horizontal_range"][0], drag["horizontal_range"][0])
+
+    def test_thinner_air_at_altitude_reduces_drag(self):
+        sea_level = ProjectileModel(quadratic_drag=0.01)
+        atmosphere = ProjectileModel(quadratic_drag=0.01, scale_height=100)
+        self.assertGreater(
+            simulate(30, 60, model=atmosphere)["horizontal_range"][0],
+            simulate(30, 60, model=sea_level)["horizontal_range"][0],
+        )
+
+    def test_launch_without_climb(self):
+        results = simulate([10, 10], [-5, 0], [0, 5])
+        self.assertEqual(results["flight_time"][0], 0.0)
+        self.assertEqual(results["apex_time"][1], 0.0)
+        self.assertEqual(results["max_height"][1], 5.0)
+        self.assertAlmostEqual(results["flight_time"][1], math.sqrt(2 * 5 / 9.81))
+
+    def test_ground_height(self):
+        results = simulate([20, 5], 45, ground=3.0)
+        velocity_y = 20 * math.sin(math.radians(45))
+        flight_time = (velocity_y + math.sqrt(velocity_y**2 - 2 * 9.81 * 3)) / 9.81
+        self.assertAlmostEqual(results["flight_time"][0], flight_time)
+        # Never gets up to the ground, so lands at the apex.
+        self.assertLess(results["max_height"][1], 3.0)
+        self.assertEqual(results["flight_time"][1], results["apex_time"][1])
+
+    def test_unfinished_flights_are_nan(self):
+        results = simulate([10, 1000], [45, 89], max_time=5)
+        self.assertFalse(np.isnan(results["flight_time"][0]))
+        self.assertTrue(np.isnan(results["flight_time"][1]))
+
+    def test_non_finite_parameters_are_rejected(self):
+        for kwargs in (
+            {"velocity": [np.nan, 20], "angle": [45, 45]},
+            {"velocity": 20, "angle": np.inf},
+            {"velocity": 20, "angle": 45, "height": np.nan},
+            {"velocity": 20, "angle": 45, "model": ProjectileModel(gravity=np.nan)},
+            {"velocity": 20, "angle": 45, "model": ProjectileModel(wind=(np.inf, 0))},
+        ):
+            with self.assertRaises(ValueError, msg=kwargs):
+                simulate(**kwargs)
+
+    def test_overflowing_flight_is_dropped(self):
+        model = ProjectileModel(quadratic_drag=1e-3)
+        expected = simulate(20, 45, model=model)["flight_time"][0]
+        for method in ("rk4", "rk45"):
+            with np.errstate(all="ignore"):
+                results = simulate(
+                    [1e200, 20], [45, 45], model=model, method=method, max_time=100
+                )
+            self.assertTrue(np.isnan(results["flight_time"][0]))
+            self.assertAlmostEqual(results["flight_time"][1], expected, places=5)
+
+    def test_record_trajectory(self):
+        for method in ("rk4", "rk45"):
+            results = simulate([10, 20], [45, 30], 1.0, method=method, record=True)
+            steps = len(results["times"])
+            self.assertEqual(results["states"].shape, (steps, 4, 2))
+            np.testing.assert_allclose(
+                results["states"][0], initial_state([10, 20], [45, 30], 1.0)
+            )
+            np.testing.assert_allclose(results["times"][-1], results["flight_time"])
+            np.testing.assert_allclose(results["states"][-1][1], 0.0)
+
+    def test_unknown_method(self):
+        with self.assertRaises(ValueError):
+            simulate(10, 45, method="euler")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+
+import numpy as np
+
+from projectile_motion.integrator import ProjectileModel, simulate
+from projectile_motion.inverse import (
+    launch_angles,
+    launch_angles_with_drag,
+    minimum_velocity,
+    minimum_velocity_with_drag,
+)
+from projectile_motion.trajectory_batch import solve_trajectories
+
+
+class TestInverse(unittest.TestCase):
+
+    def test_launch_angles_hit_target(self):
+        distance = np.array([10.0, 30.0, 5.0])
+        height = np.array([0.0, 0.0, 10.0])
+        low, high = launch_angles(distance, 20, height)
+        self.assertLess(low[2], 0)
+        for angles in (low, high):
+            results = solve_trajectories(20, angles, height)
+            np.testing.assert_allclose(results["horizontal_range"], distance)
+
+    def test_launch_angles_out_of_reach(self):
+        low, high = launch_angles([50, 40], 20, target_height=[0, 5])
+        self.assertTrue(np.isnan(low).all())
+        self.assertTrue(np.isnan(high).all())
+
+    def test_minimum_velocity(self):
+        velocity, angle = minimum_velocity([10.0, 30.0], target_height=[0.0, 5.0])
+        self.assertAlmostEqual(angle[0], 45.0)
+        low, high = launch_angles([10.0, 30.0], velocity, target_height=[0.0, 5.0])
+        np.testing.assert_allclose(low, angle, atol=1e-5)
+        np.testing.assert_allclose(high, angle, atol=1e-5)
+        self.assertTrue(
+            np.isnan(launch_angles(30.0, velocity[1] - 0.01, 0, 9.81, 5)[0])
+        )
+
+    def test_invalid_distance(self):
+        with self.assertRaises(ValueError):
+            launch_angles([10, 0], 20)
+
+    def test_drag_solver_matches_vacuum(self):
+        distance = [10.0, 30.0, 30.0, 60.0]
+        height = [0.0, 0.0, 20.0, 0.0]
+        target_height = [0.0, 5.0, 0.0, 0.0]
+        expected = launch_angles(distance, 20, height, 9.81, target_height)
+        actual = launch_angles_with_drag(
+            distance, 20, height=height, target_height=target_height
+        )
+        for expected_angles, angles in zip(expected, actual):
+            np.testing.assert_allclose(angles, expected_angles, atol=1e-5)
+
+        expected = minimum_velocity(distance, height, 9.81, target_height)
+        actual = minimum_velocity_with_drag(
+            distance, height=height, target_height=target_height
+        )
+        np.testing.assert_allclose(actual[0], expected[0], rtol=1e-5)
+        np.testing.assert_allclose(actual[1], expected[1], atol=1e-2)
+
+    def test_drag_solver_hits_target(self):
+        model = ProjectileModel.from_body(0.145, 0.47, 0.0042, wind=(3.0, 0.0))
+        distance = np.array([20.0, 40.0, 500.0])
+        low, high = launch_angles_with_drag(distance, 30, model)
+        self.assertTrue(np.isnan(low[2]) and np.isnan(high[2]))
+        for angles in (low[:2], high[:2]):
+            results = simulate(30, angles, model=model)
+            np.testing.assert_allclose(results["horizontal_range"], distance[:2])
+
+        velocity, angle = minimum_velocity_with_drag(distance[:2], model)
+        self.assertTrue((velocity > minimum_velocity(distance[:2])[0]).all())
+        results = simulate(velocity, angle, model=model)
+        np.testing.assert_allclose(results["horizontal_range"], distance[:2], rtol=1e-5)
+
+
+if __name__ == "__main__":
+    unittest.main()
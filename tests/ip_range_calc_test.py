@@ -1,6 +1,27 @@
+import asyncio
+import csv
+import io
+import json
+import logging
+import os
+import tempfile
 import unittest
-from ipaddress import IPv4Network
-from ip_range_calc.ip_range_calc import calculate_network_info
+from ipaddress import IPv4Network, IPv6Network
+from unittest import mock
+from ip_range_calc.ip_range_calc import (
+    calculate_network_info,
+    calculate_network_records_parallel,
+    get_network_info,
+    handle_http_request,
+    is_private_network,
+    iter_network_records,
+    log_network_info,
+    read_log_entries,
+    run_batch,
+    setup_logger,
+    start_server,
+    write_records,
+)
 
 
 class TestNetworkInfo(unittest.TestCase):
@@ -61,6 +82,449 @@ class TestNetworkInfo(unittest.TestCase):
             result["Binary Subnet Mask"], "11111111111111111111111100000000"
         )
 
+    def test_host_range_matches_hosts_enumeration(self):
+        for prefix in range(20, 33):
+            network_input = f"172.16.4.0/{prefix}"
+            hosts = list(IPv4Network(network_input, strict=False).hosts())
+            result = calculate_network_info(network_input)
+
+            self.assertEqual(result["Total IPs"], len(hosts))
+            self.assertEqual(result["Gateway"], hosts[0])
+            self.assertEqual(result["Usable IP Range"], f"{hosts[0]} - {hosts[-1]}")
+
+    def test_point_to_point_subnet(self):
+        result = calculate_network_info("10.0.0.4/31")
+
+        self.assertEqual(result["Total IPs"], 2)
+        self.assertEqual(result["Usable IP Range"], "10.0.0.4 - 10.0.0.5")
+
+    def test_single_host_subnet(self):
+        result = calculate_network_info("10.0.0.4/32")
+
+        self.assertEqual(result["Total IPs"], 1)
+        self.assertEqual(result["Gateway"], IPv4Network("10.0.0.4/32").network_address)
+        self.assertEqual(result["Usable IP Range"], "10.0.0.4 - 10.0.0.4")
+
+    def test_whole_address_space(self):
+        result = calculate_network_info("0.0.0.0/0")
+
+        self.assertEqual(result["Total IPs"], 2**32 - 2)
+        self.assertEqual(result["Usable IP Range"], "0.0.0.1 - 255.255.255.254")
+        self.assertEqual(result["Binary Subnet Mask"], "0" * 32)
+        self.assertEqual(result["Binary Wildcard Mask"], "1" * 32)
+
+    def test_binary_and_hex_id(self):
+        result = calculate_network_info("34.222.54.3/24")
+
+        self.assertEqual(result["Binary ID"], "00100010110111100011011000000000")
+        self.assertEqual(result["Integer ID"], 584988160)
+        self.assertEqual(result["Hex ID"], "0x22de3600")
+        self.assertEqual(result["in-addr.arpa"], "0.54.222.34.in-addr.arpa")
+
+    def test_ipv6_network(self):
+        result = calculate_network_info("2001:db8::1/32")
+
+        self.assertEqual(result["Network Address"], IPv6Network("2001:db8::/32")[0])
+        self.assertEqual(
+            str(result["Last Address"]), "2001:db8:ffff:ffff:ffff:ffff:ffff:ffff"
+        )
+        self.assertEqual(result["Total Addresses"], 2**96)
+        self.assertEqual(result["Total IPs"], 2**96 - 1)
+        self.assertEqual(result["Prefix Length"], 32)
+        self.assertEqual(result["Compressed"], "2001:db8::")
+        self.assertEqual(result["Exploded"], "2001:0db8:0000:0000:0000:0000:0000:0000")
+        self.assertEqual(result["ip6.arpa"], "8.b.d.0.1.0.0.2.ip6.arpa")
+        self.assertEqual(len(result["Binary ID"]), 128)
+        self.assertNotIn("Broadcast Address", result)
+
+    def test_ipv6_host_range_matches_hosts_enumeration(self):
+        for prefix in range(120, 129):
+            network_input = f"2001:db8::/{prefix}"
+            hosts = list(IPv6Network(network_input).hosts())
+            result = calculate_network_info(network_input)
+
+            self.assertEqual(result["Total IPs"], len(hosts))
+            self.assertEqual(result["Usable IP Range"], f"{hosts[0]} - {hosts[-1]}")
+
+    def test_ipv6_reverse_zone_uses_enclosing_nibble(self):
+        self.assertEqual(
+            calculate_network_info("2001:db8:abcd:12::/50")["ip6.arpa"],
+            "d.c.b.a.8.b.d.0.1.0.0.2.ip6.arpa",
+        )
+        self.assertEqual(calculate_network_info("::/0")["ip6.arpa"], "ip6.arpa")
+
+    def test_ipv6_public_network(self):
+        result = calculate_network_info("2001:4860::/32")
+
+        self.assertEqual(result["IP Type"], "Public")
+
+    def test_private_rule(self):
+        cases = {
+            "10.1.0.0/16": True,
+            "0.0.0.0/0": False,
+            "8.0.0.0/7": False,
+            "192.0.0.0/29": True,
+            "192.0.0.0/24": False,  # contains the 192.0.0.9 exception
+            "100.64.0.0/10": False,
+            "fd00::/8": True,
+            "2001:db8::/48": True,
+            "2001:20::/28": False,
+            "::/0": False,
+        }
+        for cidr, private in cases.items():
+            network = IPv6Network(cidr) if ":" in cidr else IPv4Network(cidr)
+            self.assertEqual(is_private_network(network), private, cidr)
+
+
+class TestNetworkInfoRecord(unittest.TestCase):
+
+    def test_fields_are_computed_lazily(self):
+        record = get_network_info("198.51.100.0/27")
+
+        self.assertFalse(hasattr(record, "_binary_id"))
+        self.assertEqual(record.total_ips, 30)
+        self.assertFalse(hasattr(record, "_binary_id"))
+        self.assertEqual(record.binary_id, "11000110001100110110010000000000")
+        self.assertTrue(hasattr(record, "_binary_id"))
+
+    def test_record_has_no_instance_dict(self):
+        self.assertFalse(hasattr(get_network_info("10.0.0.0/8"), "__dict__"))
+
+    def test_records_are_cached_by_normalized_network(self):
+        self.assertIs(get_network_info("10.9.8.7/8"), get_network_info(" 10.0.0.0/8"))
+
+    def test_to_dict_matches_calculate_network_info(self):
+        for network_input in ("34.222.54.3/24", "2001:db8::/48"):
+            self.assertEqual(
+                get_network_info(network_input).to_dict(),
+                calculate_network_info(network_input),
+            )
+
+    def test_version_specific_fields(self):
+        with self.assertRaises(AttributeError):
+            get_network_info("2001:db8::/32").broadcast_address
+        with self.assertRaises(AttributeError):
+            get_network_info("10.0.0.0/8").ip6_arpa
+
+    def test_invalid_network(self):
+        with self.assertRaises(ValueError):
+            get_network_info("invalid_network")
+
+
+class TestBatchMode(unittest.TestCase):
+
+    def test_records_skip_blank_and_comment_lines(self):
+        lines = ["# prefixes\n", "10.0.0.0/30\n", "\n", "8.8.8.0/24\n"]
+        records = list(iter_network_records(lines))
+
+        self.assertEqual(
+            [r["Network Info"] for r in records], ["10.0.0.0/30", "8.8.8.0/24"]
+        )
+        self.assertEqual(records[0]["Network Address"], "10.0.0.0")
+        self.assertEqual(records[0]["Total IPs"], 2)
+
+    def test_invalid_line_becomes_error_record(self):
+        records = list(iter_network_records(["bogus\n", "10.0.0.0/30\n"]))
+
+        self.assertIn("Invalid network address", records[0]["Error"])
+        self.assertNotIn("Error", records[1])
+
+    def test_write_jsonl(self):
+        output = io.StringIO()
+        count = write_records(iter_network_records(["10.0.0.0/30", "bogus"]), output)
+
+        rows = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual(count, 2)
+        self.assertEqual(rows[0]["Broadcast Address"], "10.0.0.3")
+        self.assertIn("Error", rows[1])
+
+    def test_write_csv(self):
+        output = io.StringIO()
+        write_records(iter_network_records(["10.0.0.0/30", "bogus"]), output, "csv")
+
+        rows = list(csv.DictReader(io.StringIO(output.getvalue())))
+        self.assertEqual(rows[0]["Usable IP Range"], "10.0.0.1 - 10.0.0.2")
+        self.assertEqual(rows[0]["Error"], "")
+        self.assertEqual(rows[1]["Network Address"], "")
+        self.assertTrue(rows[1]["Error"])
+
+    def test_parallel_preserves_input_order(self):
+        networks = [f"10.{i // 256}.{i % 256}.0/24" for i in range(500)]
+        networks[123] = "bogus"
+
+        records = list(
+            calculate_network_records_parallel(networks, workers=2, chunk_size=7)
+        )
+
+        self.assertEqual([r["Network Info"] for r in records], networks)
+        self.assertEqual(records, list(iter_network_records(networks)))
+
+    def test_parallel_single_worker(self):
+        records = list(calculate_network_records_parallel(["10.0.0.0/30"], workers=1))
+
+        self.assertEqual(records[0]["Total IPs"], 2)
+
+    def test_parallel_rejects_empty_chunks(self):
+        with self.assertRaises(ValueError):
+            list(calculate_network_records_parallel(["10.0.0.0/30"], chunk_size=0))
+
+    def test_write_csv_mixed_versions(self):
+        output = io.StringIO()
+        write_records(
+            iter_network_records(["10.0.0.0/30", "2001:db8::/64"]), output, "csv"
+        )
+
+        rows = list(csv.DictReader(io.StringIO(output.getvalue())))
+        self.assertEqual(rows[0]["in-addr.arpa"], "0.0.0.10.in-addr.arpa")
+        self.assertEqual(rows[0]["ip6.arpa"], "")
+        self.assertEqual(rows[1]["Compressed"], "2001:db8::")
+        self.assertEqual(rows[1]["Total Addresses"], str(2**64))
+
+    def test_unsupported_format(self):
+        with self.assertRaises(ValueError):
+            write_records([], io.StringIO(), "xml")
+
+    def test_run_batch_closes_input_if_output_fails(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as f:
+            f.write("10.0.0.0/30\n")
+        self.addCleanup(os.remove, f.name)
+        input_file = open(f.name)
+
+        with mock.patch(
+            "ip_range_calc.ip_range_calc.open",
+            side_effect=[input_file, PermissionError("read-only")],
+        ):
+            with self.assertRaises(PermissionError):
+                run_batch(f.name, "records.jsonl")
+
+        self.assertTrue(input_file.closed)
+
+
+class TestNetworkLog(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.log_file = os.path.join(self.tmpdir.name, "network_info_log.jsonl")
+
+    def tearDown(self):
+        logger = logging.getLogger("ip_range_calc")
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+            handler.close()
+        self.tmpdir.cleanup()
+
+    def log(self, *networks):
+        for network in networks:
+            log_network_info(network, calculate_network_info(network))
+
+    def test_entries_are_read_newest_first(self):
+        setup_logger(self.log_file)
+        self.log("10.0.0.0/8", "172.16.0.0/12", "192.168.0.0/16")
+
+        entries = list(read_log_entries(self.log_file))
+
+        self.assertEqual(
+            [e["Network Info"] for e in entries],
+            ["192.168.0.0/16", "172.16.0.0/12", "10.0.0.0/8"],
+        )
+        self.assertEqual(entries[0]["Network Address"], "192.168.0.0")
+        self.assertIn("Timestamp", entries[0])
+
+    def test_limit(self):
+        setup_logger(self.log_file)
+        self.log("10.0.0.0/8", "172.16.0.0/12", "192.168.0.0/16")
+
+        entries = list(read_log_entries(self.log_file, limit=2))
+
+        self.assertEqual(len(entries), 2)
+        self.assertEqual(entries[-1]["Network Info"], "172.16.0.0/12")
+
+    def test_rotation_keeps_order_across_files(self):
+        setup_logger(self.log_file, max_bytes=1024, backup_count=50)
+        networks = [f"10.{i}.0.0/16" for i in range(20)]
+        self.log(*networks)
+
+        self.assertTrue(os.path.exists(self.log_file + ".1"))
+        entries = list(read_log_entries(self.log_file, backup_count=50))
+        self.assertEqual([e["Network Info"] for e in entries], list(reversed(networks)))
+
+    def test_truncated_line_is_skipped(self):
+        setup_logger(self.log_file)
+        self.log("10.0.0.0/8")
+        with open(self.log_file, "a") as file:
+            file.write('{"Network Info": "172.16')
+
+        entries = list(read_log_entries(self.log_file))
+
+        self.assertEqual([e["Network Info"] for e in entries], ["10.0.0.0/8"])
+
+    def test_entry_after_truncated_line_is_kept(self):
+        setup_logger(self.log_file)
+        self.log("10.0.0.0/8")
+        with open(self.log_file, "r+") as file:
+            file.truncate(os.path.getsize(self.log_file) - 10)
+        setup_logger(self.log_file)
+        self.log("172.16.0.0/12")
+
+        entries = list(read_log_entries(self.log_file))
+
+        self.assertEqual([e["Network Info"] for e in entries], ["172.16.0.0/12"])
+
+    def test_entry_after_failed_write_is_kept(self):
+        setup_logger(self.log_file)
+        self.log("10.0.0.0/8")
+        (handler,) = logging.getLogger("ip_range_calc").handlers
+        stream = handler.stream
+        write = stream.write
+
+        def cut_off(text):
+            write(text[:10])
+            stream.flush()
+            raise OSError("No space left on device")
+
+        with mock.patch.object(stream, "write", side_effect=cut_off):
+            with mock.patch("sys.stderr", io.StringIO()):
+                self.log("192.168.0.0/16")
+        with mock.patch("builtins.open", side_effect=AssertionError("reopened")):
+            self.log("172.16.0.0/12")
+
+        entries = list(read_log_entries(self.log_file))
+
+        self.assertEqual(
+            [e["Network Info"] for e in entries], ["172.16.0.0/12", "10.0.0.0/8"]
+        )
+
+
+class TestLookupService(unittest.TestCase):
+
+    def test_get_network(self):
+        status, body = handle_http_request("GET", "/network?cidr=10.0.0.0/30")
+
+        self.assertEqual(status, 200)
+        self.assertEqual(json.loads(body)["Usable IP Range"], "10.0.0.1 - 10.0.0.2")
+
+    def test_get_invalid_network(self):
+        status, body = handle_http_request("GET", "/network?cidr=bogus")
+
+        self.assertEqual(status, 400)
+        self.assertIn("Error", json.loads(body))
+
+    def test_get_without_cidr(self):
+        self.assertEqual(handle_http_request("GET", "/network")[0], 400)
+
+    def test_post_networks_keeps_order(self):
+        body = json.dumps(["8.8.8.0/24", "bogus", "2001:db8::/32"]).encode()
+        status, response = handle_http_request("POST", "/networks", body)
+
+        records = json.loads(response)
+        self.assertEqual(status, 200)
+        self.assertEqual(
+            [r["Network Info"] for r in records],
+            ["8.8.8.0/24", "bogus", "2001:db8::/32"],
+        )
+        self.assertIn("Error", records[1])
+
+    def test_post_networks_object_body(self):
+        body = json.dumps({"networks": ["10.0.0.0/8"]}).encode()
+        status, response = handle_http_request("POST", "/networks", body)
+
+        self.assertEqual(status, 200)
+        self.assertEqual(json.loads(response)[0]["Total IPs"], 2**24 - 2)
+
+    def test_post_invalid_body(self):
+        self.assertEqual(handle_http_request("POST", "/networks", b"{oops")[0], 400)
+        self.assertEqual(handle_http_request("POST", "/networks", b"[1, 2]")[0], 400)
+
+    def test_wrong_method_and_path(self):
+        self.assertEqual(
+            handle_http_request("POST", "/network?cidr=10.0.0.0/8")[0], 405
+        )
+        self.assertEqual(handle_http_request("GET", "/networks")[0], 405)
+        self.assertEqual(handle_http_request("GET", "/nope")[0], 404)
+
+    def test_keep_alive_over_socket(self):
+        async def scenario():
+            server = await start_server("127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            responses = []
+            for request in (
+                b"GET /network?cidr=10.0.0.0/30 HTTP/1.1\r\nHost: x\r\n\r\n",
+                b"POST /networks HTTP/1.1\r\nContent-Length: 14\r\n"
+                b'Connection: close\r\n\r\n["8.8.8.0/24"]',
+            ):
+                writer.write(request)
+                await writer.drain()
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = int(head.split(b"Content-Length: ")[1].split(b"\r\n")[0])
+                responses.append((head, json.loads(await reader.readexactly(length))))
+            eof = await reader.read()
+            writer.close()
+            server.close()
+            await server.wait_closed()
+            return responses, eof
+
+        responses, eof = asyncio.run(asyncio.wait_for(scenario(), timeout=10))
+
+        self.assertIn(b"Connection: keep-alive", responses[0][0])
+        self.assertEqual(responses[0][1]["Total IPs"], 2)
+        self.assertIn(b"Connection: close", responses[1][0])
+        self.assertEqual(responses[1][1][0]["IP Type"], "Public")
+        self.assertEqual(eof, b"")
+
+    def exchange(self, request):
+        async def scenario():
+            server = await start_server("127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(request)
+            await writer.drain()
+            response = await reader.read()
+            writer.close()
+            server.close()
+            await server.wait_closed()
+            return response
+
+        return asyncio.run(asyncio.wait_for(scenario(), timeout=10))
+
+    def test_oversized_requests(self):
+        long_line = self.exchange(b"GET /" + b"a" * 100_000 + b" HTTP/1.1\r\n\r\n")
+        self.assertTrue(long_line.startswith(b"HTTP/1.1 414 "))
+
+        long_header = self.exchange(
+            b"GET /health HTTP/1.1\r\nCookie: " + b"a" * 100_000 + b"\r\n\r\n"
+        )
+        self.assertTrue(
+            long_header.startswith(b"HTTP/1.1 431 Request Header Fields Too Large")
+        )
+
+        many_headers = b"".join(b"X-%d: 1\r\n" % i for i in range(200))
+        too_many = self.exchange(b"GET /health HTTP/1.1\r\n" + many_headers + b"\r\n")
+        self.assertTrue(too_many.startswith(b"HTTP/1.1 431"))
+
+    def test_request_body_framing(self):
+        chunked = self.exchange(
+            b"POST /networks HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n"
+            b'e\r\n["8.8.8.0/24"]\r\n0\r\n\r\n'
+        )
+        self.assertTrue(chunked.startswith(b"HTTP/1.1 411 Length Required"))
+
+        unknown = self.exchange(
+            b"POST /networks HTTP/1.1\r\nExpect: later\r\nContent-Length: 2\r\n\r\n[]"
+        )
+        self.assertTrue(unknown.startswith(b"HTTP/1.1 417 Expectation Failed"))
+
+        continued = self.exchange(
+            b"POST /networks HTTP/1.1\r\nExpect: 100-continue\r\n"
+            b'Content-Length: 14\r\nConnection: close\r\n\r\n["8.8.8.0/24"]'
+        )
+        interim, final = continued.split(b"\r\n\r\n", 1)
+        self.assertEqual(interim, b"HTTP/1.1 100 Continue")
+        self.assertTrue(final.startswith(b"HTTP/1.1 200 OK"))
+        self.assertEqual(
+            json.loads(final.split(b"\r\n\r\n")[1])[0]["IP Type"], "Public"
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,75 @@
+import random
+import unittest
+
+import numpy as np
+
+from ip_range_calc.ip_range_calc import calculate_network_info
+from ip_range_calc.vectorized import calculate_network_info_array, parse_cidrs
+
+
+class TestVectorizedNetworkInfo(unittest.TestCase):
+
+    def test_matches_scalar_results(self):
+        rng = random.Random(42)
+        cidrs = [
+            "192.168.1.0/24",
+            "10.0.0.0/30",
+            "8.8.8.0/24",
+            "0.0.0.0/0",
+            "10.0.0.4/31",
+            "10.0.0.4/32",
+            "172.16.0.0/11",
+            "255.255.255.255/32",
+            "192.0.0.0/24",
+            "192.0.0.8/29",
+            "192.0.0.8/31",
+            "100.64.0.0/10",
+            "240.0.0.0/4",
+        ]
+        cidrs += [
+            f"{rng.getrandbits(8)}.{rng.getrandbits(8)}.{rng.getrandbits(8)}."
+            f"{rng.getrandbits(8)}/{rng.randint(0, 32)}"
+            for _ in range(500)
+        ]
+
+        columns = calculate_network_info_array(*parse_cidrs(cidrs))
+
+        self.assertEqual(len(columns), len(cidrs))
+        for cidr, result in zip(cidrs, columns.to_dicts()):
+            self.assertEqual(result, calculate_network_info(cidr), cidr)
+
+    def test_columns(self):
+        columns = calculate_network_info_array(
+            np.array([0xC0A80117, 0x0A000000], dtype=np.uint32), [24, 8]
+        )
+
+        np.testing.assert_array_equal(columns.network_address, [0xC0A80100, 0x0A000000])
+        np.testing.assert_array_equal(
+            columns.broadcast_address, [0xC0A801FF, 0x0AFFFFFF]
+        )
+        np.testing.assert_array_equal(columns.total_ips, [254, 2**24 - 2])
+        np.testing.assert_array_equal(columns.ip_class, [192, 10])
+        np.testing.assert_array_equal(columns.is_private, [True, True])
+
+    def test_whole_address_space(self):
+        columns = calculate_network_info_array([0], [0])
+
+        self.assertEqual(int(columns.subnet_mask[0]), 0)
+        self.assertEqual(int(columns.wildcard_mask[0]), 0xFFFFFFFF)
+        self.assertEqual(int(columns.total_ips[0]), 2**32 - 2)
+
+    def test_invalid_prefix_length(self):
+        with self.assertRaises(ValueError):
+            calculate_network_info_array([0], [33])
+
+    def test_mismatched_shapes(self):
+        with self.assertRaises(ValueError):
+            calculate_network_info_array([0, 1], [24])
+
+    def test_invalid_cidr(self):
+        with self.assertRaises(ValueError):
+            parse_cidrs(["10.0.0.0/24", "invalid_network"])
+
+
+if __name__ == "__main__":
+    unittest.main()
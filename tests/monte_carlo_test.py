@@ -0,0 +1,75 @@
+import unittest
+
+import numpy as np
+
+from projectile_motion.monte_carlo import run_monte_carlo
+from projectile_motion.trajectory_batch import RESULT_KEYS, solve_trajectories
+
+
+def _spread_height(rng, size):
+    return rng.uniform(0, 2, size)
+
+
+class TestMonteCarlo(unittest.TestCase):
+
+    def test_matches_exact_statistics(self):
+        report = run_monte_carlo(
+            ("normal", 20, 0.5),
+            ("uniform", 40, 50),
+            samples=200_000,
+            chunk_size=30_000,
+            seed=3,
+        )
+        rng = np.random.default_rng(4)
+        ranges = solve_trajectories(
+            rng.normal(20, 0.5, 200_000), rng.uniform(40, 50, 200_000)
+        )["horizontal_range"]
+        summary = report["horizontal_range"]
+        self.assertEqual(report["samples"], 200_000)
+        self.assertAlmostEqual(summary["mean"], ranges.mean(), delta=0.02)
+        self.assertAlmostEqual(summary["std"], ranges.std(), delta=0.02)
+        for percentile, value in summary["percentiles"].items():
+            self.assertAlmostEqual(value, np.percentile(ranges, percentile), delta=0.05)
+        deviations = np.abs(ranges - ranges.mean())
+        self.assertAlmostEqual(report["cep"], np.median(deviations), delta=0.05)
+        self.assertAlmostEqual(report["r90"], np.percentile(deviations, 90), delta=0.05)
+        self.assertEqual(sum(summary["histogram"]["counts"]), 200_000)
+        self.assertEqual(
+            len(summary["histogram"]["edges"]),
+            len(summary["histogram"]["counts"]) + 1,
+        )
+
+    def test_reproducible_across_workers(self):
+        options = dict(samples=50_000, chunk_size=7_000, seed=11)
+        specs = (("normal", 30, 1), ("normal", 60, 2), _spread_height)
+        self.assertEqual(
+            run_monte_carlo(*specs, workers=1, **options),
+            run_monte_carlo(*specs, workers=2, **options),
+        )
+
+    def test_constants_match_single_solution(self):
+        report = run_monte_carlo(20, 45, 10, samples=1000, chunk_size=300)
+        expected = solve_trajectories(20, 45, 10)
+        for key in RESULT_KEYS:
+            self.assertAlmostEqual(report[key]["min"], expected[key])
+            self.assertAlmostEqual(report[key]["percentiles"][50], expected[key])
+        self.assertAlmostEqual(report["cep"], 0)
+
+    def test_invalid_draws_are_counted(self):
+        report = run_monte_carlo(
+            20, 45, ("normal", 0, 1), ("normal", 9.81, 5), samples=10_000, seed=5
+        )
+        self.assertGreater(report["invalid"], 4000)
+        self.assertEqual(report["samples"] + report["invalid"], 10_000)
+
+    def test_bad_arguments(self):
+        with self.assertRaises(ValueError):
+            run_monte_carlo(("cauchy_ish", 1), 45, samples=10)
+        with self.assertRaises(ValueError):
+            run_monte_carlo(20, 45, samples=0)
+        with self.assertRaises(ValueError):
+            run_monte_carlo(20, 45, -5, samples=10)
+
+
+if __name__ == "__main__":
+    unittest.main()
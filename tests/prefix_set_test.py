@@ -0,0 +1,170 @@
+import ipaddress
+import random
+import unittest
+
+from ip_range_calc.prefix_set import (
+    collapse_networks,
+    find_overlaps,
+    intersect_networks,
+    plan_subnets,
+    subtract_networks,
+)
+
+
+def addresses(networks):
+    return {int(a) for n in networks for a in ipaddress.ip_network(n)}
+
+
+def random_networks(rng, count):
+    return [
+        ipaddress.ip_network(
+            f"10.0.{rng.getrandbits(2)}.{rng.getrandbits(8)}/{rng.randint(24, 32)}",
+            strict=False,
+        )
+        for _ in range(count)
+    ]
+
+
+class TestPrefixSet(unittest.TestCase):
+
+    def test_collapse_matches_ipaddress(self):
+        rng = random.Random(3)
+        networks = random_networks(rng, 200)
+
+        self.assertEqual(
+            collapse_networks(networks), list(ipaddress.collapse_addresses(networks))
+        )
+
+    def test_collapse_merges_adjacent_blocks(self):
+        self.assertEqual(
+            [str(n) for n in collapse_networks(["10.0.0.0/25", "10.0.0.128/25"])],
+            ["10.0.0.0/24"],
+        )
+
+    def test_collapse_mixed_versions(self):
+        result = collapse_networks(
+            ["2001:db8::/33", "10.0.0.0/8", "2001:db8:8000::/33"]
+        )
+
+        self.assertEqual([str(n) for n in result], ["10.0.0.0/8", "2001:db8::/32"])
+
+    def test_collapse_whole_address_space(self):
+        self.assertEqual(
+            [str(n) for n in collapse_networks(["0.0.0.0/1", "128.0.0.0/1"])],
+            ["0.0.0.0/0"],
+        )
+
+    def test_intersection(self):
+        rng = random.Random(5)
+        a = random_networks(rng, 60)
+        b = random_networks(rng, 60)
+
+        result = intersect_networks(a, b)
+
+        self.assertEqual(addresses(result), addresses(a) & addresses(b))
+        self.assertEqual(result, list(ipaddress.collapse_addresses(result)))
+
+    def test_difference(self):
+        rng = random.Random(9)
+        a = random_networks(rng, 60)
+        b = random_networks(rng, 60)
+
+        result = subtract_networks(a, b)
+
+        self.assertEqual(addresses(result), addresses(a) - addresses(b))
+        self.assertEqual(result, list(ipaddress.collapse_addresses(result)))
+
+    def test_difference_splits_block(self):
+        result = subtract_networks(["10.0.0.0/24"], ["10.0.0.64/26"])
+
+        self.assertEqual([str(n) for n in result], ["10.0.0.0/26", "10.0.0.128/25"])
+
+    def test_find_overlaps(self):
+        conflicts = find_overlaps(
+            [
+                "10.0.0.0/8",
+                "10.1.0.0/16",
+                "10.1.2.0/24",
+                "192.168.0.0/16",
+                "10.1.0.0/16",
+            ]
+        )
+
+        self.assertEqual(
+            [(str(outer), str(inner)) for outer, inner in conflicts],
+            [
+                ("10.0.0.0/8", "10.1.0.0/16"),
+                ("10.0.0.0/8", "10.1.0.0/16"),
+                ("10.1.0.0/16", "10.1.0.0/16"),
+                ("10.0.0.0/8", "10.1.2.0/24"),
+                ("10.1.0.0/16", "10.1.2.0/24"),
+                ("10.1.0.0/16", "10.1.2.0/24"),
+            ],
+        )
+
+    def test_find_overlaps_matches_pairwise_check(self):
+        rng = random.Random(11)
+        networks = random_networks(rng, 80)
+
+        expected = sorted(
+            (str(a), str(b))
+            for i, a in enumerate(networks)
+            for j, b in enumerate(networks)
+            if i < j and a.overlaps(b)
+        )
+        found = sorted(
+            tuple(sorted((str(outer), str(inner))))
+            for outer, inner in find_overlaps(networks)
+        )
+
+        self.assertEqual(found, sorted(tuple(sorted(pair)) for pair in expected))
+
+    def test_plan_subnets(self):
+        result = plan_subnets("10.0.0.0/24", [10, 100, 50, 2])
+
+        self.assertEqual(
+            [str(n) for n in result],
+            ["10.0.0.192/28", "10.0.0.0/25", "10.0.0.128/26", "10.0.0.208/31"],
+        )
+
+    def test_plan_subnets_avoids_used_networks(self):
+        result = plan_subnets(
+            "10.0.0.0/24", [60, 60], used=["10.0.0.0/26", "10.0.0.128/26"]
+        )
+
+        self.assertEqual([str(n) for n in result], ["10.0.0.64/26", "10.0.0.192/26"])
+
+    def test_plan_subnets_ipv6(self):
+        result = plan_subnets("2001:db8::/48", [2**64 - 1, 2**64 - 1])
+
+        self.assertEqual(
+            [str(n) for n in result], ["2001:db8::/64", "2001:db8:0:1::/64"]
+        )
+
+    def test_plan_subnets_large_pool(self):
+        rng = random.Random(7)
+        used = [f"10.{i}.{rng.getrandbits(8)}.0/24" for i in range(0, 256, 2)]
+        prefix_lengths = {2: 31, 10: 28, 60: 26, 250: 24, 1000: 22}
+        counts = [rng.choice(list(prefix_lengths)) for _ in range(2000)]
+
+        result = plan_subnets("10.0.0.0/8", counts, used=used)
+
+        self.assertEqual(
+            [network.prefixlen for network in result],
+            [prefix_lengths[count] for count in counts],
+        )
+        self.assertEqual(find_overlaps(result + used), [])
+        self.assertEqual(
+            collapse_networks(result + ["10.0.0.0/8"]),
+            [ipaddress.ip_network("10.0.0.0/8")],
+        )
+
+    def test_plan_subnets_out_of_space(self):
+        with self.assertRaises(ValueError):
+            plan_subnets("10.0.0.0/24", [200, 100])
+        with self.assertRaises(ValueError):
+            plan_subnets("10.0.0.0/24", [1000])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,200 @@
+import io
+import ipaddress
+import os
+import random
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest import mock
+
+import numpy as np
+
+from ip_range_calc.prefix_trie import PrefixTrie, main
+
+
+def linear_longest_match(networks, address):
+    address = ipaddress.ip_address(address)
+    matches = [n for n in networks if address in ipaddress.ip_network(n)]
+    return max(matches, key=lambda n: ipaddress.ip_network(n).prefixlen, default=None)
+
+
+class TestPrefixTrie(unittest.TestCase):
+
+    def setUp(self):
+        self.trie = PrefixTrie.from_networks(
+            [
+                ("10.0.0.0/8", {"site": "corp"}),
+                ("10.1.0.0/16", {"site": "lab"}),
+                ("10.1.2.0/24", {"site": "rack"}),
+                ("192.168.0.0/16", "home"),
+            ]
+        )
+
+    def test_longest_match(self):
+        network, metadata = self.trie.longest_match("10.1.2.3")
+
+        self.assertEqual(network, ipaddress.ip_network("10.1.2.0/24"))
+        self.assertEqual(metadata, {"site": "rack"})
+        self.assertEqual(self.trie.longest_match("10.200.0.1")[1], {"site": "corp"})
+        self.assertIsNone(self.trie.longest_match("8.8.8.8"))
+
+    def test_all_matches(self):
+        matches = self.trie.all_matches("10.1.2.3")
+
+        self.assertEqual(
+            [str(network) for network, _ in matches],
+            ["10.0.0.0/8", "10.1.0.0/16", "10.1.2.0/24"],
+        )
+
+    def test_insert_replaces_metadata(self):
+        self.trie.insert("10.1.0.0/16", "moved")
+
+        self.assertEqual(len(self.trie), 4)
+        self.assertEqual(self.trie.longest_match("10.1.9.9")[1], "moved")
+
+    def test_default_route(self):
+        self.trie.insert("0.0.0.0/0", "default")
+
+        self.assertEqual(self.trie.longest_match("8.8.8.8")[1], "default")
+        self.assertEqual(self.trie.longest_match("10.1.2.3")[1], {"site": "rack"})
+
+    def test_host_route(self):
+        self.trie.insert("10.1.2.3/32", "host")
+
+        self.assertEqual(self.trie.longest_match("10.1.2.3")[1], "host")
+        self.assertEqual(self.trie.longest_match("10.1.2.4")[1], {"site": "rack"})
+
+    def test_longest_match_many_agrees_with_linear_scan(self):
+        rng = random.Random(7)
+        networks = sorted(
+            {
+                str(
+                    ipaddress.ip_network(
+                        f"{rng.choice([10, 172, 192])}.{rng.getrandbits(8)}."
+                        f"{rng.getrandbits(8)}.0/{rng.randint(8, 28)}",
+                        strict=False,
+                    )
+                )
+                for _ in range(300)
+            }
+        )
+        trie = PrefixTrie.from_networks(networks)
+        addresses = [
+            f"{rng.choice([10, 172, 192])}.{rng.getrandbits(8)}."
+            f"{rng.getrandbits(8)}.{rng.getrandbits(8)}"
+            for _ in range(500)
+        ]
+
+        indices = trie.longest_match_many(
+            np.array([int(ipaddress.ip_address(a)) for a in addresses], dtype=np.uint32)
+        )
+
+        for address, index in zip(addresses, indices):
+            expected = linear_longest_match(networks, address)
+            found = str(trie.value(index)[0]) if index >= 0 else None
+            self.assertEqual(found, expected, address)
+
+    def test_longest_match_many_accepts_strings(self):
+        indices = self.trie.longest_match_many(["10.1.2.3", "8.8.8.8"])
+
+        self.assertEqual(self.trie.value(indices[0])[1], {"site": "rack"})
+        self.assertEqual(indices[1], -1)
+
+    def test_ipv6(self):
+        trie = PrefixTrie.from_networks(
+            [("2001:db8::/32", "doc"), ("2001:db8:1::/48", "site")], version=6
+        )
+
+        self.assertEqual(trie.longest_match("2001:db8:1::5")[1], "site")
+        self.assertEqual(trie.longest_match("2001:db8:2::5")[1], "doc")
+        self.assertEqual(
+            list(trie.longest_match_many(["2001:db8:1::5", "::1"])), [1, -1]
+        )
+
+    def test_version_mismatch(self):
+        with self.assertRaises(ValueError):
+            self.trie.insert("2001:db8::/32")
+        with self.assertRaises(ValueError):
+            self.trie.longest_match("2001:db8::1")
+
+    def test_invalid_network(self):
+        with self.assertRaises(ValueError):
+            self.trie.insert("invalid_network")
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "index.lpm")
+            self.trie.save(path)
+
+            with PrefixTrie.load(path) as loaded:
+                self.assertEqual(len(loaded), 4)
+                self.assertEqual(loaded.longest_match("10.1.2.3")[1], {"site": "rack"})
+                self.assertEqual(
+                    [str(n) for n, _ in loaded.all_matches("10.1.9.9")],
+                    ["10.0.0.0/8", "10.1.0.0/16"],
+                )
+                indices = loaded.longest_match_many(["192.168.5.5", "8.8.8.8"])
+                self.assertEqual(loaded.value(indices[0])[1], "home")
+                self.assertEqual(indices[1], -1)
+                with self.assertRaises(ValueError):
+                    loaded.insert("172.16.0.0/12")
+
+    def test_load_rejects_other_files(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "not_an_index")
+            with open(path, "wb") as file:
+                file.write(b"\0" * 64)
+
+            with self.assertRaises(ValueError):
+                PrefixTrie.load(path)
+
+    def test_load_rejects_truncated_files(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "index.lpm")
+            self.trie.save(path)
+            with open(path, "rb") as file:
+                data = file.read()
+
+            for size in (0, 16, 40, len(data) - 1):
+                with self.subTest(size=size):
+                    with open(path, "wb") as file:
+                        file.write(data[:size])
+                    with self.assertRaises(ValueError):
+                        PrefixTrie.load(path)
+
+            with open(path, "wb") as file:
+                file.write(data[:12] + b"\xff\xff\xff\x7f" + data[16:])
+            with self.assertRaises(ValueError):
+                PrefixTrie.load(path)
+
+
+class TestMain(unittest.TestCase):
+
+    def test_build_from_stdin_leaves_it_open(self):
+        stdin = io.StringIO("# comment\n10.0.0.0/8,corp\n\n10.1.0.0/16\n")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "index.lpm")
+            with mock.patch("sys.stdin", stdin), redirect_stdout(io.StringIO()):
+                main(["build", "-", path])
+
+            self.assertFalse(stdin.closed)
+            with PrefixTrie.load(path) as trie:
+                self.assertEqual(trie.longest_match("10.0.0.1")[1], "corp")
+                self.assertEqual(str(trie.longest_match("10.1.0.1")[0]), "10.1.0.0/16")
+
+    def test_build_reports_malformed_line(self):
+        stdin = io.StringIO("10.0.0.0/8\nnot-a-network\n")
+        stderr = io.StringIO()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "index.lpm")
+            with mock.patch("sys.stdin", stdin), redirect_stderr(stderr):
+                with self.assertRaises(SystemExit) as context:
+                    main(["build", "-", path])
+
+            self.assertEqual(context.exception.code, 2)
+            self.assertIn("line 2: Invalid network address", stderr.getvalue())
+            self.assertFalse(os.path.exists(path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from contextlib import closing
+
+from projectile_motion.cache import CacheInfo, ProjectileCache
+from projectile_motion.projectile_motion import calculate_projectile_motion
+
+
+class TestProjectileCache(unittest.TestCase):
+
+    def test_matches_uncached(self):
+        cache = ProjectileCache()
+        self.assertEqual(cache(20, 45, 10), calculate_projectile_motion(20, 45, 10))
+        self.assertEqual(cache(20, 45, 10), calculate_projectile_motion(20, 45, 10))
+        self.assertEqual(cache.cache_info(), CacheInfo(1, 1, 0, 1024, 1))
+
+    def test_lru_eviction(self):
+        cache = ProjectileCache(maxsize=2)
+        cache(10, 45)
+        cache(20, 45)
+        cache(10, 45)  # 10 is now the most recently used
+        cache(30, 45)  # evicts 20
+        cache(10, 45)
+        cache(20, 45)
+        info = cache.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (2, 4, 2))
+
+    def test_quantization(self):
+        cache = ProjectileCache(tolerance={"velocity": 0.5, "angle": 1})
+        self.assertEqual(cache.quantize(20.2, 44.6, 1.23), (20.0, 45, 1.23, 9.81))
+        first = cache(20.1, 45.2)
+        self.assertEqual(cache(19.9, 44.8), first)
+        self.assertEqual(first, calculate_projectile_motion(20.0, 45))
+        self.assertEqual(cache.cache_info().hits, 1)
+
+    def test_returns_fresh_summary(self):
+        cache = ProjectileCache()
+        cache(20, 45)[3]["flight_time"] = None
+        self.assertIsNotNone(cache(20, 45)[3]["flight_time"])
+
+    def test_persistent_cache(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cache.sqlite")
+            with ProjectileCache(path=path) as cache:
+                expected = cache(20, 45, 10)
+            with ProjectileCache(path=path) as cache:
+                self.assertEqual(cache(20, 45, 10), expected)
+                self.assertEqual(cache(20, 45, 10), expected)
+                self.assertEqual(cache.cache_info(), CacheInfo(1, 0, 1, 1024, 1))
+
+    def test_writes_are_batched(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cache.sqlite")
+            cache = ProjectileCache(maxsize=1, path=path, write_batch=3)
+            for velocity in (10, 20):
+                cache(velocity, 45)
+            with closing(sqlite3.connect(path)) as db:
+                count = "SELECT COUNT(*) FROM results"
+                self.assertEqual(db.execute(count).fetchone()[0], 0)
+                # Pending results are still found after leaving memory.
+                self.assertEqual(cache(10, 45), calculate_projectile_motion(10, 45))
+                self.assertEqual(cache.cache_info().disk_hits, 1)
+                cache(30, 45)
+                self.assertEqual(db.execute(count).fetchone()[0], 3)
+                cache(40, 45)
+                cache.close()
+                self.assertEqual(db.execute(count).fetchone()[0], 4)
+
+    def test_clear(self):
+        cache = ProjectileCache()
+        cache(20, 45)
+        cache.cache_clear()
+        self.assertEqual(cache.cache_info(), CacheInfo(0, 0, 0, 1024, 0))
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            ProjectileCache(maxsize=0)
+        with self.assertRaises(ValueError):
+            ProjectileCache(tolerance=0)
+        with self.assertRaises(ValueError):
+            ProjectileCache(tolerance={"speed": 1})
+        with self.assertRaises(ValueError):
+            ProjectileCache(write_batch=0)
+
+    def test_rejects_non_positive_gravity(self):
+        cache = ProjectileCache(tolerance={"gravity": 1})
+        for gravity in (0.4, 0, -9.81):
+            with self.assertRaises(ValueError):
+                cache(20, 45, gravity=gravity)
+        self.assertEqual(cache.cache_info().misses, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest import mock
+
+from benchmarks import projectile_motion_bench
+from benchmarks.projectile_motion_bench import compare, main
+
+
+class TestCompare(unittest.TestCase):
+
+    def test_flags_slow_downs_beyond_tolerance(self):
+        baseline = {"single_call_us": 1.0, "scalar_sweep_us_per_launch": 2.0}
+        results = {
+            "single_call_us": 1.1,
+            "scalar_sweep_us_per_launch": 3.0,
+            "new_metric_us": 5.0,
+        }
+
+        rows = compare(results, baseline, 0.2)
+
+        self.assertEqual(
+            rows,
+            [
+                ("single_call_us", 1.0, 1.1, 1.1, False),
+                ("scalar_sweep_us_per_launch", 2.0, 3.0, 1.5, True),
+            ],
+        )
+
+    def test_faster_is_never_a_regression(self):
+        rows = compare({"frame_us": 0.5}, {"frame_us": 1.0}, 0.0)
+        self.assertEqual(rows, [("frame_us", 1.0, 0.5, 0.5, False)])
+
+    def test_main_exits_with_1_on_regression(self):
+        results = {"single_call_us": 2.0}
+        with tempfile.TemporaryDirectory() as directory:
+            baseline_path = os.path.join(directory, "baseline.json")
+            with open(baseline_path, "w") as baseline_file:
+                json.dump({"results": {"single_call_us": 1.0}}, baseline_file)
+            with mock.patch.object(
+                projectile_motion_bench, "run_benchmarks", return_value=results
+            ), redirect_stdout(io.StringIO()):
+                stderr = io.StringIO()
+                with redirect_stderr(stderr):
+                    status = main(["--baseline", baseline_path])
+                self.assertEqual(status, 1)
+                self.assertIn("single_call_us", stderr.getvalue())
+                self.assertEqual(
+                    main(["--baseline", baseline_path, "--tolerance", "1.5"]), 0
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
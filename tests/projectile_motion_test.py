@@ -1,5 +1,22 @@
+import io
+import json
+import math
+import os
+import tempfile
 import unittest
-from projectile_motion.projectile_motion import calculate_projectile_motion
+from contextlib import redirect_stderr, redirect_stdout
+from unittest import mock
+from projectile_motion.projectile_motion import (
+    RESULT_FIELDS,
+    Scene,
+    calculate_projectile_motion,
+    main,
+    read_scenarios,
+    run_batch,
+    sample_trajectory,
+    scenario_result,
+    write_results,
+)
 
 
 class TestProjectileMotion(unittest.TestCase):
@@ -49,5 +66,228 @@ class TestProjectileMotion(unittest.TestCase):
         self.assertAlmostEqual(result["impact_angle"], -54.61, places=2)
 
 
+class TestSampleTrajectory(unittest.TestCase):
+
+    def test_samples_follow_path(self):
+        velocity_x, velocity_y, flight_time, _ = calculate_projectile_motion(20, 45, 10)
+        samples = sample_trajectory(20, 45, 10)
+        self.assertEqual(samples["time"][0], 0)
+        self.assertAlmostEqual(samples["time"][-1], flight_time)
+        self.assertAlmostEqual(samples["y"][-1], 0)
+        for t, x, y in zip(samples["time"], samples["x"], samples["y"]):
+            self.assertAlmostEqual(x, velocity_x * t)
+            self.assertAlmostEqual(y, 10 + velocity_y * t - 0.5 * 9.81 * t**2)
+
+    def test_apex_is_sampled(self):
+        _, velocity_y, _, trajectory_data = calculate_projectile_motion(30, 60)
+        samples = sample_trajectory(30, 60)
+        self.assertTrue(any(abs(t - velocity_y / 9.81) < 1e-9 for t in samples["time"]))
+        self.assertAlmostEqual(max(samples["y"]), trajectory_data["max_height"], 2)
+
+    def test_density_follows_curvature(self):
+        samples = sample_trajectory(300, 60, max_turn=1.0)
+        points = list(zip(samples["x"], samples["y"]))
+        headings = [
+            math.degrees(math.atan2(y1 - y0, x1 - x0))
+            for (x0, y0), (x1, y1) in zip(points, points[1:])
+        ]
+        turns = [a - b for a, b in zip(headings, headings[1:])]
+        self.assertLessEqual(max(turns), 1.01)
+        # Samples are closest together around the apex, where the path bends.
+        spacing = [math.dist(p, q) for p, q in zip(points, points[1:])]
+        self.assertLess(min(spacing), spacing[0])
+        self.assertLess(len(points), 500)
+
+    def test_free_fall_and_zero_flight(self):
+        samples = sample_trajectory(0, 0, 50)
+        self.assertGreater(len(samples["time"]), 20)
+        self.assertEqual(set(samples["x"]), {0})
+        self.assertEqual(sample_trajectory(20, 0)["time"], [0.0])
+
+
+class TestBatch(unittest.TestCase):
+
+    def test_scenario_result(self):
+        record = scenario_result({"velocity": "20", "angle": "45", "height": ""})
+        _, _, _, expected = calculate_projectile_motion(20, 45)
+        self.assertEqual(record["height"], 0)
+        self.assertEqual(record["gravity"], 9.81)
+        for key, value in expected.items():
+            self.assertEqual(record[key], value)
+        self.assertEqual(scenario_result('{"velocity": 20, "angle": 45}'), record)
+
+    def test_scenario_errors(self):
+        self.assertEqual(
+            scenario_result({"angle": 3}),
+            {"angle": 3, "error": "Missing field: velocity"},
+        )
+        self.assertIn("error", scenario_result({"velocity": "x", "angle": 3}))
+        self.assertIn("error", scenario_result({"velocity": 1, "angle": None}))
+        self.assertIn(
+            "error", scenario_result({"velocity": 1, "angle": 3, "height": -1})
+        )
+        self.assertIn("Invalid JSON", scenario_result("not json")["error"])
+        self.assertIn("error", scenario_result("[1, 2]"))
+        self.assertEqual(
+            scenario_result({"velocity": 1, "angle": 3, "gravity": 0})["error"],
+            "Gravity must be positive",
+        )
+
+    def test_scenario_overflow_is_reported_per_row(self):
+        self.assertEqual(
+            scenario_result({"velocity": 1e200, "angle": 45}),
+            {"velocity": 1e200, "angle": 45, "error": "Result out of range"},
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            input_path = os.path.join(directory, "scenarios.jsonl")
+            with open(input_path, "w") as input_file:
+                for velocity in (20, 1e200, 30):
+                    input_file.write(json.dumps({"velocity": velocity, "angle": 45}))
+                    input_file.write("\n")
+            output_path = os.path.join(directory, "results.jsonl")
+            self.assertEqual(run_batch(input_path, output_path, progress=False), 3)
+            with open(output_path) as output_file:
+                records = [json.loads(line) for line in output_file]
+        self.assertEqual(
+            ["error" in record for record in records], [False, True, False]
+        )
+
+    def test_read_scenarios(self):
+        csv_input = io.StringIO("velocity,angle\n20,45\n")
+        self.assertEqual(
+            list(read_scenarios(csv_input, "csv")), [{"velocity": "20", "angle": "45"}]
+        )
+        jsonl_input = io.StringIO('{"velocity": 20}\n\n# comment\n')
+        self.assertEqual(list(read_scenarios(jsonl_input)), ['{"velocity": 20}'])
+
+    def test_write_results_csv(self):
+        output = io.StringIO()
+        progress = io.StringIO()
+        records = [scenario_result({"velocity": 20, "angle": 45}), {"error": "bad"}]
+        self.assertEqual(write_results(records, output, "csv", progress), 2)
+        lines = output.getvalue().splitlines()
+        self.assertEqual(lines[0], ",".join(RESULT_FIELDS))
+        self.assertEqual(lines[2], ",,,,,,,,,bad")
+        self.assertIn("Processed 2 scenarios", progress.getvalue())
+
+    def test_write_results_non_finite_values(self):
+        record = scenario_result('{"velocity": NaN, "angle": 45}')
+        self.assertEqual(record["error"], "Scenario values must be finite")
+        records = [record, {"velocity": 20, "max_height": float("inf")}]
+
+        output = io.StringIO()
+        self.assertEqual(write_results(records, output), 2)
+        lines = output.getvalue().splitlines()
+        self.assertNotIn("NaN", output.getvalue())
+        self.assertEqual(json.loads(lines[0])["velocity"], None)
+        self.assertEqual(json.loads(lines[1]), {"velocity": 20, "max_height": None})
+
+        output = io.StringIO()
+        write_results(records, output, "csv")
+        self.assertEqual(
+            output.getvalue().splitlines()[1:],
+            [",45,,,,,,,,Scenario values must be finite", "20,,,,,,,,,"],
+        )
+
+    def test_run_batch_parallel(self):
+        with tempfile.TemporaryDirectory() as directory:
+            input_path = os.path.join(directory, "scenarios.csv")
+            with open(input_path, "w") as input_file:
+                input_file.write("velocity,angle,height\n")
+                for velocity in range(1, 51):
+                    input_file.write(f"{velocity},45,{velocity % 3}\n")
+                input_file.write("oops,45,0\n")
+
+            outputs = []
+            for workers in (1, 2):
+                output_path = os.path.join(directory, f"results{workers}.jsonl")
+                count = run_batch(
+                    input_path,
+                    output_path,
+                    workers=workers,
+                    chunk_size=7,
+                    progress=False,
+                )
+                self.assertEqual(count, 51)
+                with open(output_path) as output_file:
+                    outputs.append([json.loads(line) for line in output_file])
+            self.assertEqual(outputs[0], outputs[1])
+            self.assertEqual(outputs[0][10]["velocity"], 11)
+            self.assertIn("error", outputs[0][-1])
+
+    def test_run_batch_closes_input_if_output_fails(self):
+        with tempfile.TemporaryDirectory() as directory:
+            input_path = os.path.join(directory, "scenarios.csv")
+            with open(input_path, "w") as input_file:
+                input_file.write("velocity,angle\n20,45\n")
+            scenarios = open(input_path, newline="")
+            with mock.patch(
+                "projectile_motion.projectile_motion.open",
+                side_effect=[scenarios, IsADirectoryError(directory)],
+            ), self.assertRaises(IsADirectoryError):
+                run_batch(input_path, directory, progress=False)
+            self.assertTrue(scenarios.closed)
+
+    def test_main_run(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            main(["run", "--velocity", "20", "--angle", "45", "--json"])
+        _, _, _, expected = calculate_projectile_motion(20, 45)
+        self.assertEqual(json.loads(output.getvalue()), expected)
+
+    def test_main_run_validates_input(self):
+        for flags in (
+            ["--velocity", "20", "--gravity", "0"],
+            ["--velocity", "20", "--gravity", "-9.81"],
+            ["--velocity", "20", "--height", "-1"],
+            ["--velocity", "1e200"],
+        ):
+            with self.assertRaises(SystemExit), redirect_stderr(io.StringIO()):
+                main(["run", "--angle", "45", *flags])
+
+    def test_main_batch_stdout(self):
+        with tempfile.TemporaryDirectory() as directory:
+            input_path = os.path.join(directory, "scenarios.jsonl")
+            with open(input_path, "w") as input_file:
+                input_file.write('{"velocity": 20, "angle": 45}\n')
+            output = io.StringIO()
+            with redirect_stdout(output), redirect_stderr(io.StringIO()):
+                main(["batch", input_path, "--format", "csv"])
+        self.assertEqual(len(output.getvalue().splitlines()), 2)
+
+
+@mock.patch("projectile_motion.projectile_motion.turtle")
+class TestScene(unittest.TestCase):
+
+    def test_plays_all_projectiles_on_one_timeline(self, fake_turtle):
+        fake_turtle.Turtle.side_effect = lambda: mock.MagicMock()
+        scene = Scene()
+        summaries = [scene.add(20, angle, 5) for angle in (30, 45, 60)]
+        # Ground, info text and one height line shared by all three.
+        self.assertEqual(fake_turtle.Turtle.call_count, 3)
+
+        scene.play(speed=100)
+
+        screen = fake_turtle.Screen.return_value
+        frames = screen.update.call_count
+        self.assertGreater(frames, 1)
+        for track, summary in zip(scene.tracks, summaries):
+            self.assertTrue(track.done)
+            x, y = track.projectile.goto.call_args.args
+            self.assertAlmostEqual(x + 300, summary["horizontal_range"], 2)
+            self.assertAlmostEqual(y + 250, 0)
+            track.max_height_marker.showturtle.assert_called_once()
+        # The info text is only redrawn when it changes.
+        self.assertLessEqual(scene.info.write.call_count, frames + 1)
+        self.assertIn("Longest range", scene.info.write.call_args.args[0])
+
+    def test_single_projectile_summary(self, fake_turtle):
+        scene = Scene()
+        summary = scene.add(10, 45)
+        scene.play(speed=100)
+        text = scene.info.write.call_args.args[0]
+        self.assertIn(f"Range: {summary['horizontal_range']} m", text)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,74 @@
+import random
+import unittest
+
+import numpy as np
+
+from projectile_motion.projectile_motion import calculate_projectile_motion
+from projectile_motion.trajectory_batch import (
+    RESULT_KEYS,
+    parameter_grid,
+    solve_grid,
+    solve_trajectories,
+    to_summaries,
+)
+
+
+class TestTrajectoryBatch(unittest.TestCase):
+
+    def test_matches_scalar_function(self):
+        rng = random.Random(1)
+        params = [
+            (
+                rng.uniform(1, 100),
+                rng.uniform(0, 90),
+                rng.choice([0, rng.uniform(0, 50)]),
+                rng.uniform(1, 25),
+            )
+            for _ in range(200)
+        ]
+        velocity, angle, height, gravity = (np.array(column) for column in zip(*params))
+
+        results = solve_trajectories(velocity, angle, height, gravity)
+
+        for i, (v, a, h, g) in enumerate(params):
+            vx, vy, flight_time, summary = calculate_projectile_motion(v, a, h, g)
+            self.assertAlmostEqual(results["velocity_x"][i], vx)
+            self.assertAlmostEqual(results["velocity_y"][i], vy)
+            self.assertAlmostEqual(results["flight_time"][i], flight_time)
+            for key in RESULT_KEYS:
+                self.assertAlmostEqual(results[key][i], summary[key], places=1)
+
+    def test_results_are_unrounded(self):
+        results = solve_trajectories(20, 45)
+
+        self.assertNotEqual(float(results["flight_time"]), 2.88)
+        self.assertAlmostEqual(float(results["flight_time"]), 2.8832, places=4)
+
+    def test_broadcasting(self):
+        results = solve_trajectories([10, 20, 30], 45, height=[[0], [10]])
+
+        self.assertEqual(results["horizontal_range"].shape, (2, 3))
+
+    def test_parameter_grid(self):
+        grid = parameter_grid([10, 20], [30, 45, 60], heights=[0, 5])
+
+        self.assertEqual(len(grid["velocity"]), 12)
+        self.assertEqual(list(grid["velocity"][:6]), [10] * 6)
+        self.assertEqual(list(grid["angle"][:2]), [30, 30])
+        self.assertEqual(set(grid["gravity"]), {9.81})
+
+    def test_solve_grid_and_summaries(self):
+        results = solve_grid([20], [45], heights=[0, 10])
+        summaries = list(to_summaries(results))
+
+        self.assertEqual(summaries[0], calculate_projectile_motion(20, 45, 0)[3])
+        self.assertEqual(summaries[1], calculate_projectile_motion(20, 45, 10)[3])
+
+    def test_downward_launch_from_ground(self):
+        results = solve_trajectories(20, -10)
+
+        self.assertEqual(float(results["flight_time"]), 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
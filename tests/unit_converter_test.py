@@ -1,11 +1,29 @@
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
 import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest import mock
+from unit_converter.dimensions import conversion_factor
 from unit_converter.unit_converter import (
+    BASE_SYMBOLS,
+    UNITS,
+    cli_interface,
+    conversion_factors,
+    convert,
+    convert_file,
+    convert_stream,
     convert_temperature,
     convert_length,
     convert_weight,
     convert_speed,
     convert_pressure,
     convert_energy,
+    get_unit_choices,
+    parse_column_conversion,
 )
 
 
@@ -31,7 +49,7 @@ class TestUnitConverter(unittest.TestCase):
         self.assertAlmostEqual(convert_length(1000, "Meters", "Kilometers"), 1)
 
     def test_length_miles_to_meters(self):
-        self.assertAlmostEqual(convert_length(1, "Miles", "Meters"), 1609.34)
+        self.assertAlmostEqual(convert_length(1, "Miles", "Meters"), 1609.344)
 
     def test_length_feet_to_meters(self):
         self.assertAlmostEqual(convert_length(1, "Feet", "Meters"), 0.3048)
@@ -81,6 +99,169 @@ class TestUnitConverter(unittest.TestCase):
     def test_energy_kilowatt_hour_to_joule(self):
         self.assertAlmostEqual(convert_energy(1, "Kilowatt-Hour", "Joule"), 3.6e6)
 
+    # Registry Tests
+    def test_aliases(self):
+        self.assertAlmostEqual(convert(100, "C", "°F"), 212)
+        self.assertAlmostEqual(convert(1, "km", "Meters"), 1000)
+        self.assertAlmostEqual(convert(1, "kWh", "J"), 3.6e6)
+
+    def test_round_trip_all_units(self):
+        for category, units in UNITS.items():
+            self.assertEqual(get_unit_choices(category), list(units))
+            for from_unit in units:
+                for to_unit in units:
+                    result = convert(37.5, from_unit, to_unit, category)
+                    self.assertAlmostEqual(convert(result, to_unit, from_unit), 37.5)
+
+    def test_compound_units_fall_back_to_dimensions(self):
+        self.assertAlmostEqual(convert(1, "lbf/in^2", "Pa"), 6894.757, places=3)
+        self.assertAlmostEqual(convert(1, "kg", "g"), 1000)
+        with self.assertRaises(ValueError):
+            convert(1, "lbf/in^2", "Pa", "Pressure")
+
+    def test_units_mean_the_same_in_every_pair(self):
+        # "C" is Celsius, also when paired with a unit only the engine knows.
+        self.assertAlmostEqual(convert(1, "C", "degF"), 33.8)
+        self.assertAlmostEqual(convert(100, "°C", "K"), 373.15)
+        with self.assertRaises(ValueError):
+            convert(1, "C", "mC")
+        self.assertEqual(convert(1, "mi", "mm"), convert(1, "mi", "m") * 1000)
+        self.assertEqual(convert(1, "mi", "m"), 1609.344)
+        self.assertAlmostEqual(convert(1, "lb", "mg"), 453592.37)
+        self.assertAlmostEqual(convert(60, "mph", "km/h"), 96.56064)
+
+    def test_registry_matches_dimensions(self):
+        # Every registry name the engine also knows has the same definition
+        # there, apart from "C", which the registry reads as Celsius.
+        for category, units in UNITS.items():
+            for name, unit in units.items():
+                for alias in (name, *unit.aliases):
+                    base = BASE_SYMBOLS[category]
+                    try:
+                        expected = conversion_factor(alias, base)
+                    except ValueError:
+                        continue
+                    if alias != "C":
+                        with self.subTest(alias=alias):
+                            self.assertEqual(conversion_factors(alias, base), expected)
+
+    def test_unsupported_units(self):
+        with self.assertRaises(ValueError):
+            convert(1, "Meters", "Grams")
+        with self.assertRaises(ValueError):
+            convert_length(1, "Celsius", "Kelvin")
+        with self.assertRaises(ValueError):
+            convert_speed(1, "Meters/Second", "Furlongs/Fortnight")
+
+
+class TestStreamingConversion(unittest.TestCase):
+
+    def test_csv_columns(self):
+        source = io.StringIO("id,temp,p\n1,100,1\n2,,2\n3,0,0.5\n")
+        output = io.StringIO()
+        conversions = [
+            parse_column_conversion("temp:C:F"),
+            parse_column_conversion("p:Bar:Pascal"),
+        ]
+        self.assertEqual(convert_stream(source, output, conversions, chunk_size=2), 3)
+        self.assertEqual(
+            output.getvalue().splitlines(),
+            ["id,temp,p", "1,212.0,100000.0", "2,,200000.0", "3,32.0,50000.0"],
+        )
+
+    def test_jsonl_records(self):
+        source = io.StringIO('{"t": 0}\n\n{"x": 1}\n{"t": null}\n')
+        output = io.StringIO()
+        conversions = [parse_column_conversion("t:Celsius:Kelvin")]
+        self.assertEqual(convert_stream(source, output, conversions, "jsonl"), 3)
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual(records, [{"t": 273.15}, {"x": 1}, {"t": None}])
+
+    def test_jsonl_rejects_non_object_records(self):
+        conversions = [parse_column_conversion("t:Celsius:Kelvin")]
+        for line in ("[1, 2]", "3", '"t"'):
+            with self.subTest(line=line):
+                source = io.StringIO('{"t": 0}\n' + line + "\n")
+                with self.assertRaisesRegex(
+                    ValueError, "Row 2: expected a JSON object"
+                ):
+                    convert_stream(source, io.StringIO(), conversions, "jsonl")
+
+    def test_convert_file_closes_input_if_output_fails(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False) as f:
+            f.write("temp\n100\n")
+        self.addCleanup(os.remove, f.name)
+        readings = open(f.name, newline="")
+        conversions = [parse_column_conversion("temp:C:F")]
+
+        with mock.patch(
+            "unit_converter.unit_converter.open",
+            side_effect=[readings, OSError("No space left on device")],
+        ):
+            with self.assertRaisesRegex(OSError, "No space"):
+                convert_file(f.name, conversions, "converted.csv")
+
+        self.assertTrue(readings.closed)
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            parse_column_conversion("temp")
+        with self.assertRaises(ValueError):
+            parse_column_conversion("temp:C:km")
+        conversions = [parse_column_conversion("temp:C:F")]
+        with self.assertRaisesRegex(ValueError, "Unknown column"):
+            convert_stream(io.StringIO("t\n1\n"), io.StringIO(), conversions)
+        with self.assertRaisesRegex(ValueError, "Row 2"):
+            convert_stream(io.StringIO("temp\n1\nx\n"), io.StringIO(), conversions)
+
+    def test_cli_file_mode(self):
+        with tempfile.TemporaryDirectory() as directory:
+            input_path = os.path.join(directory, "readings.csv")
+            output_path = os.path.join(directory, "converted.csv")
+            with open(input_path, "w") as input_file:
+                input_file.write("speed\n36\n")
+            cli_interface(
+                [
+                    "--input",
+                    input_path,
+                    "--convert",
+                    "speed:km/h:m/s",
+                    "--output",
+                    output_path,
+                ]
+            )
+            with open(output_path) as output_file:
+                self.assertEqual(output_file.read().split(), ["speed", "10.0"])
+
+
+class TestStartup(unittest.TestCase):
+
+    def test_import_skips_interactive_packages(self):
+        code = (
+            "import sys, unit_converter.unit_converter; "
+            "print([m for m in ('questionary', 'rich', 'tabulate') if m in sys.modules])"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        self.assertEqual(result.stdout.strip(), "[]")
+
+    def test_plain_output(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            cli_interface(
+                ["--category", "Temperature", "--value", "0"]
+                + ["--from-unit", "C", "--to-unit", "F", "--plain"]
+            )
+        self.assertEqual(output.getvalue(), "32.0\n")
+
+    def test_cli_reports_bad_units_as_usage_errors(self):
+        for unit in ("1e400 m", "0 m"):
+            with self.assertRaises(SystemExit), redirect_stderr(io.StringIO()):
+                cli_interface(
+                    ["--value", "1", "--from-unit", unit, "--to-unit", "m", "--plain"]
+                )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+
+import numpy as np
+
+from unit_converter.unit_converter import UNITS, convert
+from unit_converter.vectorized import convert_array, convert_columns
+
+
+class TestVectorizedConversion(unittest.TestCase):
+
+    def test_matches_scalar_results(self):
+        values = np.linspace(-500, 500, 101)
+        for category, units in UNITS.items():
+            for from_unit in units:
+                for to_unit in units:
+                    result = convert_array(values, from_unit, to_unit, category)
+                    expected = [convert(v, from_unit, to_unit) for v in values]
+                    np.testing.assert_array_equal(result, expected)
+
+    def test_dtypes_and_in_place(self):
+        self.assertEqual(convert_array([0, 100], "C", "F").tolist(), [32, 212])
+        readings = np.array([0, 100], dtype=np.float32)
+        result = convert_array(readings, "Celsius", "Kelvin", out=readings)
+        self.assertIs(result, readings)
+        self.assertEqual(result.dtype, np.float32)
+        np.testing.assert_allclose(readings, [273.15, 373.15])
+
+    def test_in_place_needs_a_float_array(self):
+        counts = np.array([0, 100])
+        with self.assertRaisesRegex(ValueError, "floating-point"):
+            convert_array(counts, "C", "K", out=counts)
+        with self.assertRaisesRegex(ValueError, "floating-point"):
+            convert_columns(
+                [[1, 2]], ["m", "m"], ["km", "km"], out=np.zeros((1, 2), int)
+            )
+        self.assertEqual(counts.tolist(), [0, 100])
+
+    def test_non_finite_values(self):
+        values = np.array([np.nan, np.inf, -np.inf])
+        result = convert_array(values, "Fahrenheit", "Celsius")
+        self.assertTrue(np.isnan(result[0]))
+        self.assertEqual(result[1:].tolist(), [np.inf, -np.inf])
+
+    def test_convert_columns(self):
+        table = np.array([[0.0, 1.0, 1.0], [100.0, 2.5, 0.0]])
+        result = convert_columns(
+            table, ["C", "km", "Bar"], ["Fahrenheit", "Meters", "PSI"]
+        )
+        for column, (a, b) in enumerate(
+            [("C", "Fahrenheit"), ("km", "Meters"), ("Bar", "PSI")]
+        ):
+            np.testing.assert_allclose(
+                result[:, column], [convert(v, a, b) for v in table[:, column]]
+            )
+
+    def test_bad_units(self):
+        with self.assertRaises(ValueError):
+            convert_array([1.0], "Meters", "Kelvin")
+        with self.assertRaises(ValueError):
+            convert_array([1.0], "C", "K", category="Length")
+        with self.assertRaises(ValueError):
+            convert_columns([[1.0, 2.0]], ["m"], ["km"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,367 @@
+"""
+Dimensional analysis for compound unit expressions.
+
+Expressions such as "kg*m/s^2", "kWh/100km" or "lbf/in^2" are parsed into a
+factor to SI base units and a vector of base-dimension exponents, so any two
+units with the same dimensions can be converted. Units may carry SI prefixes
+("km", "mPa", "GWh"), and parsed expressions and conversion factors are cached
+so repeated conversions skip the parser.
+
+Grammar, from loosest to tightest binding:
+
+    expression := group (("*" | "/") group)*
+    group      := power+                 (juxtaposition, e.g. "100km", "N m")
+    power      := atom ("^" integer | "**" integer | "²" | "³")?
+    atom       := number | unit | "(" expression ")"
+
+Juxtaposition binds tighter than "/", so "kWh/100km" is kWh per 100 km and
+"J/mol K" is joules per mole-kelvin.
+"""
+
+import re
+from collections import namedtuple
+from fractions import Fraction
+from functools import lru_cache
+
+BASE_DIMENSIONS = (
+    "length",
+    "mass",
+    "time",
+    "current",
+    "temperature",
+    "amount",
+    "luminosity",
+)
+
+# A factor to SI base units, exponents of BASE_DIMENSIONS, and an offset that
+# only temperature scales such as degC have. Factors and offsets are exact
+# Fractions; conversion_factor rounds each pair to floats once.
+UnitExpression = namedtuple("UnitExpression", ["factor", "dimensions", "offset"])
+
+BASE_UNITS = {"m": 0, "kg": 1, "s": 2, "A": 3, "K": 4, "mol": 5, "cd": 6}
+
+# Every other unit is defined by an expression of units defined before it.
+DEFINITIONS = {
+    "g": "1e-3 kg",
+    "t": "1000 kg",
+    "min": "60 s",
+    "h": "60 min",
+    "d": "24 h",
+    "Hz": "1/s",
+    "N": "kg*m/s^2",
+    "J": "N*m",
+    "W": "J/s",
+    "Pa": "N/m^2",
+    "C": "A*s",
+    "V": "W/A",
+    "ohm": "V/A",
+    "Ω": "ohm",
+    "L": "1e-3 m^3",
+    "l": "L",
+    "bar": "1e5 Pa",
+    "atm": "101325 Pa",
+    "Wh": "W*h",
+    "eV": "1.602176634e-19 J",
+    "cal": "4.184 J",
+    "in": "0.0254 m",
+    "ft": "12 in",
+    "yd": "3 ft",
+    "mi": "5280 ft",
+    "nmi": "1852 m",
+    "lb": "0.45359237 kg",
+    "oz": "lb/16",
+    "gn": "9.80665 m/s^2",
+    "lbf": "lb*gn",
+    "psi": "lbf/in^2",
+    "mph": "mi/h",
+    "kn": "nmi/h",
+    "gal": "3.785411784 L",
+}
+
+# Temperature scales with an offset can only be converted on their own.
+AFFINE_UNITS = {
+    "degC": ("K", Fraction("273.15")),
+    "°C": ("K", Fraction("273.15")),
+    "degF": ("K*5/9", Fraction("459.67") * 5 / 9),
+    "°F": ("K*5/9", Fraction("459.67") * 5 / 9),
+}
+
+PREFIXABLE = set("m g s A K mol cd Hz N J W Pa C V ohm Ω L l bar Wh eV cal".split())
+
+# SI prefixes as powers of ten.
+PREFIXES = {
+    "Y": 24,
+    "Z": 21,
+    "E": 18,
+    "P": 15,
+    "T": 12,
+    "G": 9,
+    "M": 6,
+    "k": 3,
+    "h": 2,
+    "da": 1,
+    "d": -1,
+    "c": -2,
+    "m": -3,
+    "u": -6,
+    "µ": -6,
+    "μ": -6,
+    "n": -9,
+    "p": -12,
+    "f": -15,
+    "a": -18,
+    "z": -21,
+    "y": -24,
+}
+
+DIMENSIONLESS = (0,) * len(BASE_DIMENSIONS)
+
+# Limits that keep exact factors small, e.g. for "km^99999999".
+MAX_EXPONENT = 64
+MAX_FACTOR_BITS = 4096
+
+_TOKEN = re.compile(
+    r"\s*(?:(?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)"
+    r"|(?P<name>[A-Za-z_°µμΩ]+)"
+    r"|(?P<op>\*\*|[*/^()·²³-]))"
+)
+
+
+def format_dimensions(dimensions):
+    """
+    Formats a dimension vector, e.g. "length*mass/time^2".
+    """
+    numerator = []
+    denominator = []
+    for name, power in zip(BASE_DIMENSIONS, dimensions):
+        if power:
+            side = numerator if power > 0 else denominator
+            side.append(name if abs(power) == 1 else f"{name}^{abs(power)}")
+    text = "*".join(numerator) or "1"
+    if denominator:
+        text += "/" + "/".join(denominator)
+    return "dimensionless" if text == "1" else text
+
+
+def _tokenize(text):
+    tokens = []
+    position = 0
+    text = text.strip()
+    while position < len(text):
+        match = _TOKEN.match(text, position)
+        if not match or match.end() == position:
+            raise ValueError(f"Cannot parse unit {text!r} at {text[position:]!r}")
+        kind = match.lastgroup
+        tokens.append((kind, match.group(kind)))
+        position = match.end()
+    return tokens
+
+
+class _Parser:
+    def __init__(self, text):
+        self.text = text
+        self.tokens = _tokenize(text)
+        self.position = 0
+
+    def error(self, message):
+        return ValueError(f"Cannot parse unit {self.text!r}: {message}")
+
+    def peek(self):
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+        return None, None
+
+    def take(self):
+        token = self.peek()
+        self.position += 1
+        return token
+
+    def parse(self):
+        if not self.tokens:
+            raise self.error("empty expression")
+        result = self.expression()
+        if self.position < len(self.tokens):
+            raise self.error(f"unexpected {self.peek()[1]!r}")
+        return result
+
+    def expression(self):
+        factor, dimensions = self.group()
+        while self.peek()[1] in ("*", "·", "/"):
+            _, op = self.take()
+            other_factor, other_dimensions = self.group()
+            if op == "/":
+                if not other_factor:
+                    raise self.error("division by zero")
+                factor /= other_factor
+                dimensions = tuple(a - b for a, b in zip(dimensions, other_dimensions))
+            else:
+                factor *= other_factor
+                dimensions = tuple(a + b for a, b in zip(dimensions, other_dimensions))
+        return factor, dimensions
+
+    def group(self):
+        factor, dimensions = self.power()
+        while self.peek()[0] in ("number", "name") or self.peek()[1] == "(":
+            other_factor, other_dimensions = self.power()
+            factor *= other_factor
+            dimensions = tuple(a + b for a, b in zip(dimensions, other_dimensions))
+        return factor, dimensions
+
+    def power(self):
+        factor, dimensions = self.atom()
+        kind, value = self.peek()
+        if value in ("²", "³"):
+            self.take()
+            exponent = 2 if value == "²" else 3
+        elif value in ("^", "**"):
+            self.take()
+            sign = -1 if self.peek()[1] == "-" else 1
+            if sign < 0:
+                self.take()
+            kind, value = self.take()
+            if kind != "number" or not value.isdigit():
+                raise self.error("exponents must be integers")
+            exponent = sign * int(value)
+        else:
+            return factor, dimensions
+        if abs(exponent) > MAX_EXPONENT:
+            raise self.error(f"exponents must be at most {MAX_EXPONENT} in size")
+        if exponent < 0 and not factor:
+            raise self.error("division by zero")
+        bits = max(factor.numerator.bit_length(), factor.denominator.bit_length())
+        if bits * abs(exponent) > MAX_FACTOR_BITS:
+            raise self.error("factor is too large")
+        return factor**exponent, tuple(power * exponent for power in dimensions)
+
+    def atom(self):
+        kind, value = self.take()
+        if kind == "number":
+            # Check the decimal exponent first, at about 3.3 bits per digit;
+            # Fraction("1e999999999") would build a billion-digit number.
+            _, _, exponent = value.lower().partition("e")
+            if exponent and abs(int(exponent)) > MAX_FACTOR_BITS * 3 // 10:
+                raise self.error("factor is too large")
+            number = Fraction(value)
+            if max(number.numerator, number.denominator).bit_length() > MAX_FACTOR_BITS:
+                raise self.error("factor is too large")
+            return number, DIMENSIONLESS
+        if kind == "name":
+            unit = _resolve(value)
+            return unit.factor, unit.dimensions
+        if value == "(":
+            result = self.expression()
+            if self.take()[1] != ")":
+                raise self.error("missing ')'")
+            return result
+        raise self.error("unexpected end" if value is None else f"unexpected {value!r}")
+
+
+@lru_cache(maxsize=None)
+def _resolve(name):
+    if name in AFFINE_UNITS:
+        raise ValueError(
+            f"{name} has an offset and cannot be combined with other units; "
+            "use K for temperature differences"
+        )
+    if name in BASE_UNITS:
+        dimensions = [0] * len(BASE_DIMENSIONS)
+        dimensions[BASE_UNITS[name]] = 1
+        return UnitExpression(Fraction(1), tuple(dimensions), Fraction(0))
+    if name in DEFINITIONS:
+        return parse_unit(DEFINITIONS[name])
+    for prefix in sorted(PREFIXES, key=len, reverse=True):
+        unit = name[len(prefix) :]
+        if name.startswith(prefix) and unit in PREFIXABLE:
+            resolved = _resolve(unit)
+            return UnitExpression(
+                Fraction(10) ** PREFIXES[prefix] * resolved.factor,
+                resolved.dimensions,
+                Fraction(0),
+            )
+    raise ValueError(f"Unknown unit: {name}")
+
+
+@lru_cache(maxsize=4096)
+def parse_unit(text):
+    """
+    Parses a unit expression.
+
+    Parameters:
+    text (str): Expression such as "kg*m/s^2", "kWh/100km" or "degC".
+
+    Returns:
+    UnitExpression: Factor to SI base units, dimension exponents in the order
+    of BASE_DIMENSIONS, and offset (non-zero only for degC and degF).
+
+    Raises:
+    ValueError: If the expression cannot be parsed, its factor is zero, or an
+    exponent is larger than MAX_EXPONENT.
+    """
+    text = text.strip()
+    if text in AFFINE_UNITS:
+        definition, offset = AFFINE_UNITS[text]
+        unit = parse_unit(definition)
+        return UnitExpression(unit.factor, unit.dimensions, offset)
+    factor, dimensions = _Parser(text).parse()
+    if not factor:
+        raise ValueError(f"Cannot parse unit {text!r}: factor must not be zero")
+    return UnitExpression(factor, dimensions, Fraction(0))
+
+
+def dimensions_of(text):
+    """
+    Returns the dimensions of a unit expression as text, e.g. "length/time".
+    """
+    return format_dimensions(parse_unit(text).dimensions)
+
+
+def is_compatible(from_unit, to_unit):
+    """
+    Returns whether two unit expressions have the same dimensions.
+    """
+    return parse_unit(from_unit).dimensions == parse_unit(to_unit).dimensions
+
+
+@lru_cache(maxsize=4096)
+def conversion_factor(from_unit, to_unit):
+    """
+    Returns (scale, shift) such that a converted value is value * scale + shift.
+
+    Raises:
+    ValueError: If an expression cannot be parsed or the dimensions differ.
+    """
+    return expression_factors(
+        parse_unit(from_unit), parse_unit(to_unit), from_unit, to_unit
+    )
+
+
+def expression_factors(source, target, from_unit, to_unit):
+    """
+    Returns (scale, shift) between two parsed UnitExpressions. from_unit and
+    to_unit are only used to name the units in errors.
+
+    Raises:
+    ValueError: If the dimensions differ or a factor does not fit in a float.
+    """
+    if source.dimensions != target.dimensions:
+        raise ValueError(
+            f"Incompatible units: {from_unit} ({format_dimensions(source.dimensions)})"
+            f" and {to_unit} ({format_dimensions(target.dimensions)})"
+        )
+    try:
+        return (
+            float(source.factor / target.factor),
+            float((source.offset - target.offset) / target.factor),
+        )
+    except OverflowError:
+        raise ValueError(
+            f"Conversion factor from {from_unit} to {to_unit} is out of float range"
+        ) from None
+
+
+def convert(value, from_unit, to_unit):
+    """
+    Converts a value, or a NumPy array of values, between unit expressions.
+    """
+    scale, shift = conversion_factor(from_unit, to_unit)
+    return value * scale + shift
@@ -1,7 +1,12 @@
 import argparse
-import questionary
-from rich.console import Console
-from tabulate import tabulate
+import csv
+import json
+import sys
+from collections import namedtuple
+from contextlib import ExitStack
+from fractions import Fraction
+from functools import lru_cache
+from itertools import islice
 
 LOGO = r"""
  _______         __ __   ______                                __              
@@ -10,83 +15,227 @@ LOGO = r"""
 |_______||__|__||__|____|______||_____|__|__|\___/|_____|__|  |____|_____|__|  
 """
 
-console = Console()
+# questionary, rich and tabulate are only imported once they are needed, so
+# flag-based and file conversions start quickly.
+_console = None
+
+
+def get_console():
+    """
+    Returns the shared rich Console, creating it on first use.
+    """
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
+
+
+# Unit registry
+Unit = namedtuple("Unit", ["factor", "offset", "aliases"], defaults=(0.0, ()))
+
+# Every unit converts to its category's base unit as value * factor + offset.
+# Factors and offsets may be Fractions so the precomputed pairs stay exact, and
+# match the definitions in dimensions.py, so a unit converts the same way
+# whether or not the other unit of the pair is in the registry.
+UNITS = {
+    "Temperature": {
+        "Celsius": Unit(1, Fraction("273.15"), ("C", "°C")),
+        "Fahrenheit": Unit(Fraction(5, 9), Fraction("459.67") * 5 / 9, ("F", "°F")),
+        "Kelvin": Unit(1, aliases=("K",)),
+    },
+    "Length": {
+        "Meters": Unit(1, aliases=("m", "Meter")),
+        "Kilometers": Unit(1000, aliases=("km", "Kilometer")),
+        "Miles": Unit(Fraction("1609.344"), aliases=("mi", "Mile")),
+        "Feet": Unit(0.3048, aliases=("ft", "Foot")),
+    },
+    "Weight": {
+        "Grams": Unit(1, aliases=("g", "Gram")),
+        "Kilograms": Unit(1000, aliases=("kg", "Kilogram")),
+        "Pounds": Unit(Fraction("453.59237"), aliases=("lb", "lbs", "Pound")),
+        "Tons": Unit(1_000_000, aliases=("t", "Ton")),
+    },
+    "Speed": {
+        "Meters/Second": Unit(1, aliases=("m/s",)),
+        "Kilometers/Hour": Unit(Fraction(1000, 3600), aliases=("km/h", "kph")),
+        "Miles/Hour": Unit(Fraction("1609.344") / 3600, aliases=("mi/h", "mph")),
+    },
+    "Pressure": {
+        "Pascal": Unit(1, aliases=("Pa",)),
+        "Bar": Unit(100000, aliases=("bar",)),
+        # Pound-force per square inch, in grams, m/s^2 and meters.
+        "PSI": Unit(
+            Fraction("453.59237")
+            * Fraction("9.80665")
+            / 1000
+            / Fraction("0.0254") ** 2,
+            aliases=("psi",),
+        ),
+    },
+    "Energy": {
+        "Joule": Unit(1, aliases=("J", "Joules")),
+        "Calorie": Unit(4.184, aliases=("cal", "Calories")),
+        "Kilowatt-Hour": Unit(3.6e6, aliases=("kWh",)),
+    },
+}
+
+CATEGORIES = list(UNITS)
+
+# Each category's base unit as a dimensions.py expression, so registry units
+# can be combined with any unit the dimensional analysis engine knows.
+BASE_SYMBOLS = {
+    "Temperature": "K",
+    "Length": "m",
+    "Weight": "g",
+    "Speed": "m/s",
+    "Pressure": "Pa",
+    "Energy": "J",
+}
+
+
+def _exact(number):
+    # Floats are read as the decimal they were written as, e.g. 1609.34.
+    return Fraction(repr(number)) if isinstance(number, float) else Fraction(number)
+
+
+def _build_conversions():
+    """
+    Precomputes (category, scale, shift) for every pair of unit names and
+    aliases in the same category, so that a conversion is value * scale + shift.
+    Pairs are combined in exact arithmetic and rounded to floats once.
+    """
+    conversions = {}
+    for category, units in UNITS.items():
+        exact = [
+            ((name, *unit.aliases), _exact(unit.factor), _exact(unit.offset))
+            for name, unit in units.items()
+        ]
+        for from_names, from_factor, from_offset in exact:
+            for to_names, to_factor, to_offset in exact:
+                conversion = (
+                    category,
+                    float(from_factor / to_factor),
+                    float((from_offset - to_offset) / to_factor),
+                )
+                for from_name in from_names:
+                    for to_name in to_names:
+                        conversions[from_name, to_name] = conversion
+    return conversions
+
+
+_CONVERSIONS = _build_conversions()
+
+_REGISTRY_UNITS = {
+    name: (category, unit)
+    for category, units in UNITS.items()
+    for canonical, unit in units.items()
+    for name in (canonical, *unit.aliases)
+}
 
 
 # Conversion functions
+def _dimensions():
+    # Loaded on first use. When this file runs as a script, its own directory
+    # rather than the repository root is on sys.path.
+    if __package__:
+        from unit_converter import dimensions
+    else:
+        import dimensions
+    return dimensions
+
+
+def _unit_expression(name):
+    """
+    Resolves one unit name to a dimensions.UnitExpression. Registry names and
+    aliases keep their registry meaning whatever they are paired with, so "C"
+    is always Celsius; any other name is parsed by the engine.
+    """
+    dimensions = _dimensions()
+    if name not in _REGISTRY_UNITS:
+        return dimensions.parse_unit(name)
+    category, unit = _REGISTRY_UNITS[name]
+    base = dimensions.parse_unit(BASE_SYMBOLS[category])
+    return dimensions.UnitExpression(
+        _exact(unit.factor) * base.factor,
+        base.dimensions,
+        _exact(unit.offset) * base.factor,
+    )
+
+
+@lru_cache(maxsize=4096)
+def _compound_factors(from_unit, to_unit):
+    return _dimensions().expression_factors(
+        _unit_expression(from_unit), _unit_expression(to_unit), from_unit, to_unit
+    )
+
+
+def conversion_factors(from_unit, to_unit, category=None):
+    """
+    Returns (scale, shift) such that a converted value is value * scale + shift.
+    Without a category, units missing from the registry, such as "lbf/in^2",
+    are converted by dimensional analysis.
+    """
+    try:
+        unit_category, scale, shift = _CONVERSIONS[from_unit, to_unit]
+    except KeyError:
+        if category is None:
+            return _compound_factors(from_unit, to_unit)
+        raise ValueError(f"Unsupported units: {from_unit} to {to_unit}") from None
+    if category is not None and category != unit_category:
+        raise ValueError(f"Unsupported units for {category}: {from_unit} to {to_unit}")
+    return scale, shift
+
+
+def convert(value, from_unit, to_unit, category=None):
+    """
+    Converts a value between two units of the same category.
+    """
+    scale, shift = conversion_factors(from_unit, to_unit, category)
+    return value * scale + shift
+
+
 def convert_temperature(value, from_unit, to_unit):
     """
     Converts temperature between Celsius, Fahrenheit, and Kelvin.
     """
-    if from_unit == to_unit:
-        return value
-
-    if from_unit == "Celsius":
-        if to_unit == "Fahrenheit":
-            return (value * 9 / 5) + 32
-        elif to_unit == "Kelvin":
-            return value + 273.15
-    elif from_unit == "Fahrenheit":
-        if to_unit == "Celsius":
-            return (value - 32) * 5 / 9
-        elif to_unit == "Kelvin":
-            return (value + 459.67) * 5 / 9
-    elif from_unit == "Kelvin":
-        if to_unit == "Celsius":
-            return value - 273.15
-        elif to_unit == "Fahrenheit":
-            return (value * 9 / 5) - 459.67
+    return convert(value, from_unit, to_unit, "Temperature")
 
 
 def convert_weight(value, from_unit, to_unit):
     """
     Converts weight between grams, kilograms, pounds, and tons.
     """
-    weight_units = {"Grams": 1, "Kilograms": 1000, "Pounds": 453.592, "Tons": 1_000_000}
-    return value * (weight_units[from_unit] / weight_units[to_unit])
+    return convert(value, from_unit, to_unit, "Weight")
 
 
 def convert_speed(value, from_unit, to_unit):
     """
     Converts speed between meters/second, kilometers/hour, and miles/hour.
     """
-    speed_units = {
-        "Meters/Second": 1,
-        "Kilometers/Hour": 3.6,  # 1 meter/second = 3.6 kilometers/hour
-        "Miles/Hour": 2.23694,  # 1 meter/second = 2.23694 miles/hour
-    }
-
-    if from_unit == to_unit:
-        return value
-    elif from_unit in speed_units and to_unit in speed_units:
-        # Dönüşüm katsayıları doğru kullanılıyor
-        return value * (speed_units[to_unit] / speed_units[from_unit])
-    else:
-        raise ValueError(f"Unsupported units: {from_unit} to {to_unit}")
+    return convert(value, from_unit, to_unit, "Speed")
 
 
 def convert_pressure(value, from_unit, to_unit):
     """
     Converts pressure between Pascal, Bar, and PSI.
     """
-    pressure_units = {"Pascal": 1, "Bar": 100000, "PSI": 6894.76}
-    return value * (pressure_units[from_unit] / pressure_units[to_unit])
+    return convert(value, from_unit, to_unit, "Pressure")
 
 
 def convert_energy(value, from_unit, to_unit):
     """
     Converts energy between Joules, Calories, and Kilowatt-Hour.
     """
-    energy_units = {"Joule": 1, "Calorie": 4.184, "Kilowatt-Hour": 3.6e6}
-    return value * (energy_units[from_unit] / energy_units[to_unit])
+    return convert(value, from_unit, to_unit, "Energy")
 
 
 def convert_length(value, from_unit, to_unit):
     """
     Converts length between meters, kilometers, miles, and feet.
     """
-    length_units = {"Meters": 1, "Kilometers": 1000, "Miles": 1609.34, "Feet": 0.3048}
-    return value * (length_units[from_unit] / length_units[to_unit])
+    return convert(value, from_unit, to_unit, "Length")
 
 
 # Display results
@@ -94,35 +243,155 @@ def display_result(value, from_unit, to_unit, result):
     """
     Nicely formats and displays the conversion result.
     """
+    from tabulate import tabulate
+
     table = [[f"{value} {from_unit}", f"{result} {to_unit}"]]
-    console.print(tabulate(table, headers=["From", "To"], tablefmt="grid"))
+    get_console().print(tabulate(table, headers=["From", "To"], tablefmt="grid"))
 
 
 # Handle conversions
-def handle_conversion(category, value, from_unit, to_unit):
+def handle_conversion(category, value, from_unit, to_unit, plain=False):
     """
     Handles the conversion logic based on the selected category.
     """
-    if category == "Temperature":
-        result = convert_temperature(value, from_unit, to_unit)
-    elif category == "Length":
-        result = convert_length(value, from_unit, to_unit)
-    elif category == "Weight":
-        result = convert_weight(value, from_unit, to_unit)
-    elif category == "Speed":
-        result = convert_speed(value, from_unit, to_unit)
-    elif category == "Pressure":
-        result = convert_pressure(value, from_unit, to_unit)
-    elif category == "Energy":
-        result = convert_energy(value, from_unit, to_unit)
-    else:
-        console.print("Unknown category!", style="bold red")
+    if category is not None and category not in UNITS:
+        if plain:
+            print("Unknown category!", file=sys.stderr)
+        else:
+            get_console().print("Unknown category!", style="bold red")
         return
-    display_result(value, from_unit, to_unit, result)
+    result = convert(value, from_unit, to_unit, category)
+    if plain:
+        print(result)
+    else:
+        display_result(value, from_unit, to_unit, result)
+
+
+# Streaming file conversion
+def parse_column_conversion(spec):
+    """
+    Parses a COLUMN:FROM:TO spec into (column, scale, shift).
+    """
+    try:
+        column, from_unit, to_unit = spec.rsplit(":", 2)
+    except ValueError:
+        raise ValueError(f"Expected COLUMN:FROM:TO, got {spec!r}") from None
+    return (column, *conversion_factors(from_unit, to_unit))
+
+
+def _convert_cell(value, scale, shift, row):
+    if value is None or value == "":
+        return value
+    try:
+        return float(value) * scale + shift
+    except (TypeError, ValueError):
+        raise ValueError(f"Row {row}: cannot convert {value!r}") from None
+
+
+def _convert_csv(input_file, output_file, conversions, chunk_size):
+    reader = csv.reader(input_file)
+    writer = csv.writer(output_file)
+    header = next(reader, None)
+    if header is None:
+        return 0
+    indices = []
+    for column, scale, shift in conversions:
+        if column not in header:
+            raise ValueError(f"Unknown column: {column}")
+        indices.append((header.index(column), scale, shift))
+    writer.writerow(header)
+
+    count = 0
+    while True:
+        rows = list(islice(reader, chunk_size))
+        if not rows:
+            return count
+        for number, row in enumerate(rows, count + 1):
+            for index, scale, shift in indices:
+                if index < len(row):
+                    row[index] = _convert_cell(row[index], scale, shift, number)
+        writer.writerows(rows)
+        count += len(rows)
+
+
+def _convert_jsonl(input_file, output_file, conversions, chunk_size):
+    count = 0
+    while True:
+        lines = list(islice(input_file, chunk_size))
+        if not lines:
+            return count
+        records = []
+        for line in lines:
+            if not line.strip():
+                continue
+            count += 1
+            record = json.loads(line)
+            if not isinstance(record, dict):
+                raise ValueError(f"Row {count}: expected a JSON object")
+            for column, scale, shift in conversions:
+                if column in record:
+                    record[column] = _convert_cell(record[column], scale, shift, count)
+            records.append(json.dumps(record) + "\n")
+        output_file.writelines(records)
+
+
+def convert_stream(
+    input_file, output_file, conversions, input_format="csv", chunk_size=10000
+):
+    """
+    Converts columns of a CSV or JSON Lines stream chunk by chunk.
+
+    Only chunk_size rows are held in memory at a time. Empty cells and JSON
+    nulls are kept as they are, and JSON records without a column are passed
+    through unchanged.
+
+    Parameters:
+    input_file (file): Text stream to read.
+    output_file (file): Text stream to write, in the same format.
+    conversions (list): (column, scale, shift) tuples from
+    parse_column_conversion.
+    input_format (str): Either 'csv' or 'jsonl'.
+    chunk_size (int): Number of rows converted and written at once.
+
+    Returns:
+    int: The number of rows written.
+    """
+    if input_format == "csv":
+        return _convert_csv(input_file, output_file, conversions, chunk_size)
+    if input_format == "jsonl":
+        return _convert_jsonl(input_file, output_file, conversions, chunk_size)
+    raise ValueError(f"Unsupported input format: {input_format}")
+
+
+def convert_file(
+    input_path, conversions, output_path=None, input_format=None, chunk_size=10000
+):
+    """
+    Converts columns of a CSV or JSON Lines file ('-' for stdin) to a file or
+    stdout. The format is guessed from the file extension when not given.
+    """
+    if input_format is None:
+        input_format = (
+            "jsonl" if input_path.lower().endswith((".jsonl", ".ndjson")) else "csv"
+        )
+    with ExitStack() as stack:
+        input_file = (
+            sys.stdin
+            if input_path == "-"
+            else stack.enter_context(open(input_path, "r", newline=""))
+        )
+        output_file = (
+            sys.stdout
+            if output_path is None
+            else stack.enter_context(open(output_path, "w", newline=""))
+        )
+        return convert_stream(
+            input_file, output_file, conversions, input_format, chunk_size
+        )
 
 
 # CLI Interface for flag-based input
-def cli_interface():
+def cli_interface(argv=None):
     """
     Command Line Interface using argparse for flag-based operation.
     """
@@ -130,17 +399,76 @@ def cli_interface():
 
     parser.add_argument(
         "--category",
-        help="Category of conversion (Temperature, Length, Weight, Speed, Pressure, Energy)",
+        help=(
+            f"Category of conversion ({', '.join(CATEGORIES)}); optional, and "
+            "left out for compound units such as kg*m/s^2"
+        ),
         type=str,
     )
     parser.add_argument("--value", help="Value to be converted", type=float)
     parser.add_argument("--from-unit", help="Unit to convert from", type=str)
     parser.add_argument("--to-unit", help="Unit to convert to", type=str)
+    parser.add_argument(
+        "--plain",
+        action="store_true",
+        help="Print only the converted value, without the logo or table",
+    )
 
-    args = parser.parse_args()
+    parser.add_argument(
+        "--input",
+        metavar="FILE",
+        help="Convert columns of a CSV or JSON Lines file ('-' for stdin)",
+    )
+    parser.add_argument(
+        "--convert",
+        action="append",
+        metavar="COLUMN:FROM:TO",
+        help="Column to convert in --input mode; may be repeated",
+    )
+    parser.add_argument(
+        "--input-format",
+        choices=["csv", "jsonl"],
+        help="Format of --input (default: from the extension, else csv)",
+    )
+    parser.add_argument(
+        "--output", metavar="FILE", help="Write --input results to FILE, not stdout"
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=10000,
+        help="Rows converted at a time in --input mode (default: 10000)",
+    )
 
-    if args.category and args.value and args.from_unit and args.to_unit:
-        handle_conversion(args.category, args.value, args.from_unit, args.to_unit)
+    args = parser.parse_args(argv)
+
+    if args.input:
+        if not args.convert:
+            parser.error("--input requires at least one --convert COLUMN:FROM:TO")
+        try:
+            conversions = [parse_column_conversion(spec) for spec in args.convert]
+            convert_file(
+                args.input,
+                conversions,
+                args.output,
+                args.input_format,
+                args.chunk_size,
+            )
+        except ValueError as e:
+            parser.error(str(e))
+        return
+
+    if not args.plain:
+        print(LOGO)
+    if args.value is not None and args.from_unit and args.to_unit:
+        try:
+            handle_conversion(
+                args.category, args.value, args.from_unit, args.to_unit, args.plain
+            )
+        except ValueError as e:
+            parser.error(str(e))
+    elif args.plain:
+        parser.error("--plain requires --value, --from-unit and --to-unit")
     else:
         interactive_menu()
 
@@ -150,10 +478,12 @@ def interactive_menu():
     """
     Interactive menu that uses PyInquirer to create navigable selections for conversion.
     """
+    import questionary
+
     answers = {
         "category": questionary.select(
             "Select the category for conversion:",
-            choices=["Temperature", "Length", "Weight", "Speed", "Pressure", "Energy"],
+            choices=CATEGORIES,
         ).ask(),
         "value": float(questionary.text("Enter the value to be converted:").ask()),
     }
@@ -175,21 +505,9 @@ def get_unit_choices(category):
     """
     Returns the appropriate units for the selected category.
     """
-    if category == "Temperature":
-        return ["Celsius", "Fahrenheit", "Kelvin"]
-    elif category == "Length":
-        return ["Meters", "Kilometers", "Miles", "Feet"]
-    elif category == "Weight":
-        return ["Grams", "Kilograms", "Pounds", "Tons"]
-    elif category == "Speed":
-        return ["Meters/Second", "Kilometers/Hour", "Miles/Hour"]
-    elif category == "Pressure":
-        return ["Pascal", "Bar", "PSI"]
-    elif category == "Energy":
-        return ["Joule", "Calorie", "Kilowatt-Hour"]
+    return list(UNITS[category])
 
 
 # Entry point
 if __name__ == "__main__":
-    print(LOGO)
     cli_interface()
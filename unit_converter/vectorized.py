@@ -0,0 +1,83 @@
+"""
+NumPy-vectorized counterpart of unit_converter.convert.
+
+Converts whole arrays, or tables with one unit per column, with the registry's
+precomputed factors: one multiply and, for affine units such as temperatures,
+one add per element.
+
+Non-finite values are passed through: NaN stays NaN and +/-inf keeps its sign,
+since every scale in the registry is positive. No range checks are made, so
+temperatures below absolute zero are converted like any other value.
+"""
+
+import numpy as np
+
+from unit_converter.unit_converter import conversion_factors
+
+
+def _float_array(values):
+    values = np.asarray(values)
+    if not np.issubdtype(values.dtype, np.floating):
+        values = values.astype(np.float64)
+    return values
+
+
+def _check_out(out):
+    if out is not None and not np.issubdtype(out.dtype, np.floating):
+        raise ValueError(
+            f"out must be a floating-point array, not {out.dtype}; "
+            "convert integer arrays to float before converting in place"
+        )
+
+
+def convert_array(values, from_unit, to_unit, category=None, out=None):
+    """
+    Converts an array of values between two units of the same category.
+
+    Parameters:
+    values (array-like): Values in from_unit. Float arrays keep their dtype,
+    anything else is converted to float64.
+    from_unit (str): Unit or alias to convert from.
+    to_unit (str): Unit or alias to convert to.
+    category (str): If given, both units must belong to it.
+    out (numpy.ndarray): Optional floating-point output array, which may be
+    values itself for an in-place conversion of a float array.
+
+    Returns:
+    numpy.ndarray: The converted values.
+
+    Raises:
+    ValueError: If out is not a floating-point array.
+    """
+    _check_out(out)
+    scale, shift = conversion_factors(from_unit, to_unit, category)
+    values = _float_array(values)
+    out = np.multiply(values, values.dtype.type(scale), out=out)
+    if shift:
+        np.add(out, out.dtype.type(shift), out=out)
+    return out
+
+
+def convert_columns(values, from_units, to_units, out=None):
+    """
+    Converts a 2-D table with one unit per column in a single pass.
+
+    Parameters:
+    values (array-like): Table of shape (rows, columns).
+    from_units (list): Unit of each column.
+    to_units (list): Unit to convert each column to.
+    out (numpy.ndarray): Optional floating-point output array.
+
+    Returns:
+    numpy.ndarray: The converted table.
+    """
+    _check_out(out)
+    values = _float_array(values)
+    if values.ndim != 2 or not values.shape[1] == len(from_units) == len(to_units):
+        raise ValueError("Expected a 2-D table with one unit pair per column")
+    factors = [conversion_factors(a, b) for a, b in zip(from_units, to_units)]
+    scales, shifts = np.array(factors, dtype=values.dtype).T
+    out = np.multiply(values, scales, out=out)
+    if shifts.any():
+        np.add(out, shifts, out=out)
+    return out